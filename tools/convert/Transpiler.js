@@ -48,11 +48,14 @@ export class Transpiler {
         const parser = new Parser(tokens, sourcePath);
         const ast = parser.parse();
 
+        const converter = new converterInfo.ConverterClass();
+
         // After parsing, check for more imports to process
         ast.body.forEach(stmt => {
             if (stmt.type === 'ImportStatement') {
                 const modulePath = stmt.path;
-                if (!['fs', 'math', 'string', 'array', 'json', 'datetime', 'path', 'env', 'regex', 'http', 'object', 'assert'].includes(modulePath)) {
+                // The target's converter knows which stdlib modules its runtime provides.
+                if (!converter.isStdlibModule(modulePath)) {
                     let nextFilePath = path.resolve(path.dirname(filePath), modulePath);
                     if (!nextFilePath.endsWith('.mimo')) {
                         nextFilePath += '.mimo';
@@ -67,7 +70,6 @@ export class Transpiler {
             }
         });
 
-        const converter = new converterInfo.ConverterClass();
         const output = converter.convert(ast);
 
         const baseName = path.basename(filePath, '.mimo');
@@ -0,0 +1,30 @@
+"""
+Shared helpers for the Python runtime benchmarks.
+Makes `mimo_runtime` importable and provides small timing utilities.
+"""
+import os
+import sys
+import timeit
+
+RUNTIME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RUNTIME_DIR not in sys.path:
+    sys.path.insert(0, RUNTIME_DIR)
+
+
+def measure(fn, repeat: int = 5, number: int = 1) -> float:
+    """Return the best wall time in seconds for a single call of `fn`."""
+    return min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a unit suited to its magnitude."""
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:10.3f} ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:10.3f} us"
+    return f"{seconds * 1e9:10.1f} ns"
+
+
+def report(label: str, seconds: float, extra: str = '') -> None:
+    """Print one aligned result row."""
+    print(f"{label:<44} {format_time(seconds)}  {extra}")
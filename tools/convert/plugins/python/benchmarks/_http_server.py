@@ -0,0 +1,62 @@
+"""
+Local HTTP/1.1 keep-alive server used by the HTTP benchmarks.
+"""
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PAYLOAD = b'{"status": "ok", "items": [' + b", ".join(b'{"id": %d}' % i for i in range(50)) + b"]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Buffer each response into one write; separate header/body writes hit
+    # Nagle + delayed-ACK stalls on kept-alive connections.
+    wbufsize = 64 * 1024
+
+    def _reply(self, status, body, headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/slow"):
+            time.sleep(0.005)  # simulated backend latency
+            self._reply(200, PAYLOAD)
+        elif self.path.startswith("/gzip"):
+            self._reply(200, gzip.compress(PAYLOAD), [("Content-Encoding", "gzip")])
+        elif self.path.startswith("/redirect"):
+            self._reply(302, b"", [("Location", "/data")])
+        elif self.path.startswith("/missing"):
+            self._reply(404, b"not found")
+        elif self.path.startswith("/large"):
+            self._reply(200, PAYLOAD * 2000)
+        else:
+            self._reply(200, PAYLOAD)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self._reply(200, self.rfile.read(length))
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalServer:
+    """Run the handler on an ephemeral localhost port for the duration of a `with` block."""
+
+    def __enter__(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,39 @@
+"""
+Scaling benchmark for ArrayModule.unique/union/intersection/difference.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_array_sets.py
+The ns/item column should stay roughly flat as n grows (near-linear scaling).
+"""
+import random
+
+from _harness import measure, report
+from mimo_runtime import mimo
+
+SIZES = [1_000, 10_000, 100_000, 200_000]
+
+
+def numbers(n):
+    rng = random.Random(n)
+    return [rng.randrange(n // 2) for _ in range(n)]
+
+
+def rows(n):
+    rng = random.Random(n)
+    return [{"id": rng.randrange(n // 2), "tags": ["a", "b"]} for _ in range(n)]
+
+
+def main():
+    for kind, make in (("numbers", numbers), ("objects", rows)):
+        for n in SIZES:
+            a, b = make(n), make(n + 1)
+            for name in ("unique", "union", "intersection", "difference"):
+                fn = getattr(mimo.array, name)
+                if name == "unique":
+                    seconds = measure(lambda: fn(a), repeat=3)
+                else:
+                    seconds = measure(lambda: fn(a, b), repeat=3)
+                report(f"{name} [{kind}] n={n}", seconds, f"{seconds / n * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+datetime.format: the old chain of six str.replace passes vs. the compiled
+format program, for datetimes and epoch-millisecond timestamps, format_many
+over a log-sized batch, and parse.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_datetime_format.py
+"""
+import datetime
+import random
+
+from _harness import measure, report
+from mimo_runtime import mimo
+
+dt_mod = mimo.datetime
+
+FORMAT = "YYYY-MM-DD hh:mm:ss"
+
+
+def replace_format(dt, fmt):
+    """The previous implementation, kept as the baseline and the reference."""
+    result = fmt
+    result = result.replace('YYYY', str(dt.year))
+    result = result.replace('MM', f"{dt.month:02d}")
+    result = result.replace('DD', f"{dt.day:02d}")
+    result = result.replace('hh', f"{dt.hour:02d}")
+    result = result.replace('mm', f"{dt.minute:02d}")
+    result = result.replace('ss', f"{dt.second:02d}")
+    return result
+
+
+def check(dt):
+    pieces = ['YYYY', 'MM', 'DD', 'hh', 'mm', 'ss', 'M', 'm', 'Y', '%', '-', ' ', ':', '{}', '[at]']
+    rng = random.Random(7)
+    for _ in range(5000):
+        fmt = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 8)))
+        assert dt_mod.format(dt, fmt) == replace_format(dt, fmt), fmt
+    ts = dt_mod.get_timestamp(dt)
+    assert dt_mod.format(ts, FORMAT) == dt_mod.format(dt, FORMAT)
+    assert dt_mod.parse(dt_mod.format(dt, FORMAT), FORMAT) == dt.replace(microsecond=0)
+
+
+def main():
+    now = datetime.datetime(2024, 3, 7, 9, 5, 4)
+    check(now)
+    ts = dt_mod.get_timestamp(now)
+    number = 100_000
+
+    report("str.replace x6 (old)", measure(lambda: replace_format(now, FORMAT), number=number))
+    report("strftime", measure(lambda: now.strftime("%Y-%m-%d %H:%M:%S"), number=number))
+    report("datetime.format(datetime)", measure(lambda: dt_mod.format(now, FORMAT), number=number))
+    report("datetime.format(epoch ms)", measure(lambda: dt_mod.format(ts, FORMAT), number=number))
+
+    # A log batch: 10 000 timestamps a few milliseconds apart.
+    rng = random.Random(1)
+    stamps = [ts]
+    for _ in range(9_999):
+        stamps.append(stamps[-1] + rng.randint(0, 20))
+    dts = [dt_mod.from_timestamp(t) for t in stamps]
+    assert dt_mod.format_many(stamps, FORMAT) == [replace_format(d, FORMAT) for d in dts]
+    report("10k epoch ms: format in a loop", measure(lambda: [dt_mod.format(t, FORMAT) for t in stamps]))
+    report("10k epoch ms: format_many", measure(lambda: dt_mod.format_many(stamps, FORMAT)))
+    report("10k datetimes: str.replace x6 (old)", measure(lambda: [replace_format(d, FORMAT) for d in dts]))
+    report("10k datetimes: format_many", measure(lambda: dt_mod.format_many(dts, FORMAT)))
+
+    text = dt_mod.format(now, FORMAT)
+    report("datetime.strptime", measure(lambda: datetime.datetime.strptime(text, "%Y-%m-%d %H:%M:%S"), number=number // 10))
+    report("datetime.parse", measure(lambda: dt_mod.parse(text, FORMAT), number=number // 10))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Random access into a fixed-record data file: fs.read_file vs. fs.read_bytes
+vs. fs.mmap. Each variant looks up random records and counts a marker, in a
+fresh interpreter. Memory is the private (anonymous) RSS from
+/proc/self/status at the end of the run, while the data is still referenced;
+mapped file pages are shared page cache and are reported separately as
+file RSS. Linux only.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_fs_mmap.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+from _harness import RUNTIME_DIR
+
+RECORDS = 2_000_000
+RECORD_SIZE = 48
+LOOKUPS = 10_000
+
+PROGRAM = """
+import random, sys, time
+sys.path.insert(0, {runtime_dir!r})
+from mimo_runtime import mimo
+path, size, lookups = {path!r}, {size}, {lookups}
+random.seed(1)
+indices = [random.randrange({records}) for _ in range(lookups)]
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+status = dict(line.split(":", 1) for line in open("/proc/self/status"))
+print(elapsed, status["RssAnon"].split()[0], status["RssFile"].split()[0], found)
+"""
+
+VARIANTS = [
+    ("read_file + str slicing", """
+text = mimo.fs.read_file(path)
+found = sum(text[i * size:(i + 1) * size].startswith("SKU") for i in indices) + text.count("|LOW|")
+"""),
+    ("read_bytes + decode slices", """
+data = mimo.fs.read_bytes(path)
+found = sum(data[i * size:(i + 1) * size].decode().startswith("SKU") for i in indices) + data.count(b"|LOW|")
+"""),
+    ("mmap record() + count()", """
+mapped = mimo.fs.mmap(path)
+found = sum(mapped.record(i, size).startswith("SKU") for i in indices) + mapped.count("|LOW|")
+"""),
+    ("mmap record() only", """
+mapped = mimo.fs.mmap(path)
+found = sum(mapped.record(i, size).startswith("SKU") for i in indices)
+"""),
+    ("baseline: import only", "found = 0"),
+]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "inventory.dat")
+        with open(path, "w", encoding="ascii") as f:
+            for i in range(RECORDS):
+                status = "LOW" if i % 97 == 0 else "OK "
+                f.write(f"SKU{i:09d}|{status}|qty={i % 1000:05d}|loc=A{i % 50:02d}".ljust(RECORD_SIZE - 1) + "\n")
+        print(f"input: {RECORDS:,} records of {RECORD_SIZE} bytes, {os.path.getsize(path) / 2**20:.1f} MiB")
+        for label, body in VARIANTS:
+            code = PROGRAM.format(runtime_dir=RUNTIME_DIR, path=path, size=RECORD_SIZE,
+                                  lookups=LOOKUPS, records=RECORDS, body=body)
+            out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+            elapsed, anon, file_rss, found = out.stdout.split()
+            print(f"{label:<44} {float(elapsed) * 1e3:10.3f} ms  anon RSS {int(anon) / 1024:7.1f} MiB"
+                  f"  file RSS {int(file_rss) / 1024:7.1f} MiB  ({found})")
+
+
+if __name__ == "__main__":
+    main()
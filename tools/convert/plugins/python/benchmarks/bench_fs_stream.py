@@ -0,0 +1,75 @@
+"""
+Streaming FSModule I/O: peak traced memory and time of counting matching
+lines with fs.read_file vs. fs.read_lines / fs.read_chunks, and of writing
+line by line with fs.open_writer vs. fs.append_file vs. one write_file.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_fs_stream.py
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+
+from _harness import format_time
+from mimo_runtime import mimo
+
+LINES = 1_000_000
+fs = mimo.fs
+
+
+def profile(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, "app.log")
+        with open(log, "w", encoding="utf-8") as f:
+            for i in range(LINES):
+                f.write(f"2024-01-01T00:00:{i % 60:02d} {'ERROR' if i % 7 == 0 else 'INFO'} request {i} served\n")
+        print(f"input: {LINES:,} lines, {os.path.getsize(log) / 2**20:.1f} MiB")
+
+        readers = (
+            ("read_file + split", lambda: sum("ERROR" in line for line in fs.read_file(log).split("\n"))),
+            ("read_lines", lambda: sum("ERROR" in line for line in fs.read_lines(log))),
+            ("read_chunks(64 KiB) byte count", lambda: sum(len(c) for c in fs.read_chunks(log))),
+        )
+        results = []
+        for label, fn in readers:
+            result, elapsed, peak = profile(fn)
+            results.append(result)
+            print(f"{label:<44} {format_time(elapsed)}  peak {peak / 1024:10.1f} KiB")
+        assert results[0] == results[1]
+
+        out = os.path.join(tmp, "out.txt")
+        rows = [f"row {i}" for i in range(100_000)]
+
+        def with_writer():
+            writer = fs.open_writer(out)
+            for row in rows:
+                writer.write_line(row)
+            writer.close()
+
+        def with_append():
+            fs.write_file(out, "")
+            for row in rows[:10_000]:
+                fs.append_file(out, row + "\n")
+
+        writers = (
+            ("open_writer, 100k write_line", with_writer),
+            ("append_file, 10k calls", with_append),
+            ("write_file of joined string", lambda: fs.write_file(out, "\n".join(rows) + "\n")),
+        )
+        for label, fn in writers:
+            _, elapsed, peak = profile(fn)
+            print(f"{label:<44} {format_time(elapsed)}  peak {peak / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Per-group reporting over an inventory-shaped dataset: group_by followed by a
+reduce per group (the pattern the inventory example uses) vs. count_by and the
+single-pass aggregate_by (time and peak traced memory), with a check that both
+produce the same report.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_group_by.py
+"""
+import random
+import tracemalloc
+
+from _harness import measure, report
+from mimo_runtime import mimo
+
+arr = mimo.array
+N = 200_000
+CATEGORIES = ["electronics", "garden", "toys", "books", "kitchen", "sports"]
+
+rng = random.Random(7)
+ITEMS = [{"id": i, "category": rng.choice(CATEGORIES),
+          "quantity": rng.randint(0, 50), "price": round(rng.uniform(1, 500), 2)}
+         for i in range(N)]
+
+
+def category(item):
+    return item["category"]
+
+
+def report_two_pass():
+    out = {}
+    for key, group in arr.group_by(ITEMS, category).items():
+        out[key] = {
+            "quantity": arr.reduce(group, lambda a, b: a + b["quantity"], 0),
+            "price": arr.reduce(group, lambda a, b: max(a, b["price"]), group[0]["price"]),
+            "id": arr.reduce(group, lambda a, b: a + 1, 0),
+        }
+    return out
+
+
+def report_single_pass():
+    return arr.aggregate_by(ITEMS, category, {"quantity": "sum", "price": "max", "id": "count"})
+
+
+def count_two_pass():
+    return {key: len(group) for key, group in arr.group_by(ITEMS, category).items()}
+
+
+def count_by():
+    return arr.count_by(ITEMS, category)
+
+
+def peak_kib(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return f"peak {peak / 1024:8.1f} KiB"
+
+
+def check_key_collisions():
+    """Different key values are different groups, even when they print alike."""
+    same = lambda x: x
+    assert arr.group_by([1, "1", 1], same) == {1: [1, 1], "1": ["1"]}
+    flags = arr.group_by([True, "true", 1], same)
+    assert len(flags) == 3 and flags["true"] == ["true"] and flags[1] == [1]
+    pairs = arr.group_by([[1, 2], "[1, 2]", [1, 2]], same)
+    assert sorted(map(len, pairs.values())) == [1, 2] and pairs["[1, 2]"] == ["[1, 2]"]
+    keys = [True, "true", [1, 2], "[1, 2]", [1, 2]]
+    assert sorted(arr.count_by(keys, same).values()) == [1, 1, 1, 2]
+    assert len(arr.index_by(keys, same)) == 4
+    assert len(arr.aggregate_by([{"k": k} for k in keys], lambda row: row["k"], {"k": "count"})) == 4
+
+
+def main():
+    assert report_two_pass() == report_single_pass()
+    assert count_two_pass() == count_by()
+    check_key_collisions()
+    low, high = arr.partition(ITEMS, lambda item: item["quantity"] < 10)
+    assert len(low) + len(high) == N
+
+    print(f"{N} items, {len(CATEGORIES)} categories")
+    report("group_by + reduce per group", measure(report_two_pass, repeat=3),
+           peak_kib(report_two_pass))
+    report("aggregate_by (sum, max, count)", measure(report_single_pass, repeat=3),
+           peak_kib(report_single_pass))
+    report("group_by + len", measure(count_two_pass, repeat=3))
+    report("count_by", measure(count_by, repeat=3))
+    report("index_by", measure(lambda: arr.index_by(ITEMS, lambda item: item["id"]), repeat=3))
+    report("partition", measure(lambda: arr.partition(ITEMS, lambda item: item["quantity"] < 10),
+                                repeat=3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+HTTPModule benchmark against a local keep-alive server: pooled http.client
+connections vs. a fresh urllib.request.urlopen per call (the previous
+implementation).
+
+Run: python tools/convert/plugins/python/benchmarks/bench_http.py
+"""
+import urllib.request
+
+from _harness import measure, report
+from _http_server import LocalServer
+from mimo_runtime import mimo
+
+REQUESTS = 1000
+
+
+def legacy_get(url):
+    with urllib.request.urlopen(url) as response:
+        return response.read().decode("utf-8")
+
+
+def main():
+    with LocalServer() as server:
+        url = f"{server.url}/data"
+        assert mimo.http.get(url) == legacy_get(url)
+        assert mimo.http.get(f"{server.url}/gzip") == legacy_get(url)
+
+        def run(get, target):
+            for _ in range(REQUESTS):
+                get(target)
+
+        old = measure(lambda: run(legacy_get, url), repeat=3)
+        new = measure(lambda: run(mimo.http.get, url), repeat=3)
+        report("GET, fresh urlopen per request (legacy)", old / REQUESTS)
+        report("GET, pooled keep-alive connection", new / REQUESTS, f"speedup x{old / new:.2f}")
+        report("GET gzip body, pooled", measure(lambda: run(mimo.http.get, f"{server.url}/gzip"), repeat=3) / REQUESTS)
+        report("POST, pooled",
+               measure(lambda: [mimo.http.post(f"{server.url}/echo", '{"a": 1}') for _ in range(REQUESTS)],
+                       repeat=3) / REQUESTS)
+        chunks = mimo.http.stream(f"{server.url}/large", 16 * 1024)
+        size = sum(len(chunk) for chunk in chunks)
+        print(f"stream /large: {size:,} characters received in 16 KiB chunks")
+
+
+if __name__ == "__main__":
+    main()
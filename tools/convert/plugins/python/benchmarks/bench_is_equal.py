@@ -0,0 +1,81 @@
+"""
+is_equal benchmark: current engine vs. the previous recursive implementation.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_is_equal.py
+"""
+from _harness import measure, report
+from mimo_runtime import is_equal
+
+
+def legacy_is_equal(a, b):
+    """The recursive implementation is_equal replaced, kept for comparison."""
+    if a is b:
+        return True
+    if type(a) != type(b):
+        return False
+    if isinstance(a, (list, tuple)):
+        if len(a) != len(b):
+            return False
+        return all(legacy_is_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict):
+        if set(a.keys()) != set(b.keys()):
+            return False
+        return all(legacy_is_equal(a[k], b[k]) for k in a.keys())
+    return a == b
+
+
+def payload(n):
+    return [
+        {
+            "id": i,
+            "name": f"item-{i}",
+            "price": i * 1.5,
+            "active": i % 2 == 0,
+            "tags": ["x", "y", str(i % 7)],
+            "meta": {"owner": {"id": i % 13, "roles": ["a", "b"]}, "note": None},
+        }
+        for i in range(n)
+    ]
+
+
+def nested(depth):
+    value = [0]
+    for _ in range(depth):
+        value = {"child": value, "n": depth}
+    return value
+
+
+def main():
+    a, b = payload(20_000), payload(20_000)
+    c, d = payload(20_000), payload(20_000)
+    c[-1]["meta"]["owner"]["roles"][-1] = "z"
+    d[0]["meta"]["owner"]["roles"][-1] = "z"
+    cases = [
+        ("int == int", lambda f: f(12345, 12345), 100_000),
+        ("str != str", lambda f: f("alpha", "beta"), 100_000),
+        ("20k records, equal", lambda f: f(a, b), 1),
+        ("20k records, first leaf differs", lambda f: f(a, d), 1),
+        ("20k records, last leaf differs", lambda f: f(a, c), 1),
+        ("depth 200, equal", lambda f: f(nested(200), nested(200)), 100),
+    ]
+    for label, case, number in cases:
+        new = measure(lambda: case(is_equal), number=number)
+        old = measure(lambda: case(legacy_is_equal), number=number)
+        report(f"{label} (new)", new)
+        report(f"{label} (legacy)", old, f"speedup x{old / new:.2f}")
+
+    deep_a, deep_b = nested(50_000), nested(50_000)
+    report("depth 50k, equal (new)", measure(lambda: is_equal(deep_a, deep_b), repeat=3))
+    try:
+        legacy_is_equal(deep_a, deep_b)
+    except RecursionError:
+        print("depth 50k, equal (legacy)                    RecursionError")
+
+    cyclic_a, cyclic_b = [1, 2], [1, 2]
+    cyclic_a.append(cyclic_a)
+    cyclic_b.append(cyclic_b)
+    report("self-referencing lists (new)", measure(lambda: is_equal(cyclic_a, cyclic_b), number=1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+JSON backends on representative payloads: json.dumps/json.loads called per
+use (the previous JSONModule) vs. the reused-instance stdlib backend vs.
+orjson (when installed), for json.stringify and json.parse.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_json.py
+"""
+import datetime
+import json
+
+from _harness import measure, report
+from mimo_runtime import _json_default, _make_json_backend, mimo
+
+PAYLOADS = {
+    "small record": {"id": 7, "name": "Widget", "price": 9.99, "tags": ["a", "b"], "active": True},
+    "10k records": [{"id": i, "sku": f"SKU{i:09d}", "qty": i % 100, "price": i / 7,
+                     "tags": ["red", "small"], "meta": {"warehouse": f"W{i % 5}", "ok": i % 3 == 0}}
+                    for i in range(10_000)],
+    "nested config": {f"section{i}": {f"key{j}": [j, str(j), {"on": j % 2 == 0}] for j in range(20)}
+                      for i in range(50)},
+    "text-heavy": [{"title": f"Entry {i}", "body": "lorem ipsum dolor sit amet, ünïcödé " * 40}
+                   for i in range(500)],
+    "runtime values": [{"when": datetime.datetime(2024, 1, 1, 12, i % 60), "range": mimo.range(0, 8)}
+                       for i in range(5_000)],
+}
+
+
+def legacy_dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, default=_json_default)
+
+
+# Floats the backends could spell differently, as values and as keys.
+FLOATS = [float("nan"), float("inf"), -float("inf"), 1e16, -1.5e300, 1e-05, 2.5e-05, 1.234e-07,
+          5e-324, 0.0001, 1e15, 0.1, -0.0]
+
+
+def check_backends_agree(backends):
+    """json.stringify gives the same bytes whichever backend encodes."""
+    payloads = [FLOATS, {"floats": FLOATS, "id": "1e5", "n": None},
+                {value: i for i, value in enumerate(FLOATS)}, {float("nan"): 1, float("inf"): 2, "x": 3},
+                mimo.typed_array("float64", FLOATS)] + list(PAYLOADS.values())
+    for payload in payloads:
+        for indent in (None, 2, 4):
+            texts = {backend.name: backend.dumps(payload, indent) for backend in backends}
+            assert len(set(texts.values())) == 1, texts
+    assert backends[0].dumps([float("nan"), 1e16, 1e-05]) == "[null,1e+16,1e-05]"
+
+
+def main():
+    backends = [_make_json_backend("stdlib")]
+    try:
+        backends.append(_make_json_backend("orjson"))
+    except Exception:
+        print("orjson is not installed; skipping it")
+    check_backends_agree(backends)
+    for label, payload in PAYLOADS.items():
+        text = backends[0].dumps(payload)
+        number = max(1, 200_000 // len(text))
+        legacy_encode = measure(lambda: legacy_dumps(payload), number=number)
+        report(f"{label}: stringify, json.dumps per call", legacy_encode)
+        for backend in backends:
+            encode = measure(lambda: backend.dumps(payload), number=number)
+            report(f"{label}: stringify, {backend.name}", encode, f"x{legacy_encode / encode:.2f}")
+        if label == "runtime values":
+            continue
+        legacy_decode = measure(lambda: json.loads(text), number=number)
+        report(f"{label}: parse, json.loads per call", legacy_decode)
+        for backend in backends:
+            assert backend.loads(text) == payload
+            decode = measure(lambda: backend.loads(text), number=number)
+            report(f"{label}: parse, {backend.name}", decode, f"x{legacy_decode / decode:.2f}")
+
+
+if __name__ == "__main__":
+    main()
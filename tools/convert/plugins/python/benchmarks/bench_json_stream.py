@@ -0,0 +1,88 @@
+"""
+Streaming JSONModule: time and peak traced memory (measured in separate
+runs) of json.parse_lines and
+json.iter_array vs. json.parse over the whole file, and of json.write_lines
+vs. stringify + write_file.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_json_stream.py
+"""
+import json as stdlib_json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from _harness import format_time
+from mimo_runtime import mimo, _iter_json_array
+
+RECORDS = 200_000
+fs = mimo.fs
+json = mimo.json
+
+
+def profile(fn):
+    """Time one untraced run, then measure peak memory in a second, traced run."""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def total_qty(records):
+    total = 0
+    for record in records:
+        total += record["qty"]
+    return total
+
+
+def check_chunk_boundaries():
+    """Numbers cut by a chunk boundary (chunks of 1, 2, 3 and 7 chars) still decode."""
+    doc = '[-4.5e3, 1.5, 1e5, 22, -0, 3.25E-2, true, "a,b", {"n": -0.5e+2}, [1e2, 7], null, 1000000]'
+    expected = stdlib_json.loads(doc)
+    for size in (1, 2, 3, 7):
+        chunks = [doc[i:i + size] for i in range(0, len(doc), size)]
+        assert list(_iter_json_array(chunks)) == expected, size
+    assert list(_iter_json_array(['[1.', '5]'])) == [1.5]
+    assert list(_iter_json_array(['[1e', '5]'])) == [1e5]
+
+
+def main():
+    check_chunk_boundaries()
+    def records():
+        return ({"id": i, "sku": f"SKU{i:09d}", "qty": i % 100, "tags": ["a", "b"], "price": i / 7}
+                for i in range(RECORDS))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ndjson = os.path.join(tmp, "export.jsonl")
+        array = os.path.join(tmp, "export.json")
+
+        _, elapsed, peak = profile(lambda: json.write_lines(ndjson, records()))
+        print(f"{'write_lines (from a generator)':<44} {format_time(elapsed)}  peak {peak / 1024:10.1f} KiB")
+        rows = json.parse_lines(ndjson).to_list()
+        _, elapsed, peak = profile(lambda: json.write_lines(ndjson, rows))
+        print(f"{'write_lines (from a list)':<44} {format_time(elapsed)}  peak {peak / 1024:10.1f} KiB")
+        _, elapsed, peak = profile(lambda: fs.write_file(array, json.stringify(rows)))
+        print(f"{'stringify + write_file (from a list)':<44} {format_time(elapsed)}  peak {peak / 1024:10.1f} KiB")
+        del rows
+
+        readers = (
+            ("parse(read_file) of the array", lambda: total_qty(json.parse(fs.read_file(array)))),
+            ("iter_array", lambda: total_qty(json.iter_array(array))),
+            ("read_file + parse per line", lambda: total_qty(
+                json.parse(line) for line in fs.read_file(ndjson).splitlines())),
+            ("parse_lines", lambda: total_qty(json.parse_lines(ndjson))),
+        )
+        results = set()
+        for label, fn in readers:
+            result, elapsed, peak = profile(fn)
+            results.add(result)
+            print(f"{label:<44} {format_time(elapsed)}  peak {peak / 1024:10.1f} KiB")
+        assert len(results) == 1
+
+
+if __name__ == "__main__":
+    main()
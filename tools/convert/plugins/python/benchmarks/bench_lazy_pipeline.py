@@ -0,0 +1,57 @@
+"""
+Eager vs. lazy ArrayModule pipelines: wall time and peak traced memory.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_lazy_pipeline.py
+"""
+import time
+import tracemalloc
+
+from _harness import format_time
+from mimo_runtime import mimo
+
+N = 1_000_000
+array = mimo.array
+
+
+def eager():
+    data = array.map(range(N), lambda x: x * 3)
+    data = array.filter(data, lambda x: x % 2 == 0)
+    data = array.map(data, lambda x: x + 1)
+    return array.reduce(data, lambda a, b: a + b, 0)
+
+
+def lazy():
+    data = array.map(array.lazy(range(N)), lambda x: x * 3)
+    data = array.filter(data, lambda x: x % 2 == 0)
+    data = array.map(data, lambda x: x + 1)
+    return array.reduce(data, lambda a, b: a + b, 0)
+
+
+def lazy_first():
+    data = array.map(array.lazy(range(N)), lambda x: x * 3)
+    return array.find(data, lambda x: x > 300)
+
+
+def profile(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    results = {}
+    for label, fn in (("eager map/filter/map/reduce", eager),
+                      ("lazy map/filter/map/reduce", lazy),
+                      ("lazy map + find (short-circuit)", lazy_first)):
+        result, elapsed, peak = profile(fn)
+        results[label] = result
+        print(f"{label:<44} {format_time(elapsed)}  peak {peak / 1024:10.1f} KiB")
+    assert results["eager map/filter/map/reduce"] == results["lazy map/filter/map/reduce"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+cache.memoize: naive vs. memoized recursive fib, hit cost vs. a plain call and
+functools.lru_cache, and lookups keyed by structurally equal arrays/objects.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_memoize.py
+"""
+import functools
+
+from _harness import measure, report
+from mimo_runtime import mimo
+
+cache = mimo.cache
+
+
+def fib(n):
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+
+def naive_fib(n):
+    if n < 2:
+        return n
+    return naive_fib(n - 1) + naive_fib(n - 2)
+
+
+def square(x):
+    return x * x
+
+
+def route_cost(route):
+    return sum(step["cost"] for step in route)
+
+
+ROUTE = [{"from": i, "to": i + 1, "cost": i % 7} for i in range(20)]
+
+
+def main():
+    global fib
+    fib = cache.memoize(fib)
+    assert fib(25) == naive_fib(25)
+
+    def memo_fib():
+        cache.clear(fib)
+        return fib(25)
+
+    report("naive fib(25)", measure(lambda: naive_fib(25), repeat=3))
+    report("memoized fib(25), cold cache", measure(memo_fib))
+    print(cache.stats(fib))
+
+    memo_square = cache.memoize(square)
+    lru_square = functools.lru_cache(maxsize=1024)(square)
+    memo_square(12)
+    lru_square(12)
+    number = 100_000
+    report("plain call", measure(lambda: square(12), number=number))
+    report("cache.memoize hit", measure(lambda: memo_square(12), number=number))
+    report("functools.lru_cache hit", measure(lambda: lru_square(12), number=number))
+
+    memo_route = cache.memoize(route_cost, 128, 60)
+    copy = [dict(step) for step in ROUTE]
+    assert memo_route(ROUTE) == memo_route(copy) == route_cost(ROUTE)
+    report("route_cost (20 steps)", measure(lambda: route_cost(copy), number=10_000))
+    report("memoized route_cost, equal copy (ttl)", measure(lambda: memo_route(copy), number=10_000))
+    print(cache.stats(memo_route))
+
+
+if __name__ == "__main__":
+    main()
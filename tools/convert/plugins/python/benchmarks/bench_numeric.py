@@ -0,0 +1,139 @@
+"""
+Numeric ArrayModule operations (sum, mean, min, max, cumsum, dot, add, mul):
+a differential check against straightforward pure-Python definitions, with
+NumPy on and off, then timings against reduce()-with-a-callback and
+hand-written loops.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_numeric.py
+"""
+import array as pyarray
+import itertools
+import math
+import random
+
+from _harness import measure, report
+import mimo_runtime
+from mimo_runtime import mimo
+
+arr = mimo.array
+N = 200_000
+
+
+def reference(op, a, b=None):
+    """The semantics the runtime must reproduce, written out longhand."""
+    a = list(a)
+    if op in ("sum", "mean"):
+        total = sum(a) if all(type(x) is int for x in a) else math.fsum(a)
+        if op == "sum":
+            return total
+        return total / len(a) if a else None
+    if op in ("min", "max"):
+        return (min if op == "min" else max)(a) if a else None
+    if op == "cumsum":
+        out, total = [], 0
+        for i, x in enumerate(a):
+            total = x if i == 0 else total + x
+            out.append(total)
+        return out
+    if op == "dot":
+        products = [x * y for x, y in zip(a, b)]
+        return sum(products) if all(type(p) is int for p in products) else math.fsum(products)
+    if isinstance(b, (int, float)):
+        b = [b] * len(a)
+    b = list(b)
+    return [x + y if op == "add" else x * y for x, y in zip(a, b)]
+
+
+def same(x, y):
+    if isinstance(x, list):
+        return len(x) == len(y) and all(same(p, q) for p, q in zip(x, y))
+    if isinstance(x, float) and math.isnan(x):
+        return isinstance(y, float) and math.isnan(y)
+    return type(x) is type(y) and x == y
+
+
+def inputs(rng):
+    size = rng.choice([0, 1, 2, 17, 1000])
+    kinds = {
+        "ints": lambda: rng.randrange(-10**6, 10**6),
+        "big ints": lambda: rng.randrange(-2**70, 2**70),
+        "floats": lambda: rng.uniform(-1e6, 1e6),
+        "tiny+huge floats": lambda: rng.choice([1e-16, 1e16, -1e16, 0.1]),
+        "mixed": lambda: rng.choice([rng.randrange(100), rng.random()]),
+    }
+    kind = rng.choice(list(kinds))
+    make = kinds[kind]
+    a, b = [make() for _ in range(size)], [make() for _ in range(size)]
+    yield kind, a, b
+    if kind in ("ints", "floats"):
+        code = "q" if kind == "ints" else "d"
+        yield f"array('{code}') {kind}", pyarray.array(code, a), pyarray.array(code, b)
+        # Every typed array kind, over its full range, so narrow kinds would
+        # overflow or lose precision if computed in their own dtype.
+        for kind_name, code in mimo_runtime.TYPED_ARRAY_KINDS.items():
+            if code in "fd":
+                make = lambda: rng.uniform(-1e6, 1e6)
+            else:
+                bits = pyarray.array(code).itemsize * 8
+                low, high = (0, 2 ** bits) if code.isupper() else (-2 ** (bits - 1), 2 ** (bits - 1))
+                make = lambda: rng.randrange(low, high)
+            yield (f"typed_array {kind_name}",
+                   mimo.typed_array(kind_name, [make() for _ in range(size)]),
+                   mimo.typed_array(kind_name, [make() for _ in range(size)]))
+
+
+def differential_check():
+    rng = random.Random(11)
+    checked = 0
+    for threshold in (0, 1):  # NumPy off, then on for any buffer-backed input
+        mimo_runtime._numpy_threshold = threshold
+        for _ in range(400):
+            for kind, a, b in inputs(rng):
+                for op in ("sum", "mean", "min", "max", "cumsum", "dot", "add", "mul"):
+                    args = (a, b) if op in ("dot", "add", "mul") else (a,)
+                    expected = reference(op, *args)
+                    actual = getattr(arr, op)(*args)
+                    assert same(actual, expected), (op, kind, threshold, expected, actual)
+                    checked += 1
+                if a:
+                    scalar = b[0]
+                    for op in ("add", "mul"):
+                        assert same(getattr(arr, op)(a, scalar), reference(op, a, scalar)), (op, kind, "scalar")
+    mimo_runtime._numpy_threshold = mimo_runtime._numpy_min_size()
+    print(f"differential check: {checked} cases match the reference semantics")
+
+
+def main():
+    differential_check()
+    rng = random.Random(3)
+    floats = [rng.uniform(0, 100) for _ in range(N)]
+    ints = [rng.randrange(1000) for _ in range(N)]
+    typed = pyarray.array("d", floats)
+    other = [rng.uniform(0, 100) for _ in range(N)]
+    typed_other = pyarray.array("d", other)
+    rows = [
+        ("sum floats: reduce(a + b)", lambda: arr.reduce(floats, lambda a, b: a + b, 0)),
+        ("sum floats: array.sum", lambda: arr.sum(floats)),
+        ("sum ints: reduce(a + b)", lambda: arr.reduce(ints, lambda a, b: a + b, 0)),
+        ("sum ints: array.sum", lambda: arr.sum(ints)),
+        ("max: reduce(max)", lambda: arr.reduce(floats, lambda a, b: a if a > b else b)),
+        ("max: array.max", lambda: arr.max(floats)),
+        ("cumsum: python loop", lambda: list(itertools.accumulate(floats, lambda a, b: a + b))),
+        ("cumsum: array.cumsum", lambda: arr.cumsum(floats)),
+        ("cumsum: array.cumsum on array('d')", lambda: arr.cumsum(typed)),
+        ("dot: map + reduce", lambda: arr.reduce(arr.map(list(range(N)), lambda i: floats[i] * other[i]),
+                                                 lambda a, b: a + b, 0)),
+        ("dot: array.dot", lambda: arr.dot(floats, other)),
+        ("dot: array.dot on array('d')", lambda: arr.dot(typed, typed_other)),
+        ("add: map over indices", lambda: arr.map(list(range(N)), lambda i: floats[i] + other[i])),
+        ("add: array.add", lambda: arr.add(floats, other)),
+        ("add: array.add on array('d')", lambda: arr.add(typed, typed_other)),
+        ("mul by scalar: array.map", lambda: arr.map(floats, lambda x: x * 2.5)),
+        ("mul by scalar: array.mul", lambda: arr.mul(floats, 2.5)),
+    ]
+    for label, fn in rows:
+        report(f"{label}", measure(fn, repeat=3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Operator helpers: the module-level add/get/eq that generated code imports
+directly vs. the previous `mimo.add`-style bound methods vs. plain Python
+operators, per call and in a converted-style numeric loop.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_operators.py
+"""
+from _harness import measure, report
+from mimo_runtime import add, eq, get, is_equal, mimo, stringify
+
+N = 200_000
+
+
+class LegacyRuntime:
+    """The method-based helpers as they were before the free functions."""
+
+    def add(self, a, b):
+        if isinstance(a, str) or isinstance(b, str):
+            return stringify(a) + stringify(b)
+        return a + b
+
+    def get(self, collection, key):
+        if collection is None:
+            return None
+        try:
+            if isinstance(collection, (list, tuple)):
+                return collection[key] if 0 <= key < len(collection) else None
+            elif isinstance(collection, dict):
+                return collection.get(key)
+            else:
+                return getattr(collection, key, None)
+        except (KeyError, IndexError, TypeError):
+            return None
+
+    def eq(self, a, b):
+        return is_equal(a, b)
+
+
+legacy = LegacyRuntime()
+record = {"qty": 3, "price": 2.5}
+row = [1, 2, 3]
+CASES = [
+    ("add int+int", "legacy.add(i, 1)", "mimo.add(i, 1)", "__mimo_add(i, 1)", "i + 1"),
+    ("add float+int", "legacy.add(2.5, i)", "mimo.add(2.5, i)", "__mimo_add(2.5, i)", "2.5 + i"),
+    ("add str+str", "legacy.add('a', 'b')", "mimo.add('a', 'b')", "__mimo_add('a', 'b')", "'a' + 'b'"),
+    ("add str+int", "legacy.add('n=', i)", "mimo.add('n=', i)", "__mimo_add('n=', i)", "'n=' + str(i)"),
+    ("get dict field", "legacy.get(record, 'qty')", "mimo.get(record, 'qty')", "__mimo_get(record, 'qty')",
+     "record.get('qty')"),
+    ("get list index", "legacy.get(row, 1)", "mimo.get(row, 1)", "__mimo_get(row, 1)", "row[1]"),
+    ("eq int", "legacy.eq(i, 5)", "mimo.eq(i, 5)", "__mimo_eq(i, 5)", "i == 5"),
+]
+
+
+def loop(expr):
+    """Compile `for i in range(N): expr` as generated code would run it."""
+    namespace = {"legacy": legacy, "mimo": mimo, "record": record, "row": row, "N": N,
+                 "__mimo_add": add, "__mimo_get": get, "__mimo_eq": eq}
+    exec(f"def run():\n    for i in range(N):\n        {expr}\n", namespace)
+    return namespace["run"]
+
+
+def numeric_loop(style):
+    """sum of qty * price over records, as converted code spells it."""
+    plus, field = {"legacy": ("legacy.add", "legacy.get"), "method": ("mimo.add", "mimo.get"),
+                   "free": ("__mimo_add", "__mimo_get")}[style]
+    return loop(f"total = {plus}(total if i else 0, {field}(record, 'qty') * {field}(record, 'price'))")
+
+
+def main():
+    for label, *exprs in CASES:
+        base = None
+        for variant, expr in zip(("legacy method", "mimo.<method>", "free function", "plain Python"), exprs):
+            seconds = measure(loop(expr), repeat=5) / N
+            base = base or seconds
+            report(f"{label}: {variant}", seconds, f"x{base / seconds:.2f}")
+    base = None
+    for style in ("legacy", "method", "free"):
+        seconds = measure(numeric_loop(style), repeat=5)
+        base = base or seconds
+        report(f"numeric loop ({N:,} iters): {style}", seconds, f"x{base / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+array.par_map / par_filter scaling across worker counts: a CPU-bound
+callback in process mode and an I/O-bound (sleeping) callback in thread
+mode, against array.map / array.filter. Process-mode speedup is bounded by
+the machine's core count (printed first).
+
+Run: python tools/convert/plugins/python/benchmarks/bench_parallel.py
+"""
+import os
+import time
+
+from _harness import measure, report
+from mimo_runtime import mimo
+
+arr = mimo.array
+CPU_ITEMS = 400
+IO_ITEMS = 200
+
+
+def collatz_steps(n):
+    """CPU-bound: total Collatz steps for every start value up to n."""
+    total = 0
+    for start in range(1, n):
+        x = start
+        while x != 1:
+            x = x // 2 if x % 2 == 0 else 3 * x + 1
+            total += 1
+    return total
+
+
+def cpu_task(i):
+    return collatz_steps(300 + i % 50)
+
+
+def cpu_keep(i):
+    return cpu_task(i) % 3 == 0
+
+
+def io_task(i):
+    time.sleep(0.002)
+    return i * 2
+
+
+def main():
+    print(f"cores: {os.cpu_count()}")
+    items = list(range(CPU_ITEMS))
+    expected = arr.map(items, cpu_task)
+    serial = measure(lambda: arr.map(items, cpu_task), repeat=3)
+    report(f"CPU map x{CPU_ITEMS}: array.map", serial)
+    for workers in (1, 2, 4, 8, 16):
+        assert arr.par_map(items, cpu_task, workers) == expected
+        seconds = measure(lambda: arr.par_map(items, cpu_task, workers), repeat=3)
+        report(f"CPU map x{CPU_ITEMS}: par_map workers={workers}", seconds, f"x{serial / seconds:.2f}")
+    serial = measure(lambda: arr.filter(items, cpu_keep), repeat=3)
+    report(f"CPU filter x{CPU_ITEMS}: array.filter", serial)
+    for workers in (4, 16):
+        assert arr.par_filter(items, cpu_keep, workers) == arr.filter(items, cpu_keep)
+        seconds = measure(lambda: arr.par_filter(items, cpu_keep, workers), repeat=3)
+        report(f"CPU filter x{CPU_ITEMS}: par_filter workers={workers}", seconds, f"x{serial / seconds:.2f}")
+
+    items = list(range(IO_ITEMS))
+    serial = measure(lambda: arr.map(items, io_task), repeat=2)
+    report(f"I/O map x{IO_ITEMS}: array.map", serial)
+    for workers in (4, 16, 64):
+        seconds = measure(lambda: arr.par_map(items, io_task, workers, mode="thread"), repeat=2)
+        report(f"I/O map x{IO_ITEMS}: par_map thread workers={workers}", seconds, f"x{serial / seconds:.2f}")
+    for chunk_size in (1, 16):
+        seconds = measure(lambda: arr.par_map(items, io_task, 64, chunk_size, mode="thread"), repeat=2)
+        report(f"I/O map x{IO_ITEMS}: 64 threads chunk_size={chunk_size}", seconds, f"x{serial / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Per-update cost of persistent collections against copy-on-update of plain
+lists and dicts, across sizes: copying grows with n, while a persistent
+assoc/push only copies a path of ~log32(n) small nodes. Also times reads,
+and a state object merged in a loop (the O(n^2) pattern with object.merge).
+
+Run: python tools/convert/plugins/python/benchmarks/bench_persistent.py
+"""
+from _harness import measure, report
+from mimo_runtime import mimo
+
+arr = mimo.array
+obj = mimo.object
+persistent = mimo.persistent
+SIZES = (100, 1_000, 10_000, 100_000)
+UPDATES = 1_000
+
+
+def main():
+    for n in SIZES:
+        items = list(range(n))
+        state = {f"k{i}": i for i in range(n)}
+        vector = persistent.vector(items)
+        pmap = persistent.map(state)
+        assert vector == items and pmap == state
+        per = f"n={n}"
+
+        def list_copy():
+            for i in range(UPDATES):
+                copy = list(items)
+                copy[i % n] = -1
+
+        def vector_assoc():
+            for i in range(UPDATES):
+                persistent.assoc(vector, i % n, -1)
+
+        def dict_merge():
+            for i in range(UPDATES):
+                obj.merge(state, {"k0": i})
+
+        def map_merge():
+            for i in range(UPDATES):
+                obj.merge(pmap, {"k0": i})
+
+        def vector_push():
+            for i in range(UPDATES):
+                persistent.push(vector, i)
+
+        def list_concat():
+            for i in range(UPDATES):
+                arr.concat(items, [i])
+
+        repeat = 3 if n < 100_000 else 1
+        print(per)
+        for label, fn in (("  list copy + set", list_copy), ("  persistent.assoc (vector)", vector_assoc),
+                          ("  array.concat(list, [x])", list_concat), ("  persistent.push", vector_push),
+                          ("  object.merge(dict, ...)", dict_merge), ("  object.merge(map, ...)", map_merge)):
+            report(label, measure(fn, repeat=repeat) / UPDATES, "per update")
+        indices = range(0, n, max(1, n // UPDATES))
+        keys = [f"k{i}" for i in indices]
+        for label, fn in (("  get (list)", lambda: [mimo.get(items, i) for i in indices]),
+                          ("  get (vector)", lambda: [mimo.get(vector, i) for i in indices]),
+                          ("  get (dict)", lambda: [mimo.get(state, k) for k in keys]),
+                          ("  get (map)", lambda: [mimo.get(pmap, k) for k in keys])):
+            report(label, measure(fn, repeat=repeat) / len(indices), "per read")
+
+    # Building an n-key state object one merge at a time.
+    n = 5_000
+
+    def grow_dict():
+        state = {}
+        for i in range(n):
+            state = obj.merge(state, {f"k{i}": i})
+        return state
+
+    def grow_map():
+        state = persistent.map()
+        for i in range(n):
+            state = obj.merge(state, {f"k{i}": i})
+        return state
+
+    assert grow_dict() == grow_map()
+    print(f"grow a state object to {n} keys by merging")
+    report("  dict", measure(grow_dict, repeat=1))
+    report("  persistent map", measure(grow_map, repeat=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Overhead of MIMO_PROFILE: the same mimo.add/mimo.get/array.map workload in a
+fresh interpreter with profiling off and on, followed by the report the
+profiled run prints at exit. Also checks that profiling does not force lazy
+arrays (the argument-size histogram must not call len() on them).
+
+Run: python tools/convert/plugins/python/benchmarks/bench_profile.py
+"""
+import os
+import subprocess
+import sys
+
+from _harness import RUNTIME_DIR
+
+PROGRAM = """
+import sys, time
+sys.path.insert(0, {runtime_dir!r})
+from mimo_runtime import mimo
+items = [{{"qty": i}} for i in range(20_000)]
+start = time.perf_counter()
+total = 0
+for _ in range(5):
+    for item in items:
+        total = mimo.add(total, mimo.get(item, "qty"))
+    mimo.array.map(items, lambda item: mimo.get(item, "qty"))
+print(time.perf_counter() - start)
+"""
+
+LAZY_PROGRAM = """
+import sys
+sys.path.insert(0, {runtime_dir!r})
+from mimo_runtime import mimo, LazySequence
+pulled = []
+def source():
+    for i in range(100_000):
+        pulled.append(i)
+        yield i
+first = mimo.array.first(LazySequence(source()).filter(lambda x: x > 2))
+print(first, len(pulled))
+"""
+
+
+def run(profile, program=PROGRAM):
+    env = dict(os.environ)
+    env.pop("MIMO_PROFILE", None)
+    if profile:
+        env["MIMO_PROFILE"] = profile
+    out = subprocess.run([sys.executable, "-c", program.format(runtime_dir=RUNTIME_DIR)],
+                         capture_output=True, text=True, check=True, env=env)
+    return out.stdout.split(), out.stderr
+
+
+def main():
+    first, pulled = run("1", LAZY_PROGRAM)[0]
+    assert (first, pulled) == ("3", "4"), (first, pulled)
+    off = min(float(run(None)[0][0]) for _ in range(3))
+    on, report = min((float(out[0]), report) for out, report in (run("1") for _ in range(3)))
+    print(f"{'MIMO_PROFILE unset':<44} {off * 1e3:10.3f} ms")
+    print(f"{'MIMO_PROFILE=1':<44} {on * 1e3:10.3f} ms  x{on / off:.2f}")
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
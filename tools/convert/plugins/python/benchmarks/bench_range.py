@@ -0,0 +1,46 @@
+"""
+mimo.range memory benchmark: peak RSS of `for i in 0..N` with the lazy range
+vs. the previous list-materializing implementation.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_range.py
+Each variant runs in a fresh interpreter so peak RSS is not shared
+(ru_maxrss is read as KiB, as reported on Linux).
+"""
+import subprocess
+import sys
+
+from _harness import RUNTIME_DIR
+
+N = 10_000_000
+
+LOOP = """
+import resource, sys, time
+sys.path.insert(0, {runtime_dir!r})
+from mimo_runtime import mimo
+make = {make}
+start = time.perf_counter()
+total = 0
+for i in make(0, {n}):
+    total += i
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss)
+"""
+
+VARIANTS = [
+    ("lazy mimo.range", "mimo.range"),
+    ("legacy list(range(...))", "lambda a, b: list(range(a, b))"),
+    ("baseline: import only", "lambda a, b: ()"),
+]
+
+
+def main():
+    for label, make in VARIANTS:
+        code = LOOP.format(runtime_dir=RUNTIME_DIR, make=make, n=N)
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        elapsed, rss_kib = out.stdout.split()
+        print(f"{label:<30} for i in 0..{N:,}: {float(elapsed) * 1000:9.1f} ms, peak RSS {int(rss_kib) / 1024:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+RegexModule benchmark: compiled-pattern LRU vs. the previous per-call flag
+parsing on top of re's internal cache.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_regex.py
+"""
+import re
+
+from _harness import measure, report
+from mimo_runtime import mimo
+
+
+def legacy_is_match(pattern, text, flags=''):
+    """The previous RegexModule.is_match, kept for comparison."""
+    flag_map = {'i': re.IGNORECASE, 'm': re.MULTILINE, 's': re.DOTALL}
+    re_flags = 0
+    for ch in flags:
+        re_flags |= flag_map.get(ch, 0)
+    return bool(re.search(pattern, text, re_flags))
+
+
+LINE = "2024-05-01 12:00:01 INFO request id=1234 path=/api/items status=200"
+
+
+def run(is_match, patterns, rounds):
+    for _ in range(rounds):
+        for pattern in patterns:
+            is_match(pattern, LINE, 'i')
+
+
+def main():
+    regex = mimo.regex
+    for distinct in (10, 300, 2000):
+        patterns = [rf"id=\d+ path=/api/v{n}" for n in range(distinct)]
+        rounds = max(1, 20_000 // distinct)
+        calls = rounds * distinct
+        regex.clear_cache()
+        new = measure(lambda: run(regex.is_match, patterns, rounds), repeat=3)
+        re.purge()
+        old = measure(lambda: run(legacy_is_match, patterns, rounds), repeat=3)
+        report(f"is_match, {distinct} distinct patterns (new)", new / calls, str(regex.cache_info()))
+        report(f"is_match, {distinct} distinct patterns (legacy)", old / calls, f"speedup x{old / new:.2f}")
+
+    compiled = regex.compile(r"status=(\d+)")
+    report("extract with a regex.compile handle",
+           measure(lambda: regex.extract(compiled, LINE), number=20_000))
+    report("extract with a pattern string",
+           measure(lambda: regex.extract(r"status=(\d+)", LINE), number=20_000))
+
+
+if __name__ == "__main__":
+    main()
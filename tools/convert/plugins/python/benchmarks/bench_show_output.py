@@ -0,0 +1,45 @@
+"""
+show() throughput: direct stdout writes vs. batched output (MIMO_BUFFER_OUTPUT).
+
+Run: python tools/convert/plugins/python/benchmarks/bench_show_output.py
+Output goes to os.devnull, opened both block-buffered (pipes/files) and
+line-buffered (what a terminal gets).
+"""
+import os
+import sys
+
+from _harness import measure, report
+from mimo_runtime import MimoRuntime
+
+LINES = 200_000
+
+
+def emit(runtime):
+    show = runtime.show
+    for i in range(LINES):
+        show("row", i, "total:", i * 3)
+    runtime.flush()
+
+
+def main():
+    real_stdout = sys.stdout
+    results = []
+    try:
+        for label, buffering in (("block-buffered", -1), ("line-buffered", 1)):
+            with open(os.devnull, 'w', buffering=buffering) as sink:
+                sys.stdout = sink
+                direct = MimoRuntime()
+                batched = MimoRuntime()
+                batched.set_output_buffering(True)
+                results.append((label, measure(lambda: emit(direct), repeat=3),
+                                measure(lambda: emit(batched), repeat=3)))
+    finally:
+        sys.stdout = real_stdout
+    for label, direct, batched in results:
+        report(f"{LINES} lines, {label}, direct", direct, f"{LINES / direct:12,.0f} lines/s")
+        report(f"{LINES} lines, {label}, batched", batched,
+               f"{LINES / batched:12,.0f} lines/s  speedup x{direct / batched:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+ArrayModule sorting benchmark: comparator sorts (cmp_to_key vs. detected
+`a - b` shapes), sort_by, multi-key sort_by and top_k.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_sort.py
+"""
+import functools
+import random
+
+from _harness import measure, report
+from mimo_runtime import get as __mimo_get, mimo
+
+N = 300_000
+array = mimo.array
+
+
+def main():
+    rng = random.Random(7)
+    rows = [{"id": i, "score": rng.randrange(1000), "name": f"user{rng.randrange(N)}"} for i in range(N)]
+    # Shaped like transpiled Mimo comparators, so the fast path recognises them.
+    by_score = lambda a, b: (__mimo_get(a, "score") - __mimo_get(b, "score"))  # noqa: E731
+    opaque = lambda a, b: (__mimo_get(a, "score") - __mimo_get(b, "score")) or 0  # noqa: E731
+
+    legacy = measure(lambda: sorted(rows, key=functools.cmp_to_key(by_score)), repeat=3)
+    report(f"sort {N} rows, comparator via cmp_to_key", legacy)
+    report(f"sort {N} rows, opaque comparator", measure(lambda: array.sort(rows, opaque), repeat=3))
+    detected = measure(lambda: array.sort(rows, by_score), repeat=3)
+    report(f"sort {N} rows, detected a.score - b.score", detected, f"speedup x{legacy / detected:.2f}")
+    report(f"sort_by {N} rows, one key",
+           measure(lambda: array.sort_by(rows, lambda r: r["score"]), repeat=3))
+    report(f"sort_by {N} rows, score desc + name asc",
+           measure(lambda: array.sort_by(rows, [lambda r: r["score"], lambda r: r["name"]], ["desc", "asc"]), repeat=3))
+    report(f"top_k 10 of {N} rows", measure(lambda: array.top_k(rows, 10, lambda r: r["score"]), repeat=3))
+    report(f"sort_by then take 10 of {N} rows",
+           measure(lambda: array.sort_by(rows, lambda r: r["score"], "desc")[:10], repeat=3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Startup cost of the runtime, as seen by a short converted CLI program: the
+`python -X importtime` cumulative time of `import mimo_runtime` and the
+slowest imports under it, then whole-process wall time for a program that
+only calls show versus ones that touch the json, http and array modules.
+
+Each program runs in a fresh interpreter with bytecode cached in a temporary
+directory (warmed first), so source compilation is not counted.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_startup.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from _harness import RUNTIME_DIR, format_time, report
+
+RUNS = 10
+TOP_IMPORTS = 12
+
+PRELUDE = f"import sys\nsys.path.insert(0, {RUNTIME_DIR!r})\nfrom mimo_runtime import mimo\n"
+PROGRAMS = {
+    "show only": 'mimo.show("hello")',
+    "json.stringify": 'mimo.show(mimo.json.stringify({"a": [1, 2]}))',
+    "array.map": 'mimo.show(mimo.array.map([1, 2, 3], lambda x: x * 2))',
+    "http (module access only)": 'mimo.http',
+}
+
+
+def environment(cache_dir):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.pop("MIMO_PROFILE", None)
+    env["PYTHONPYCACHEPREFIX"] = cache_dir
+    return env
+
+
+def import_times(env):
+    """Cumulative microseconds of `import mimo_runtime`, and [(us, name)] of its direct imports."""
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", PRELUDE],
+                         capture_output=True, text=True, check=True, env=env)
+    children = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        # importtime prints a module after everything it imported.
+        if depth == 0:
+            if name == "mimo_runtime":
+                return int(cumulative), children
+            children = []
+        elif depth == 1:
+            children.append((int(cumulative), name))
+    raise RuntimeError("mimo_runtime was not imported")
+
+
+def wall_time(program, env):
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", program], check=True,
+                       stdout=subprocess.DEVNULL, env=env)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = environment(cache_dir)
+        import_times(env)  # warm the bytecode cache
+        total, imports = min((import_times(env) for _ in range(5)), key=lambda r: r[0])
+        print(f"import mimo_runtime (cumulative)           {format_time(total / 1e6)}")
+        for cumulative, name in sorted(imports, reverse=True)[:TOP_IMPORTS]:
+            print(f"  {name:<42}{format_time(cumulative / 1e6)}")
+        print()
+        report("python -c pass", wall_time("pass", env))
+        for label, source in PROGRAMS.items():
+            report(label, wall_time(PRELUDE + source, env))
+
+
+if __name__ == "__main__":
+    main()
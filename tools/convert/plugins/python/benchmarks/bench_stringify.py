@@ -0,0 +1,73 @@
+"""
+stringify/show benchmark: streaming writer vs. the previous recursive join.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_stringify.py
+"""
+import datetime
+import os
+import sys
+
+from _harness import measure, report
+from mimo_runtime import mimo, stringify
+
+
+def legacy_stringify(value):
+    """The recursive implementation stringify replaced, kept for comparison."""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        elements = [legacy_stringify(v) for v in value]
+        return f"[{', '.join(elements)}]"
+    if isinstance(value, dict):
+        pairs = [f"{k}: {legacy_stringify(v)}" for k, v in value.items()]
+        return f"{{{', '.join(pairs)}}}"
+    if isinstance(value, datetime.datetime):
+        return f"datetime({value.isoformat()})"
+    return str(value)
+
+
+def records(n):
+    return [
+        {"id": i, "name": f"item-{i}", "price": i * 0.25, "tags": ["a", "b"], "owner": {"id": i % 9}}
+        for i in range(n)
+    ]
+
+
+def main():
+    numbers = list(range(200_000))
+    rows = records(50_000)
+    cases = [
+        ("200k ints", numbers),
+        ("50k records", rows),
+        ("small record", rows[0]),
+        ("scalar int", 42),
+    ]
+    for label, value in cases:
+        number = 10_000 if label in ("small record", "scalar int") else 1
+        assert stringify(value) == legacy_stringify(value)
+        new = measure(lambda: stringify(value), number=number)
+        old = measure(lambda: legacy_stringify(value), number=number)
+        report(f"stringify {label} (new)", new)
+        report(f"stringify {label} (legacy)", old, f"speedup x{old / new:.2f}")
+
+    report("stringify 50k records, max_length=10",
+           measure(lambda: stringify(rows, max_length=10), number=1000))
+
+    real_stdout = sys.stdout
+    try:
+        with open(os.devnull, 'w') as sink:
+            sys.stdout = sink
+            show = measure(lambda: mimo.show(rows), repeat=3)
+            legacy_show = measure(lambda: print(legacy_stringify(rows)), repeat=3)
+    finally:
+        sys.stdout = real_stdout
+    report("show 50k records (new)", show)
+    report("show 50k records (legacy)", legacy_show, f"speedup x{legacy_show / show:.2f}")
+
+
+if __name__ == "__main__":
+    main()
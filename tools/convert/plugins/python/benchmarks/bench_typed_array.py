@@ -0,0 +1,78 @@
+"""
+mimo.typed_array vs. plain lists for numeric data: memory of 1M readings
+(traced allocations), then store, load and iterate throughput through the
+runtime helpers generated code uses, and array.sum.
+
+Run: python tools/convert/plugins/python/benchmarks/bench_typed_array.py
+"""
+import random
+import tracemalloc
+
+from _harness import measure, report
+from mimo_runtime import get, mimo
+
+N = 1_000_000
+
+
+def traced(fn):
+    tracemalloc.start()
+    value = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def main():
+    rng = random.Random(5)
+    readings = [rng.uniform(-40.0, 60.0) for _ in range(N)]
+    counts = [rng.randrange(60_000) for _ in range(N)]
+
+    variants = {
+        "list of floats": lambda: [x * 1.0 for x in readings],
+        "typed_array float64": lambda: mimo.typed_array("float64", readings),
+        "typed_array float32": lambda: mimo.typed_array("float32", readings),
+        "list of ints": lambda: [x + 0 for x in counts],
+        "typed_array uint16": lambda: mimo.typed_array("uint16", counts),
+    }
+    built = {}
+    for label, make in variants.items():
+        built[label], size = traced(make)
+        print(f"{label:<44} {size / 2**20:10.2f} MiB  ({size / N:5.1f} bytes/element)")
+
+    for label in ("list of floats", "typed_array float64"):
+        data = built[label]
+
+        def store(data=data):
+            for i in range(0, N, 4):
+                mimo.update(data, i, 1.5)
+
+        def load(data=data):
+            total = 0.0
+            for i in range(0, N, 4):
+                total += get(data, i)
+            return total
+
+        def index(data=data):
+            total = 0.0
+            for i in range(0, N, 4):
+                total += data[i]
+            return total
+
+        def iterate(data=data):
+            total = 0.0
+            for x in data:
+                total += x
+            return total
+
+        report(f"{label}: mimo.update x{N // 4:,}", measure(store, repeat=3))
+        report(f"{label}: get x{N // 4:,}", measure(load, repeat=3))
+        report(f"{label}: data[i] x{N // 4:,}", measure(index, repeat=3))
+        report(f"{label}: for-loop over {N:,}", measure(iterate, repeat=3))
+        report(f"{label}: array.sum", measure(lambda: mimo.array.sum(data), repeat=3))
+        report(f"{label}: push {N // 4:,}", measure(
+            lambda: [mimo.push(data, 0.5) for _ in range(N // 4)] and data.__delitem__(slice(N, None)), repeat=3))
+    assert mimo.array.sum(built["list of floats"]) == mimo.array.sum(built["typed_array float64"])
+
+
+if __name__ == "__main__":
+    main()
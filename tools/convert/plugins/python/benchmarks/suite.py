@@ -0,0 +1,421 @@
+"""
+Benchmark suite for the Python runtime and for converted Mimo programs.
+
+Micro-benchmarks time single runtime calls (is_equal, stringify, add, get,
+ArrayModule, StringModule, RegexModule). Macro-benchmarks convert the
+scaled-up docs/examples programs in `programs/` to Python once, then time whole
+program runs with their output captured.
+
+Each benchmark is calibrated so that one sample runs for at least
+--min-time seconds, then sampled --samples times after a warmup. Results are
+per-call times in seconds and can be saved as JSON and compared:
+
+    python tools/convert/plugins/python/benchmarks/suite.py run -o base.json
+    python tools/convert/plugins/python/benchmarks/suite.py run -o new.json -k array
+    python tools/convert/plugins/python/benchmarks/suite.py compare base.json new.json --threshold 0.1
+
+`compare` exits with status 1 when any benchmark got slower by more than the
+threshold, in both its median and its best sample.
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import runpy
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from _harness import RUNTIME_DIR, format_time
+import mimo_runtime
+from mimo_runtime import mimo, add, get, is_equal, stringify
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROGRAMS_DIR = os.path.join(BENCH_DIR, 'programs')
+REPO_ROOT = os.path.abspath(os.path.join(RUNTIME_DIR, '..', '..', '..', '..'))
+FORMAT_VERSION = 1
+
+# (name, factory, is_macro): a factory builds its inputs and returns the
+# zero-argument callable to time.
+BENCHMARKS = []
+
+
+def benchmark(name: str, macro: bool = False):
+    def register(factory):
+        BENCHMARKS.append((name, factory, macro))
+        return factory
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Micro-benchmarks
+# ---------------------------------------------------------------------------
+
+def _order(i: int) -> dict:
+    return {
+        "id": i,
+        "customer": {"name": f"customer {i}", "tags": ["a", "b", str(i % 7)]},
+        "lines": [{"sku": f"S{j}", "qty": j, "price": j * 1.5} for j in range(5)],
+        "paid": i % 2 == 0,
+        "note": None,
+    }
+
+
+ORDERS = [_order(i) for i in range(200)]
+NUMBERS = [(i * 7919) % 1000 for i in range(10_000)]
+WORDS = [f"word{i % 50}" for i in range(2_000)]
+TEXT = " ".join(f"user{i}@example.com visited /page/{i} at 12:{i % 60:02d}" for i in range(500))
+
+
+@benchmark("is_equal/nested equal")
+def _():
+    copy = json.loads(json.dumps(ORDERS))
+    return lambda: is_equal(ORDERS, copy)
+
+
+@benchmark("is_equal/scalars")
+def _():
+    return lambda: is_equal(12345, 12345)
+
+
+@benchmark("stringify/nested")
+def _():
+    return lambda: stringify(ORDERS)
+
+
+@benchmark("stringify/flat array")
+def _():
+    return lambda: stringify(NUMBERS[:1000])
+
+
+@benchmark("add/numbers")
+def _():
+    return lambda: add(40, 2)
+
+
+@benchmark("add/string + number")
+def _():
+    return lambda: add("total: ", 42)
+
+
+@benchmark("get/object key")
+def _():
+    order = ORDERS[0]
+    return lambda: get(order, "customer")
+
+
+@benchmark("get/array index")
+def _():
+    return lambda: get(NUMBERS, 500)
+
+
+@benchmark("array/map")
+def _():
+    return lambda: mimo.array.map(NUMBERS, lambda x: x * 2)
+
+
+@benchmark("array/filter")
+def _():
+    return lambda: mimo.array.filter(NUMBERS, lambda x: x % 3 == 0)
+
+
+@benchmark("array/reduce")
+def _():
+    return lambda: mimo.array.reduce(NUMBERS, lambda acc, x: acc + x, 0)
+
+
+@benchmark("array/sort comparator")
+def _():
+    data = NUMBERS[:2000]
+    return lambda: mimo.array.sort(data, lambda a, b: a - b)
+
+
+@benchmark("array/sort_by")
+def _():
+    return lambda: mimo.array.sort_by(ORDERS, lambda o: o["customer"]["name"])
+
+
+@benchmark("array/unique")
+def _():
+    return lambda: mimo.array.unique(NUMBERS)
+
+
+@benchmark("array/group_by")
+def _():
+    return lambda: mimo.array.group_by(ORDERS, lambda o: o["id"] % 10)
+
+
+@benchmark("array/index_of object")
+def _():
+    target = json.loads(json.dumps(ORDERS[-1]))
+    return lambda: mimo.array.index_of(ORDERS, target)
+
+
+@benchmark("array/sum")
+def _():
+    return lambda: mimo.array.sum(NUMBERS)
+
+
+@benchmark("string/split + join")
+def _():
+    return lambda: mimo.join(mimo.string.split(TEXT, " "), "-")
+
+
+@benchmark("string/replace_all")
+def _():
+    return lambda: mimo.string.replace_all(TEXT, "example", "sample")
+
+
+@benchmark("string/pad_start")
+def _():
+    return lambda: mimo.string.pad_start("42", 8, "0")
+
+
+@benchmark("string/to_title_case")
+def _():
+    sentence = " ".join(WORDS[:50])
+    return lambda: mimo.string.to_title_case(sentence)
+
+
+@benchmark("regex/is_match")
+def _():
+    return lambda: mimo.regex.is_match(r"^\d{3}-\d{4}$", "555-1234")
+
+
+@benchmark("regex/find_matches")
+def _():
+    return lambda: mimo.regex.find_matches(r"\w+@\w+\.com", TEXT, "g")
+
+
+@benchmark("regex/replace_all")
+def _():
+    return lambda: mimo.regex.replace_all(TEXT, r"\d+", "#", "g")
+
+
+# ---------------------------------------------------------------------------
+# Macro-benchmarks: converted docs/examples programs
+# ---------------------------------------------------------------------------
+
+MACRO_PROGRAMS = [
+    ("task_manager", "main.mimo"),
+    ("inventory", "app.mimo"),
+    ("quiz", "main.mimo"),
+]
+
+
+def _find_js_runtime():
+    for name in ('node', 'bun'):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def _convert_program(js_runtime: str, source: str, out_dir: str) -> str:
+    """Convert a Mimo program (and the modules it imports) into out_dir."""
+    subprocess.run(
+        [js_runtime, os.path.join(REPO_ROOT, 'tools', 'convert.js'),
+         '--in', source, '--out', out_dir, '--to', 'python'],
+        check=True, capture_output=True, text=True, cwd=REPO_ROOT,
+    )
+    return os.path.join(out_dir, os.path.splitext(os.path.basename(source))[0] + '.py')
+
+
+def _program_runner(path: str):
+    """Run a converted program in-process, capturing its output.
+
+    Its sibling modules are dropped from sys.modules before every run so each
+    run re-executes their top level (e.g. data generation), like a fresh
+    process would; `mimo_runtime` itself stays imported.
+    """
+    program_dir = os.path.dirname(path)
+    modules = [os.path.splitext(f)[0] for f in os.listdir(program_dir)
+               if f.endswith('.py') and f != 'mimo_runtime.py']
+
+    def run():
+        for name in modules:
+            sys.modules.pop(name, None)
+        sys.path.insert(0, program_dir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                runpy.run_path(path, run_name='__main__')
+        finally:
+            sys.path.remove(program_dir)
+        return out.getvalue()
+
+    return run
+
+
+def _register_macro_benchmarks(work_dir: str) -> None:
+    js_runtime = _find_js_runtime()
+    for name, entry in MACRO_PROGRAMS:
+        def factory(name=name, entry=entry):
+            if js_runtime is None:
+                raise RuntimeError("node or bun is required to convert Mimo programs")
+            out_dir = os.path.join(work_dir, name)
+            os.makedirs(out_dir, exist_ok=True)
+            path = _convert_program(js_runtime, os.path.join(PROGRAMS_DIR, name, entry), out_dir)
+            run = _program_runner(path)
+            if not run():
+                raise RuntimeError(f"{name} produced no output")
+            return run
+        benchmark(f"program/{name}", macro=True)(factory)
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+def _calibrate(fn, min_time: float) -> int:
+    """Smallest power-of-ten loop count whose sample takes at least min_time."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        if time.perf_counter() - start >= min_time or loops >= 10 ** 7:
+            return loops
+        loops *= 10
+
+
+def _sample(fn, loops: int, samples: int) -> list:
+    timer = time.perf_counter
+    values = []
+    for _ in range(samples):
+        start = timer()
+        for _ in range(loops):
+            fn()
+        values.append((timer() - start) / loops)
+    return values
+
+
+def _summary(values: list) -> dict:
+    return {
+        "median": statistics.median(values),
+        "mean": statistics.fmean(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "min": min(values),
+    }
+
+
+def _metadata() -> dict:
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "date": datetime.datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "revision": revision,
+        "runtime": os.path.relpath(mimo_runtime.__file__, REPO_ROOT),
+        "env": {k: v for k, v in os.environ.items() if k.startswith('MIMO_')},
+    }
+
+
+def run_suite(args) -> dict:
+    work_dir = tempfile.mkdtemp(prefix='mimo-bench-')
+    try:
+        if not args.no_macro:
+            _register_macro_benchmarks(work_dir)
+        results = {}
+        for name, factory, macro in BENCHMARKS:
+            if args.filter and not any(f in name for f in args.filter):
+                continue
+            try:
+                fn = factory()
+            except Exception as e:
+                print(f"{name:<44} skipped: {e}", file=sys.stderr)
+                continue
+            fn()  # warmup
+            loops = 1 if macro else _calibrate(fn, args.min_time)
+            samples = max(2, args.samples // 2) if macro else args.samples
+            values = _sample(fn, loops, samples)
+            stats = _summary(values)
+            results[name] = {"loops": loops, "samples": values, **stats}
+            print(f"{name:<44} {format_time(stats['median'])}  "
+                  f"+- {stats['stdev'] / stats['median'] * 100:4.1f}%  ({samples} x {loops})")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {"version": FORMAT_VERSION, "metadata": _metadata(), "benchmarks": results}
+
+
+def compare(base: dict, new: dict, threshold: float) -> int:
+    """Print a comparison of two result files; return the number of regressions."""
+    base_results = base["benchmarks"]
+    new_results = new["benchmarks"]
+    regressions = 0
+    print(f"{'benchmark':<44} {'base':>13} {'new':>13}  change")
+    for name, result in new_results.items():
+        if name not in base_results:
+            print(f"{name:<44} {'-':>13} {format_time(result['median'])}  new")
+            continue
+        before = base_results[name]["median"]
+        after = result["median"]
+        change = after / before - 1
+        # The best sample must be slower too, so one noisy run is not enough.
+        if change > threshold and result["min"] / base_results[name]["min"] - 1 > threshold:
+            verdict = "REGRESSION"
+            regressions += 1
+        elif change < -threshold:
+            verdict = "faster"
+        else:
+            verdict = ""
+        print(f"{name:<44} {format_time(before)} {format_time(after)}  {change * 100:+6.1f}%  {verdict}")
+    for name in sorted(base_results.keys() - new_results.keys()):
+        print(f"{name:<44} {format_time(base_results[name]['median'])} {'-':>13}  missing")
+    print(f"\n{regressions} regression(s) over {threshold * 100:.0f}%")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="run the benchmarks")
+    run_parser.add_argument('-o', '--output', help="write results to this JSON file")
+    run_parser.add_argument('-k', '--filter', action='append',
+                            help="only run benchmarks whose name contains this (repeatable)")
+    run_parser.add_argument('--samples', type=int, default=10, help="samples per benchmark (default 10)")
+    run_parser.add_argument('--min-time', type=float, default=0.02,
+                            help="minimum seconds per sample for micro-benchmarks (default 0.02)")
+    run_parser.add_argument('--no-macro', action='store_true', help="skip the converted programs")
+    run_parser.add_argument('--quick', action='store_true', help="3 samples of at least 5 ms")
+
+    compare_parser = commands.add_parser('compare', help="compare two result files")
+    compare_parser.add_argument('base')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="relative slowdown of the median that counts as a regression (default 0.10)")
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        if args.quick:
+            args.samples, args.min_time = 3, 0.005
+        data = run_suite(args)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+                f.write('\n')
+        return 0
+
+    with open(args.base, encoding='utf-8') as f:
+        base = json.load(f)
+    with open(args.new, encoding='utf-8') as f:
+        new = json.load(f)
+    return 1 if compare(base, new, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,65 +3,2698 @@ The Mimo Python runtime.
 Provides Python implementations for Mimo's built-ins and standard library.
 """
 import os
+import array
+import io
 import sys
+import atexit
 import re
-import json
 import math
-import random
-import datetime
-import urllib.request
-import urllib.error
-from pathlib import Path
+import functools
+import heapq
+import itertools
+import operator
+import marshal
+import mmap
+import zlib
+import time
+import codecs
+import threading
+import weakref
+import importlib
+from collections import Counter, OrderedDict
 from typing import Any, List, Dict, Callable, Optional, Union
 
 
+class _LazyModule:
+    """Module global that defers the import until its first attribute access.
+
+    Converted programs are often short-lived CLI runs, so modules only some
+    programs need (HTTP, JSON, process pools, ...) are not imported at startup.
+    The first access imports `name` and rebinds the global to the real module
+    (the top-level package, as `import name` binds), so later uses cost nothing.
+    """
+    __slots__ = ('_name',)
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr: str):
+        importlib.import_module(self._name)
+        top = self._name.partition('.')[0]
+        module = sys.modules[top]
+        globals()[top] = module
+        return getattr(module, attr)
+
+
+json = _LazyModule('json')
+random = _LazyModule('random')
+datetime = _LazyModule('datetime')
+pickle = _LazyModule('pickle')
+concurrent = _LazyModule('concurrent.futures')
+http = _LazyModule('http.client')
+urllib = _LazyModule('urllib.parse')
+pathlib = _LazyModule('pathlib')
+
+
+class _MimoSequence:
+    """Base class for runtime array types other than plain lists.
+
+    Subclasses are Mimo arrays: they compare equal to lists holding the same
+    items and print like lists. They must support iteration, len() and
+    indexing (including slices).
+    """
+    __slots__ = ()
+    __hash__ = None
+
+    def __eq__(self, other):
+        if not isinstance(other, _ARRAY_TYPES):
+            return NotImplemented
+        return is_equal(self, other)
+
+
+_ARRAY_TYPES = (list, tuple, _MimoSequence)
+
+
+class _MimoMapping:
+    """Base class for runtime object types other than plain dicts.
+
+    Subclasses are Mimo objects: they compare equal to dicts holding the same
+    entries and print like dicts. They must support len(), iteration over
+    keys, `in`, indexing, get(key, default), keys(), values() and items().
+    """
+    __slots__ = ()
+    __hash__ = None
+
+    def __eq__(self, other):
+        if not isinstance(other, _OBJECT_TYPES):
+            return NotImplemented
+        return is_equal(self, other)
+
+
+_OBJECT_TYPES = (dict, _MimoMapping)
+
+
+def _mixed_containers(a, b) -> bool:
+    """True if a and b differ in type but are both Mimo arrays or both Mimo objects,
+    one of them being a runtime type (_MimoSequence or _MimoMapping)."""
+    if isinstance(a, _MimoSequence) or isinstance(b, _MimoSequence):
+        return isinstance(a, _ARRAY_TYPES) and isinstance(b, _ARRAY_TYPES)
+    if isinstance(a, _MimoMapping) or isinstance(b, _MimoMapping):
+        return isinstance(a, _OBJECT_TYPES) and isinstance(b, _OBJECT_TYPES)
+    return False
+
+
+_PRIMITIVE_TYPES = frozenset((type(None), bool, int, float, str))
+_MISSING = object()
+_CYCLE_CHECK_AFTER = 1_000
+
+
+def _sequence_equal(a, b, stack) -> bool:
+    """Compare list/tuple items, deferring nested containers to the stack."""
+    if len(a) != len(b):
+        return False
+    # Walk backwards so deferred children are popped in source order.
+    for x, y in zip(reversed(a), reversed(b)):
+        if x is y:
+            continue
+        t = type(x)
+        if t is not type(y):
+            if not _mixed_containers(x, y):
+                return False
+            stack.append((x, y))
+        elif t in _PRIMITIVE_TYPES:
+            if x != y:
+                return False
+        else:
+            stack.append((x, y))
+    return True
+
+
+def _dict_equal(a, b, stack) -> bool:
+    """Compare dict keys and values, deferring nested containers to the stack."""
+    if len(a) != len(b):
+        return False
+    for k, x in reversed(a.items()):
+        y = b.get(k, _MISSING)
+        if x is y:
+            continue
+        if y is _MISSING:
+            return False
+        t = type(x)
+        if t is not type(y):
+            if not _mixed_containers(x, y):
+                return False
+            stack.append((x, y))
+        elif t in _PRIMITIVE_TYPES:
+            if x != y:
+                return False
+        else:
+            stack.append((x, y))
+    return True
+
+
+_EQUALITY_DISPATCH = {
+    list: _sequence_equal,
+    tuple: _sequence_equal,
+    dict: _dict_equal,
+}
+
+
+def _equality_handler(t):
+    """Find the container comparer for type t, honouring subclasses."""
+    handler = _EQUALITY_DISPATCH.get(t)
+    if handler is None:
+        if issubclass(t, _ARRAY_TYPES):
+            handler = _sequence_equal
+        elif issubclass(t, _OBJECT_TYPES):
+            handler = _dict_equal
+    return handler
+
+
 def is_equal(a: Any, b: Any) -> bool:
-    """Deep equality check for Mimo values."""
+    """Deep equality check for Mimo values.
+
+    Walks nested containers with an explicit stack, so deeply nested values
+    cannot hit the recursion limit. Once a comparison has visited more than
+    _CYCLE_CHECK_AFTER container pairs, pairs already under comparison are
+    assumed equal, which makes self-referencing values terminate.
+    """
     if a is b:
         return True
-    if type(a) != type(b):
-        return False
-    if isinstance(a, (list, tuple)):
-        if len(a) != len(b):
+    t = type(a)
+    if t is not type(b):
+        if not _mixed_containers(a, b):
+            return False
+    elif t in _PRIMITIVE_TYPES:
+        return a == b
+    stack = [(a, b)]
+    visited = None
+    budget = _CYCLE_CHECK_AFTER
+    dispatch = _EQUALITY_DISPATCH
+    # Pairs are only pushed once they are known to be distinct and same-typed
+    # (or both Mimo arrays).
+    while stack:
+        x, y = stack.pop()
+        t = type(x)
+        handler = dispatch.get(t) or _equality_handler(t)
+        if handler is None:
+            if x != y:
+                return False
+            continue
+        if budget:
+            budget -= 1
+        else:
+            if visited is None:
+                visited = set()
+            pair = (id(x), id(y))
+            if pair in visited:
+                continue
+            visited.add(pair)
+        if not handler(x, y, stack):
             return False
-        return all(is_equal(x, y) for x, y in zip(a, b))
-    if isinstance(a, dict):
-        if set(a.keys()) != set(b.keys()):
+    return True
+
+
+def _canonical_key(value: Any):
+    """Build a hashable key such that equal keys imply is_equal values.
+
+    Raises TypeError for unhashable values that are not lists, tuples or dicts.
+    """
+    t = type(value)
+    if t is str:
+        return value
+    if t is int or t is float:
+        return (t, value)
+    if t is list or t is tuple:
+        return (t, tuple(map(_canonical_key, value)))
+    if isinstance(value, _MimoSequence):
+        return (list, tuple(map(_canonical_key, value)))
+    if t is dict or isinstance(value, _MimoMapping):
+        return (dict, frozenset(zip(value, map(_canonical_key, value.values()))))
+    hash(value)
+    return (t, value)
+
+
+class _ValueSet:
+    """Membership set for Mimo values using is_equal semantics.
+
+    Values with a canonical key are tracked in a hash set; anything else falls
+    back to a linear is_equal scan.
+    """
+    __slots__ = ('_keys', '_others')
+
+    def __init__(self, values=()):
+        self._keys = set()
+        self._others = []
+        for value in values:
+            self.add(value)
+
+    def add(self, value) -> bool:
+        """Add value, returning True if it was not already present."""
+        try:
+            key = _canonical_key(value)
+        except TypeError:
+            if any(is_equal(value, other) for other in self._others):
+                return False
+            self._others.append(value)
+            return True
+        if key in self._keys:
             return False
-        return all(is_equal(a[k], b[k]) for k in a.keys())
-    return a == b
+        self._keys.add(key)
+        return True
+
+    def __contains__(self, value) -> bool:
+        try:
+            return _canonical_key(value) in self._keys
+        except TypeError:
+            return any(is_equal(value, other) for other in self._others)
+
+
+def _env_int(name: str) -> Optional[int]:
+    """Read an integer setting from the environment, None if unset or invalid."""
+    raw = os.environ.get(name)
+    try:
+        return int(raw) if raw else None
+    except ValueError:
+        return None
 
 
-def stringify(value: Any) -> str:
+def _env_flag(name: str) -> bool:
+    """Read a boolean setting from the environment."""
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+CIRCULAR_PLACEHOLDER = '[Circular]'
+_CONTAINER_TYPES = (list, tuple, dict, _MimoSequence, _MimoMapping)
+
+
+def write_value(value: Any, write: Callable[[str], Any],
+                max_depth: Optional[int] = None, max_length: Optional[int] = None) -> None:
+    """Write Mimo's string representation of value through write(), in one pass.
+
+    Containers are walked with an explicit stack of item iterators, so no
+    intermediate strings are built per nesting level. A container that
+    contains itself is written as CIRCULAR_PLACEHOLDER. Containers nested
+    deeper than max_depth are written as `[...]`/`{...}`, and only the first
+    max_length items of each container are written, followed by `...`.
+    """
+    t = type(value)
+    if t is str:
+        write(value)
+        return
+    if t is int or t is float:
+        write(str(value))
+        return
+    stack = []
+    active = set()
+    depth = 0
+    while True:
+        t = type(value)
+        if t is str:
+            write(value)
+        elif t is int or t is float:
+            write(str(value))
+        elif value is None:
+            write('null')
+        elif t is bool:
+            write('true' if value else 'false')
+        elif t is list or t is dict or isinstance(value, _CONTAINER_TYPES):
+            is_dict = t is dict or isinstance(value, _OBJECT_TYPES)
+            key = id(value)
+            if key in active:
+                write(CIRCULAR_PLACEHOLDER)
+            elif max_depth is not None and depth >= max_depth:
+                write('{...}' if is_dict else '[...]')
+            else:
+                write('{' if is_dict else '[')
+                items = iter(value.items()) if is_dict else iter(value)
+                # With a length limit, keep the source iterator to check for leftovers.
+                rest = None
+                if max_length is not None:
+                    rest = items
+                    items = itertools.islice(items, max_length)
+                active.add(key)
+                stack.append([items, is_dict, key, depth + 1, rest, True])
+        elif isinstance(value, str):
+            write(value)
+        elif isinstance(value, datetime.datetime):
+            write(f"datetime({value.isoformat()})")
+        else:
+            write(str(value))
+
+        # Advance to the next nested container, writing plain scalar items
+        # inline and closing containers as their items run out.
+        while stack:
+            frame = stack[-1]
+            is_dict = frame[1]
+            first = frame[5]
+            value = _MISSING
+            for item in frame[0]:
+                if is_dict:
+                    if first:
+                        first = False
+                        write(f"{item[0]}: ")
+                    else:
+                        write(f", {item[0]}: ")
+                    item = item[1]
+                elif first:
+                    first = False
+                else:
+                    write(', ')
+                t = type(item)
+                if t is str:
+                    write(item)
+                elif t is int or t is float:
+                    write(str(item))
+                elif item is None:
+                    write('null')
+                elif t is bool:
+                    write('true' if item else 'false')
+                else:
+                    value = item
+                    break
+            if value is not _MISSING:
+                frame[5] = False
+                depth = frame[3]
+                break
+            if frame[4] is not None and next(frame[4], _MISSING) is not _MISSING:
+                write('...' if first else ', ...')
+            write('}' if is_dict else ']')
+            active.discard(frame[2])
+            stack.pop()
+        else:
+            return
+
+
+def stringify(value: Any, max_depth: Optional[int] = None, max_length: Optional[int] = None) -> str:
     """Convert a value to Mimo's string representation."""
+    t = type(value)
+    if t is str:
+        return value
+    if t is int or t is float:
+        return str(value)
     if value is None:
         return 'null'
-    if isinstance(value, bool):
-        return 'true' if value else 'false'
-    if isinstance(value, str):
+    parts = []
+    write_value(value, parts.append, max_depth, max_length)
+    return ''.join(parts)
+
+
+# Operator helpers for generated code, which imports them directly
+# (`from mimo_runtime import add as __mimo_add`) so each call skips the
+# attribute lookup and bound-method call that `mimo.add` costs. Exact-type
+# checks come first: bool is a subclass of int but must not take the
+# numeric path through `add`, and subclasses fall through to the general case.
+
+
+def add(a, b):
+    """Mimo + operator: concatenates if either operand is a string, otherwise adds."""
+    ta = type(a)
+    tb = type(b)
+    if ta is str:
+        return a + (b if tb is str else stringify(b))
+    if (ta is int or ta is float) and (tb is int or tb is float):
+        return a + b
+    if tb is str:
+        return stringify(a) + b
+    if isinstance(a, str) or isinstance(b, str):
+        return stringify(a) + stringify(b)
+    return a + b
+
+
+def get(collection, key):
+    """Get value from collection by key, return None if not found."""
+    t = type(collection)
+    if t is dict:
+        try:
+            return collection.get(key)
+        except TypeError:
+            return None
+    if (t is list or t is TypedArray) and type(key) is int:
+        return collection[key] if 0 <= key < len(collection) else None
+    if collection is None:
+        return None
+    try:
+        if isinstance(collection, _ARRAY_TYPES):
+            return collection[key] if 0 <= key < len(collection) else None
+        elif isinstance(collection, _OBJECT_TYPES):
+            return collection.get(key)
+        else:
+            return getattr(collection, key, None)
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+# is_equal already short-circuits identical and same-typed primitive values.
+eq = is_equal
+
+
+def neq(a, b) -> bool:
+    return not is_equal(a, b)
+
+
+_OPERATOR_HELPERS = ('add', 'get', 'eq', 'neq')
+
+
+def _flat_map_iter(callback: Callable, items):
+    for item in items:
+        mapped = callback(item)
+        if isinstance(mapped, _ARRAY_TYPES):
+            yield from mapped
+        else:
+            yield mapped
+
+
+def _chunk_iter(size: int, items):
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _zip_iter(others, items):
+    return map(list, zip(items, *others))
+
+
+class LazySequence(_MimoSequence):
+    """A Mimo array whose items are produced on demand.
+
+    Each stage is an iterator transform applied when the sequence is
+    iterated; a sequence over a one-shot source (such as a generator) can
+    only be consumed once unless it has been materialized. map and filter
+    stages are the builtin C iterators, so a chain of stages runs as one pass
+    over the source with no intermediate lists. len(), indexing and reversal
+    materialize the items once and cache them; index() stops at the first
+    match.
+    """
+    __slots__ = ('_source', '_stages', '_items')
+
+    def __init__(self, source, stages: tuple = ()):
+        self._source = source
+        self._stages = stages
+        self._items = None
+
+    def then(self, stage: Callable) -> 'LazySequence':
+        """Return a new sequence with an extra iterator stage."""
+        if self._items is not None:
+            return LazySequence(self._items, (stage,))
+        return LazySequence(self._source, self._stages + (stage,))
+
+    def map(self, callback: Callable) -> 'LazySequence':
+        return self.then(functools.partial(map, callback))
+
+    def filter(self, callback: Callable) -> 'LazySequence':
+        return self.then(functools.partial(filter, callback))
+
+    def flat_map(self, callback: Callable) -> 'LazySequence':
+        return self.then(functools.partial(_flat_map_iter, callback))
+
+    def chunk(self, size: int) -> 'LazySequence':
+        return self.then(functools.partial(_chunk_iter, size))
+
+    def to_list(self) -> List:
+        """Materialize (once) and return the items as a list."""
+        if self._items is None:
+            self._items = list(iter(self))
+            self._source = None
+            self._stages = ()
+        return self._items
+
+    def __iter__(self):
+        if self._items is not None:
+            return iter(self._items)
+        items = iter(self._source)
+        for stage in self._stages:
+            items = stage(items)
+        return items
+
+    def __len__(self):
+        return len(self.to_list())
+
+    def __getitem__(self, index):
+        return self.to_list()[index]
+
+    def __reversed__(self):
+        return reversed(self.to_list())
+
+    def __contains__(self, value):
+        return value in iter(self)
+
+    def index(self, value, start: int = 0) -> int:
+        """Position of the first item equal to value at or after start, like list.index."""
+        if self._items is not None or start < 0:
+            return self.to_list().index(value, start)
+        for i, item in enumerate(itertools.islice(iter(self), start, None), start):
+            if item is value or item == value:
+                return i
+        raise ValueError(f"{value!r} is not in sequence")
+
+
+class LazyRange(_MimoSequence):
+    """Result of mimo.range: reads are served by a `range` object.
+
+    Iteration, len(), indexing, slicing and membership never build a list.
+    The first mutation copies the numbers into a list, which backs the value
+    from then on.
+    """
+    __slots__ = ('_items',)
+
+    def __init__(self, items):
+        self._items = items
+
+    def _materialize(self) -> List:
+        items = self._items
+        if type(items) is range:
+            items = self._items = list(items)
+        return items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        result = self._items[index]
+        if type(result) is range:
+            return LazyRange(result)
+        return result
+
+    def __reversed__(self):
+        return reversed(self._items)
+
+    def __contains__(self, value):
+        return value in self._items
+
+    def index(self, value, start: int = 0, stop: Optional[int] = None) -> int:
+        items = self._items
+        if type(items) is not range:
+            return items.index(value, start, len(items) if stop is None else stop)
+        # Negative or out-of-range bounds are clamped as list.index does.
+        start, stop, _ = slice(start, stop).indices(len(items))
+        i = items.index(value)
+        if not start <= i < stop:
+            raise ValueError(f"{value!r} is not in range")
+        return i
+
+    def count(self, value) -> int:
+        return self._items.count(value)
+
+    def __setitem__(self, index, value):
+        self._materialize()[index] = value
+
+    def __delitem__(self, index):
+        del self._materialize()[index]
+
+    def append(self, value):
+        self._materialize().append(value)
+
+    def pop(self, index: int = -1):
+        return self._materialize().pop(index)
+
+    def __repr__(self):
+        return f"LazyRange({self._items!r})"
+
+
+# Element kinds for mimo.typed_array, by name, with their array.array type codes.
+TYPED_ARRAY_KINDS = {
+    'int8': 'b', 'uint8': 'B', 'int16': 'h', 'uint16': 'H',
+    'int32': 'i', 'uint32': 'I', 'int64': 'q', 'uint64': 'Q',
+    'float32': 'f', 'float64': 'd',
+}
+_TYPED_ARRAY_NAMES = {code: name for name, code in TYPED_ARRAY_KINDS.items()}
+
+
+class TypedArray(array.array, _MimoSequence):
+    """Result of mimo.typed_array: a Mimo array of unboxed numbers.
+
+    An array.array subclass, so elements are stored at their machine size
+    (8 bytes for float64 instead of about 32 for a boxed float in a list),
+    and indexing, iteration, append and pop run at C speed. Storing a value
+    that does not fit the kind raises. Plain Python slicing returns a bare
+    array.array; the runtime's slice functions return a TypedArray.
+    """
+    __slots__ = ()
+    __eq__ = _MimoSequence.__eq__
+    __ne__ = object.__ne__
+    __hash__ = None
+
+    @property
+    def kind(self) -> str:
+        return _TYPED_ARRAY_NAMES.get(self.typecode, self.typecode)
+
+    def __copy__(self) -> 'TypedArray':
+        return TypedArray(self.typecode, self)
+
+    def __deepcopy__(self, memo) -> 'TypedArray':
+        return TypedArray(self.typecode, self)
+
+    def __repr__(self):
+        return f"TypedArray({self.kind!r}, {self.tolist()!r})"
+
+
+def _typed_array_equal(a, b, stack) -> bool:
+    # Same-kind typed arrays compare element-wise in C. Across kinds, 1 and 1.0
+    # differ for is_equal, so those go item by item.
+    if isinstance(b, TypedArray) and a.typecode == b.typecode:
+        return array.array.__eq__(a, b)
+    return _sequence_equal(a, b, stack)
+
+
+_EQUALITY_DISPATCH[TypedArray] = _typed_array_equal
+
+
+_MUTABLE_ARRAY_TYPES = (list, LazyRange, TypedArray)
+
+
+# --- Persistent collections ---
+#
+# Immutable vector and map with structural sharing: an update copies only the
+# path to the changed slot (at most ~log32(n) small nodes), so building up a
+# state object or array one update at a time no longer copies the whole value
+# on every step. Nodes are plain lists that are never mutated once shared.
+
+_TRIE_BITS = 5
+_TRIE_WIDTH = 1 << _TRIE_BITS
+_TRIE_MASK = _TRIE_WIDTH - 1
+
+
+def _trie_new_path(level: int, node: List) -> List:
+    while level:
+        node = [node]
+        level -= _TRIE_BITS
+    return node
+
+
+def _trie_push_tail(count: int, level: int, parent: List, tail: List) -> List:
+    """Copy of parent with the full tail node placed at the end of its subtree."""
+    index = ((count - 1) >> level) & _TRIE_MASK
+    node = list(parent)
+    if level == _TRIE_BITS:
+        child = tail
+    elif index < len(parent):
+        child = _trie_push_tail(count, level - _TRIE_BITS, parent[index], tail)
+    else:
+        child = _trie_new_path(level - _TRIE_BITS, tail)
+    if index < len(node):
+        node[index] = child
+    else:
+        node.append(child)
+    return node
+
+
+def _trie_pop_tail(count: int, level: int, node: List) -> Optional[List]:
+    """Copy of node without its last leaf, or None if that leaves it empty."""
+    index = ((count - 2) >> level) & _TRIE_MASK
+    if level > _TRIE_BITS:
+        child = _trie_pop_tail(count, level - _TRIE_BITS, node[index])
+        if child is None:
+            return node[:index] or None
+        copy = list(node)
+        copy[index] = child
+        return copy
+    return node[:index] or None
+
+
+def _trie_assoc(level: int, node: List, index: int, value) -> List:
+    copy = list(node)
+    if level == 0:
+        copy[index & _TRIE_MASK] = value
+    else:
+        slot = (index >> level) & _TRIE_MASK
+        copy[slot] = _trie_assoc(level - _TRIE_BITS, node[slot], index, value)
+    return copy
+
+
+class PersistentVector(_MimoSequence):
+    """Immutable Mimo array backed by a bit-partitioned trie (as in Clojure).
+
+    Items live in leaves of 32 under a tree of 32-way nodes, with the last
+    partial leaf kept apart as the tail. Indexing and assoc walk at most
+    log32(n) levels; push and pop are amortized O(1). Updates return a new
+    vector that shares every untouched node with the original.
+    """
+    __slots__ = ('_count', '_shift', '_root', '_tail')
+
+    def __init__(self, items=()):
+        items = items if isinstance(items, list) else list(items)
+        count = len(items)
+        tail_offset = ((count - 1) >> _TRIE_BITS) << _TRIE_BITS if count else 0
+        nodes = [items[i:i + _TRIE_WIDTH] for i in range(0, tail_offset, _TRIE_WIDTH)]
+        shift = _TRIE_BITS
+        while len(nodes) > _TRIE_WIDTH:
+            nodes = [nodes[i:i + _TRIE_WIDTH] for i in range(0, len(nodes), _TRIE_WIDTH)]
+            shift += _TRIE_BITS
+        self._count = count
+        self._shift = shift
+        self._root = nodes
+        self._tail = items[tail_offset:]
+
+    @classmethod
+    def _make(cls, count: int, shift: int, root: List, tail: List) -> 'PersistentVector':
+        vector = object.__new__(cls)
+        vector._count = count
+        vector._shift = shift
+        vector._root = root
+        vector._tail = tail
+        return vector
+
+    def _tail_offset(self) -> int:
+        return self._count - len(self._tail)
+
+    def _leaf_for(self, index: int) -> List:
+        if index >= self._count - len(self._tail):
+            return self._tail
+        node = self._root
+        level = self._shift
+        while level:
+            node = node[(index >> level) & _TRIE_MASK]
+            level -= _TRIE_BITS
+        return node
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PersistentVector(itertools.islice(self, *index.indices(self._count)))
+        count = self._count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("vector index out of range")
+        return self._leaf_for(index)[index & _TRIE_MASK]
+
+    def __iter__(self):
+        stack = [iter(self._root)]
+        level = self._shift
+        # Depth-first over the tree, yielding whole leaves, then the tail.
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                level += _TRIE_BITS
+            elif level == _TRIE_BITS:
+                yield from node
+            else:
+                stack.append(iter(node))
+                level -= _TRIE_BITS
+        yield from self._tail
+
+    def __reversed__(self):
+        for i in range(self._count - 1, -1, -1):
+            yield self[i]
+
+    def index(self, value, start: int = 0, stop: Optional[int] = None) -> int:
+        # Negative or out-of-range bounds are clamped as list.index does.
+        start, stop, _ = slice(start, stop).indices(self._count)
+        for i, item in enumerate(itertools.islice(self, start, stop), start):
+            if item is value or item == value:
+                return i
+        raise ValueError(f"{value!r} is not in vector")
+
+    def count(self, value) -> int:
+        return sum(1 for item in self if item is value or item == value)
+
+    def assoc(self, index: int, value) -> 'PersistentVector':
+        """New vector with item index replaced; index == len appends."""
+        count = self._count
+        if index < 0:
+            index += count
+        if index == count:
+            return self.push(value)
+        if not 0 <= index < count:
+            raise IndexError("vector index out of range")
+        tail_offset = count - len(self._tail)
+        if index >= tail_offset:
+            tail = list(self._tail)
+            tail[index - tail_offset] = value
+            return PersistentVector._make(count, self._shift, self._root, tail)
+        root = _trie_assoc(self._shift, self._root, index, value)
+        return PersistentVector._make(count, self._shift, root, self._tail)
+
+    def push(self, value) -> 'PersistentVector':
+        """New vector with value appended."""
+        count = self._count
+        if len(self._tail) < _TRIE_WIDTH:
+            return PersistentVector._make(count + 1, self._shift, self._root, self._tail + [value])
+        shift = self._shift
+        if (count >> _TRIE_BITS) > (1 << shift):
+            root = [self._root, _trie_new_path(shift, self._tail)]
+            shift += _TRIE_BITS
+        else:
+            root = _trie_push_tail(count, shift, self._root, self._tail)
+        return PersistentVector._make(count + 1, shift, root, [value])
+
+    def extend(self, items) -> 'PersistentVector':
+        """New vector with items appended."""
+        vector = self
+        for item in items:
+            vector = vector.push(item)
+        return vector
+
+    def pop(self) -> 'PersistentVector':
+        """New vector without the last item."""
+        count = self._count
+        if count == 0:
+            raise IndexError("pop from empty vector")
+        if count == 1:
+            return _EMPTY_VECTOR
+        if len(self._tail) > 1:
+            return PersistentVector._make(count - 1, self._shift, self._root, self._tail[:-1])
+        tail = self._leaf_for(count - 2)
+        shift = self._shift
+        root = _trie_pop_tail(count, shift, self._root) or []
+        if shift > _TRIE_BITS and len(root) == 1:
+            root = root[0]
+            shift -= _TRIE_BITS
+        return PersistentVector._make(count - 1, shift, root, tail)
+
+    def __copy__(self) -> 'PersistentVector':
+        return self
+
+    def __deepcopy__(self, memo) -> 'PersistentVector':
+        return self
+
+    def __reduce__(self):
+        return (PersistentVector, (list(self),))
+
+    def __repr__(self):
+        return f"PersistentVector({list(self)!r})"
+
+
+_EMPTY_VECTOR = PersistentVector()
+
+
+class _HamtNode:
+    """HAMT branch: a 32-bit bitmap of occupied slots and their entries in order.
+
+    An entry is a (key, value, position) leaf tuple, a child _HamtNode, or a
+    _HamtCollision for keys whose hashes are identical.
+    """
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap: int, entries: List):
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _HamtCollision:
+    __slots__ = ('hash', 'entries')
+
+    def __init__(self, hash_: int, entries: List):
+        self.hash = hash_
+        self.entries = entries
+
+
+_HASH_MASK = (1 << 64) - 1
+# int.bit_count is Python 3.10+.
+_popcount = getattr(int, 'bit_count', None) or (lambda x: bin(x).count('1'))
+
+
+def _hamt_hash(key) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _hamt_find(node, h: int, key):
+    """The leaf tuple for key, or None."""
+    popcount = _popcount
+    while type(node) is _HamtNode:
+        bit = 1 << (h & 31)
+        bitmap = node.bitmap
+        if not bitmap & bit:
+            return None
+        node = node.entries[popcount(bitmap & (bit - 1))]
+        if type(node) is tuple:
+            k = node[0]
+            return node if k is key or k == key else None
+        h >>= 5
+    for leaf in node.entries:
+        if leaf[0] == key:
+            return leaf
+    return None
+
+
+def _hamt_pair(shift: int, leaf_a: tuple, hash_a: int, leaf_b: tuple, hash_b: int):
+    """Smallest subtree holding two leaves whose hashes agree below shift."""
+    if shift >= 64:
+        return _HamtCollision(hash_a, [leaf_a, leaf_b])
+    slot_a = (hash_a >> shift) & _TRIE_MASK
+    slot_b = (hash_b >> shift) & _TRIE_MASK
+    if slot_a == slot_b:
+        return _HamtNode(1 << slot_a, [_hamt_pair(shift + _TRIE_BITS, leaf_a, hash_a, leaf_b, hash_b)])
+    entries = [leaf_a, leaf_b] if slot_a < slot_b else [leaf_b, leaf_a]
+    return _HamtNode((1 << slot_a) | (1 << slot_b), entries)
+
+
+def _hamt_assoc(node, shift: int, h: int, leaf: tuple):
+    """Copy of node with leaf stored under its key (replacing any leaf for that key)."""
+    key = leaf[0]
+    if type(node) is _HamtCollision:
+        entries = list(node.entries)
+        for i, old in enumerate(entries):
+            if old[0] == key:
+                entries[i] = leaf
+                break
+        else:
+            entries.append(leaf)
+        return _HamtCollision(node.hash, entries)
+    bit = 1 << ((h >> shift) & _TRIE_MASK)
+    bitmap = node.bitmap
+    index = _popcount(bitmap & (bit - 1))
+    entries = list(node.entries)
+    if not bitmap & bit:
+        entries.insert(index, leaf)
+        return _HamtNode(bitmap | bit, entries)
+    entry = entries[index]
+    if type(entry) is tuple:
+        k = entry[0]
+        if k is key or k == key:
+            entries[index] = leaf
+        else:
+            entries[index] = _hamt_pair(shift + _TRIE_BITS, entry, _hamt_hash(k), leaf, h)
+    else:
+        entries[index] = _hamt_assoc(entry, shift + _TRIE_BITS, h, leaf)
+    return _HamtNode(bitmap, entries)
+
+
+def _hamt_dissoc(node, shift: int, h: int, key):
+    """Copy of node without key: a node, a lone leaf to inline in the parent, or None if empty."""
+    if type(node) is _HamtCollision:
+        entries = [leaf for leaf in node.entries if leaf[0] != key]
+        return entries[0] if len(entries) == 1 else _HamtCollision(node.hash, entries)
+    bit = 1 << ((h >> shift) & _TRIE_MASK)
+    bitmap = node.bitmap
+    index = _popcount(bitmap & (bit - 1))
+    entry = node.entries[index]
+    if type(entry) is tuple:
+        replacement = None
+    else:
+        replacement = _hamt_dissoc(entry, shift + _TRIE_BITS, h, key)
+    entries = list(node.entries)
+    if replacement is None:
+        del entries[index]
+        bitmap &= ~bit
+        if not entries:
+            return None
+        if len(entries) == 1 and type(entries[0]) is tuple and shift:
+            return entries[0]
+    else:
+        entries[index] = replacement
+    return _HamtNode(bitmap, entries)
+
+
+_EMPTY_HAMT = _HamtNode(0, [])
+
+
+class PersistentMap(_MimoMapping):
+    """Immutable Mimo object backed by a hash array mapped trie (HAMT).
+
+    Lookups and updates walk at most one 32-way node per 5 bits of the key's
+    hash, and an update copies only that path. Like dicts, maps iterate in
+    insertion order: each (key, value, position) leaf is also kept at its
+    position in a PersistentVector, and removed keys leave a None hole there
+    until the holes outnumber the live keys.
+    """
+    __slots__ = ('_root', '_order', '_size')
+
+    def __init__(self, entries=None):
+        self._root = _EMPTY_HAMT
+        self._order = _EMPTY_VECTOR
+        self._size = 0
+        if entries is not None:
+            pairs = entries.items() if isinstance(entries, _OBJECT_TYPES) else entries
+            result = self
+            for key, value in pairs:
+                result = result.assoc(key, value)
+            self._root, self._order, self._size = result._root, result._order, result._size
+
+    @classmethod
+    def _make(cls, root, order: PersistentVector, size: int) -> 'PersistentMap':
+        result = object.__new__(cls)
+        result._root = root
+        result._order = order
+        result._size = size
+        return result
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key) -> bool:
+        return _hamt_find(self._root, _hamt_hash(key), key) is not None
+
+    def __getitem__(self, key):
+        leaf = _hamt_find(self._root, _hamt_hash(key), key)
+        if leaf is None:
+            raise KeyError(key)
+        return leaf[1]
+
+    def get(self, key, default=None):
+        leaf = _hamt_find(self._root, _hamt_hash(key), key)
+        return default if leaf is None else leaf[1]
+
+    def __iter__(self):
+        for leaf in self._order:
+            if leaf is not None:
+                yield leaf[0]
+
+    def keys(self) -> List:
+        return [leaf[0] for leaf in self._order if leaf is not None]
+
+    def values(self) -> List:
+        return [leaf[1] for leaf in self._order if leaf is not None]
+
+    def items(self) -> List:
+        return [leaf[:2] for leaf in self._order if leaf is not None]
+
+    def assoc(self, key, value) -> 'PersistentMap':
+        """New map with key set to value; an existing key keeps its position."""
+        h = _hamt_hash(key)
+        found = _hamt_find(self._root, h, key)
+        order = self._order
+        if found is not None:
+            if found[1] is value:
+                return self
+            position = found[2]
+            leaf = (key, value, position)
+            return PersistentMap._make(_hamt_assoc(self._root, 0, h, leaf),
+                                       order.assoc(position, leaf), self._size)
+        leaf = (key, value, len(order))
+        return PersistentMap._make(_hamt_assoc(self._root, 0, h, leaf), order.push(leaf), self._size + 1)
+
+    def dissoc(self, key) -> 'PersistentMap':
+        """New map without key."""
+        h = _hamt_hash(key)
+        found = _hamt_find(self._root, h, key)
+        if found is None:
+            return self
+        size = self._size - 1
+        if not size:
+            return _EMPTY_MAP
+        root = _hamt_dissoc(self._root, 0, h, key)
+        order = self._order
+        position = found[2]
+        order = order.pop() if position == len(order) - 1 else order.assoc(position, None)
+        if len(order) > 2 * size + _TRIE_WIDTH:
+            # Rebuild to drop the holes left by removed keys.
+            return PersistentMap(leaf[:2] for leaf in order if leaf is not None)
+        return PersistentMap._make(root, order, size)
+
+    def update(self, entries) -> 'PersistentMap':
+        """New map with every (key, value) of entries (an object or pairs) set."""
+        result = self
+        pairs = entries.items() if isinstance(entries, _OBJECT_TYPES) else entries
+        for key, value in pairs:
+            result = result.assoc(key, value)
+        return result
+
+    def __copy__(self) -> 'PersistentMap':
+        return self
+
+    def __deepcopy__(self, memo) -> 'PersistentMap':
+        return self
+
+    def __reduce__(self):
+        return (PersistentMap, (self.items(),))
+
+    def __repr__(self):
+        return f"PersistentMap({dict(self.items())!r})"
+
+
+_EMPTY_MAP = PersistentMap()
+_PERSISTENT_TYPES = (PersistentVector, PersistentMap)
+
+
+# Comparator bodies that have an exact key-function equivalent:
+# (expression, reverse, name the field getter is read from, or None).
+_COMPARATOR_FORMS = (
+    ("a - b", False, None),
+    ("b - a", True, None),
+    ("__mimo_get(a, '') - __mimo_get(b, '')", False, '__mimo_get'),
+    ("__mimo_get(b, '') - __mimo_get(a, '')", True, '__mimo_get'),
+    ("mimo.get(a, '') - mimo.get(b, '')", False, 'mimo'),
+    ("mimo.get(b, '') - mimo.get(a, '')", True, 'mimo'),
+)
+
+
+def _compile_comparator_shapes():
+    """Compile reference lambdas for _COMPARATOR_FORMS to match candidates by bytecode.
+
+    Each form is compiled twice: as in generated code, where `mimo` comes from
+    an import (which changes the bytecode for `mimo.get`), and without it.
+    """
+    shapes = []
+    for header in ("from mimo_runtime import mimo\n", ""):
+        for expr, reverse, getter in _COMPARATOR_FORMS:
+            module = compile(f"{header}(lambda a, b: {expr})", "<comparator>", "exec")
+            code = next(c for c in module.co_consts if hasattr(c, 'co_code'))
+            shapes.append((code, reverse, getter))
+    return tuple(shapes)
+
+
+_COMPARATOR_SHAPES = _compile_comparator_shapes()
+
+
+def _comparator_getter(callback: Callable, name: str):
+    """The runtime's get() as seen by callback through the global `name`, else None."""
+    found = callback.__globals__.get(name)
+    if name == 'mimo':
+        return found.get if isinstance(found, MimoRuntime) else None
+    # Under MIMO_PROFILE both names refer to the same profiling wrapper.
+    return found if found is get else None
+
+
+def _comparator_as_key(callback: Callable):
+    """Recognise `a - b`-style comparators and return an equivalent (key, reverse), else None."""
+    code = getattr(callback, '__code__', None)
+    if code is None or code.co_nlocals != 2 or code.co_argcount != 2 or callback.__defaults__:
+        return None
+    for ref, reverse, getter in _COMPARATOR_SHAPES:
+        if code.co_code != ref.co_code or code.co_names != ref.co_names:
+            continue
+        if getter is None:
+            return None, reverse
+        field_get = _comparator_getter(callback, getter)
+        field = code.co_consts[-1]
+        if field_get is not None and isinstance(field, str) and len(code.co_consts) == len(ref.co_consts):
+            return (lambda item: field_get(item, field)), reverse
+    return None
+
+
+def _plain_numbers(values: List) -> bool:
+    """True when every value is an int or a non-NaN float.
+
+    Only then does sorting by the value order items exactly as an `a - b`
+    comparator would; strings, NaN and the like keep the comparator (and its
+    errors).
+    """
+    types = set(map(type, values))
+    if not types <= {int, float}:
+        return False
+    return float not in types or all(value == value for value in values)
+
+
+DEFAULT_NUMPY_MIN_SIZE = 100_000
+_INT64_LIMIT = 1 << 63
+# array.array type codes NumPy can view without copying.
+_BUFFER_TYPECODES = frozenset('bBhHiIlLqQfd')
+
+
+def _numpy_min_size() -> Optional[int]:
+    size = _env_int('MIMO_NUMPY_MIN_SIZE')
+    return DEFAULT_NUMPY_MIN_SIZE if size is None else size
+
+
+_numpy_threshold = _numpy_min_size()
+_numpy_module = None
+
+
+def _numpy_views(*arrays):
+    """NumPy views of buffer-backed operands, or None to use the pure-Python path.
+
+    Only numpy arrays and array.array values (including TypedArray) qualify,
+    and only at or above MIMO_NUMPY_MIN_SIZE elements (0 disables NumPy):
+    copying a list into NumPy costs more than the builtins save. Views are
+    int64 or float64, upcast from narrower kinds. NumPy is imported on first
+    use.
+    """
+    global _numpy_module
+    if not _numpy_threshold or len(arrays[0]) < _numpy_threshold:
+        return None
+    for value in arrays:
+        if type(value).__module__ != 'numpy' and not (
+                isinstance(value, array.array) and value.typecode in _BUFFER_TYPECODES):
+            return None
+    if _numpy_module is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy_module = numpy
+    if not _numpy_module:
+        return None
+    numpy = _numpy_module
+    views = []
+    for value in arrays:
+        view = numpy.asarray(value)
+        kind = view.dtype.kind
+        if view.ndim != 1 or kind not in 'iuf':
+            return None
+        # Compute in int64 / float64 like the Python path: narrower dtypes
+        # would wrap around (int8) or accumulate in float32.
+        if kind == 'f':
+            if view.dtype != numpy.float64:
+                view = view.astype(numpy.float64)
+        elif view.dtype != numpy.int64:
+            if kind == 'u' and view.dtype.itemsize == 8 and len(view) and int(view.max()) >= _INT64_LIMIT:
+                return None
+            view = view.astype(numpy.int64)
+        views.append(view)
+    return views
+
+
+def _int_bound(view) -> int:
+    """Largest absolute value in an integer view, as a Python int (0 for floats)."""
+    if view.dtype.kind == 'f' or not len(view):
+        return 0
+    return max(abs(int(view.min())), abs(int(view.max())))
+
+
+def _exact_in_numpy(views, bound: int) -> bool:
+    """True when integer results stay below int64 overflow; floats always qualify."""
+    return all(view.dtype.kind == 'f' for view in views) or bound < _INT64_LIMIT
+
+
+def _check_lengths(name: str, a, b) -> None:
+    if len(a) != len(b):
+        raise Exception(f"array.{name}: arrays have different lengths ({len(a)} and {len(b)})")
+
+
+def _numeric_sum(values):
+    """Exact integer sum, or the correctly rounded math.fsum once any float is involved."""
+    if isinstance(values, array.array):
+        return math.fsum(values) if values and values.typecode in 'fd' else sum(values)
+    total = sum(values)
+    if type(total) is float:
+        return math.fsum(values)
+    return total
+
+
+def _elementwise(name: str, op: Callable, a, b) -> List:
+    """Apply op pairwise (or against a scalar b) and return a list."""
+    if isinstance(b, (int, float)):
+        views = _numpy_views(a)
+        if views is not None:
+            bound = _int_bound(views[0])
+            bound = bound + abs(b) if op is operator.add else bound * abs(b)
+            if isinstance(b, int) and _exact_in_numpy(views, bound):
+                return op(views[0], b).tolist()
+            if isinstance(b, float):
+                return op(views[0], b).tolist()
+        return list(map(op, a, itertools.repeat(b, len(a))))
+    _check_lengths(name, a, b)
+    views = _numpy_views(a, b)
+    if views is not None:
+        x, y = views
+        bound = _int_bound(x) + _int_bound(y) if op is operator.add else _int_bound(x) * _int_bound(y)
+        if _exact_in_numpy(views, bound):
+            return op(x, y).tolist()
+    return list(map(op, a, b))
+
+
+def _map_chunk(callback: Callable, chunk: List) -> List:
+    return [callback(item) for item in chunk]
+
+
+def _filter_chunk(callback: Callable, chunk: List) -> List[bool]:
+    # Only the verdicts travel back from worker processes, not the items.
+    return [bool(callback(item)) for item in chunk]
+
+
+def _process_pool(name: str, callback: Callable, workers: int):
+    """A fork-based process pool for callback, or None where fork is unavailable.
+
+    Workers are forked per call so they see the program's current globals.
+    Generated code runs its statements at module level, so spawn-started
+    workers would re-run the whole program; without fork, callers use threads.
+    """
+    import multiprocessing
+    import concurrent.futures.process
+    try:
+        pickle.dumps(callback)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        label = getattr(callback, '__name__', type(callback).__name__)
+        raise Exception(f"array.{name}: callback {label} cannot be sent to worker processes ({str(e)}). "
+                        f"Pass a named top-level function, or use mode 'thread'")
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    return concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                  mp_context=multiprocessing.get_context('fork'))
+
+
+def _run_chunked(name: str, runner: Callable, callback: Callable, items, workers: Optional[int],
+                 chunk_size: Optional[int], mode: str) -> List[List]:
+    """Run runner(callback, chunk) over chunks of items in a pool; results in input order."""
+    if mode not in ('process', 'thread'):
+        raise Exception(f"array.{name}: unknown mode '{mode}', expected 'process' or 'thread'")
+    items = items if isinstance(items, (list, tuple)) else list(items)
+    workers = workers or os.cpu_count() or 1
+    if not chunk_size:
+        # A few chunks per worker balances uneven callbacks against per-chunk IPC.
+        chunk_size = max(1, -(-len(items) // (workers * 4)))
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        return [runner(callback, chunk) for chunk in chunks]
+    workers = min(workers, len(chunks))
+    executor = _process_pool(name, callback, workers) if mode == 'process' else None
+    if executor is None:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    with executor:
+        try:
+            return list(executor.map(runner, itertools.repeat(callback), chunks))
+        except (pickle.PicklingError, TypeError, AttributeError,
+                concurrent.futures.BrokenExecutor) as e:
+            # Items or results that cannot cross the process boundary surface as
+            # TypeError/AttributeError too; errors from the callback itself propagate unchanged.
+            broken = isinstance(e, (pickle.PicklingError, concurrent.futures.BrokenExecutor))
+            if mode == 'thread' or not (broken or 'pickle' in str(e)):
+                raise
+            raise Exception(f"array.{name}: worker processes failed ({str(e)}); items and results must be "
+                            f"picklable, or use mode 'thread'")
+
+
+def _group_tag(key):
+    """Type-tagged dict key for grouping: keys share a group only when they are
+    the same Mimo value, so true, 1 and "1", or [1, 2] and "[1, 2]", stay apart.
+    """
+    t = type(key)
+    if t is str or t is int:
+        return key
+    if t is float:
+        return int(key) if key.is_integer() else key
+    try:
+        return _canonical_key(key)
+    except TypeError:
+        return (object, stringify(key))
+
+
+class _GroupLabel(str):
+    """Result key of a group whose key is not a string, number or null.
+
+    A str of the key's Mimo form (so it prints, concatenates and serializes
+    like a JS object key), but equal and hashed by the group's tag: the
+    boolean true's group does not overwrite the string "true"'s group.
+    """
+
+    def __new__(cls, text: str, tag):
+        label = str.__new__(cls, text)
+        label.tag = tag
+        return label
+
+    def __eq__(self, other):
+        return type(other) is _GroupLabel and self.tag == other.tag
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.tag)
+
+    def __reduce__(self):
+        return (_GroupLabel, (str(self), self.tag))
+
+
+def _group_label(key, tag):
+    """The result key for the group tagged tag whose first key was key."""
+    if key is None or type(key) in (str, int, float):
+        return key
+    return _GroupLabel(stringify(key), tag)
+
+
+_AGGREGATE_OPS = ('sum', 'min', 'max', 'count', 'mean')
+
+
+def _aggregate_by(array, key_fn: Callable, spec: Dict) -> Dict:
+    """Single pass of array.aggregate_by; see its docstring."""
+    fields = list(spec.items())
+    for field, op in fields:
+        if op not in _AGGREGATE_OPS:
+            raise Exception(f"aggregate_by: unknown operation '{op}' for field '{field}', "
+                            f"expected one of: {', '.join(_AGGREGATE_OPS)}")
+    plan = tuple(enumerate(fields))
+    width = len(fields)
+    # Per group: [values (running total, min or max), counts of non-null values].
+    states = {}
+    for item in array:
+        key = key_fn(item)
+        t = type(key)
+        tag = key if t is str or t is int else _group_tag(key)
+        state = states.get(tag)
+        if state is None:
+            state = states[tag] = [key, [None] * width, [0] * width]
+        _, values, counts = state
+        is_dict = type(item) is dict
+        for i, (field, op) in plan:
+            value = item.get(field) if is_dict else get(item, field)
+            if value is None:
+                continue
+            counts[i] += 1
+            if op == 'count':
+                continue
+            current = values[i]
+            if current is None:
+                values[i] = value
+            elif op == 'min':
+                if value < current:
+                    values[i] = value
+            elif op == 'max':
+                if value > current:
+                    values[i] = value
+            else:
+                values[i] = current + value
+    result = {}
+    for tag, (key, values, counts) in states.items():
+        row = result[_group_label(key, tag)] = {}
+        for i, (field, op) in plan:
+            if op == 'count':
+                row[field] = counts[i]
+            elif op == 'sum':
+                row[field] = 0 if values[i] is None else values[i]
+            elif op == 'mean':
+                row[field] = values[i] / counts[i] if counts[i] else None
+            else:
+                row[field] = values[i]
+    return result
+
+
+# datetime.format tokens, matched in one left-to-right pass, and the index of
+# the field each one prints in (year, month, day, hour, minute, second).
+_DATETIME_TOKENS = {'YYYY': 0, 'MM': 1, 'DD': 2, 'hh': 3, 'mm': 4, 'ss': 5}
+_DATETIME_TOKEN_RE = re.compile('|'.join(_DATETIME_TOKENS))
+
+
+class _DateTimeFormat:
+    """A datetime.format string compiled once into a %-format program.
+
+    Literal text is copied as is and each token becomes a %d conversion, so
+    formatting is a single C-level `pattern % fields` call.
+    """
+    __slots__ = ('fmt', 'pattern', 'pick', 'tokens', '_regex')
+
+    def __init__(self, fmt: str):
+        self.fmt = fmt
+        parts = []
+        tokens = []
+        end = 0
+        for m in _DATETIME_TOKEN_RE.finditer(fmt):
+            parts.append(fmt[end:m.start()].replace('%', '%%'))
+            token = m.group()
+            parts.append('%d' if token == 'YYYY' else '%02d')
+            tokens.append(token)
+            end = m.end()
+        parts.append(fmt[end:].replace('%', '%%'))
+        self.pattern = ''.join(parts)
+        self.tokens = tuple(tokens)
+        fields = [_DATETIME_TOKENS[t] for t in tokens]
+        # itemgetter returns a bare value for one index; % accepts that too.
+        self.pick = operator.itemgetter(*fields) if fields else None
+        self._regex = None
+
+    def format_fields(self, fields) -> str:
+        """Format a (year, month, day, hour, minute, second, ...) tuple."""
+        pick = self.pick
+        return self.pattern % pick(fields) if pick is not None else self.fmt
+
+    def format_datetime(self, dt) -> str:
+        pick = self.pick
+        if pick is None:
+            return self.fmt
+        return self.pattern % pick((dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second))
+
+    def regex(self) -> re.Pattern:
+        """Pattern for parse(): four digits for YYYY, two for the other tokens."""
+        if self._regex is None:
+            parts = []
+            end = 0
+            for m in _DATETIME_TOKEN_RE.finditer(self.fmt):
+                parts.append(re.escape(self.fmt[end:m.start()]))
+                parts.append(r'(\d{4})' if m.group() == 'YYYY' else r'(\d{2})')
+                end = m.end()
+            parts.append(re.escape(self.fmt[end:]))
+            self._regex = re.compile(''.join(parts))
+        return self._regex
+
+
+@functools.lru_cache(maxsize=256)
+def _datetime_format(fmt: str) -> _DateTimeFormat:
+    return _DateTimeFormat(fmt)
+
+
+def _epoch_fields(ms):
+    """Local (year, month, day, hour, minute, second) of epoch milliseconds, without a datetime."""
+    try:
+        return time.localtime(ms // 1000)[:6]
+    except (OverflowError, OSError, ValueError) as e:
+        raise Exception(f"Failed to format timestamp {ms}: {str(e)}")
+
+
+def _format_many(values, fmt: str) -> List[str]:
+    program = _datetime_format(fmt)
+    format_datetime = program.format_datetime
+    format_fields = program.format_fields
+    datetime_type = datetime.datetime
+    result = []
+    append = result.append
+    # Log timestamps arrive in runs within the same second: reuse its fields.
+    last_second = None
+    fields = None
+    for value in values:
+        t = type(value)
+        if t is int or t is float:
+            second = value // 1000
+            if second != last_second:
+                fields = _epoch_fields(value)
+                last_second = second
+            append(format_fields(fields))
+        elif isinstance(value, datetime_type):
+            append(format_datetime(value))
+        else:
+            append("")
+    return result
+
+
+def _parse_datetime(text: str, fmt: str):
+    program = _datetime_format(fmt)
+    m = program.regex().fullmatch(text) if isinstance(text, str) else None
+    if m is None:
+        raise Exception(f"Failed to parse '{text}' with format '{fmt}'")
+    # Fields the format leaves out default to 1970-01-01 00:00:00.
+    fields = [1970, 1, 1, 0, 0, 0]
+    for token, digits in zip(program.tokens, m.groups()):
+        fields[_DATETIME_TOKENS[token]] = int(digits)
+    try:
+        return datetime.datetime(*fields)
+    except ValueError as e:
+        raise Exception(f"Failed to parse '{text}' with format '{fmt}': {str(e)}")
+
+
+def _json_default(value):
+    """json.dumps hook for runtime values that have no JSON mapping of their own.
+
+    Arrays of any runtime type become JSON arrays and dates and times become
+    ISO 8601 strings (as datetime.to_iso_string returns them), whichever
+    backend does the encoding.
+    """
+    if isinstance(value, _MimoSequence):
+        return list(value)
+    if isinstance(value, _MimoMapping):
+        return dict(value.items())
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite_floats(value):
+    """Copy of value with NaN and infinities replaced by None, as JSON.stringify writes them.
+
+    Such keys become distinct "null" labels, so none is dropped (orjson
+    writes each of them).
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, _OBJECT_TYPES):
+        return {_GroupLabel('null', k) if isinstance(k, float) and not math.isfinite(k) else k:
+                _finite_floats(v) for k, v in value.items()}
+    if isinstance(value, _ARRAY_TYPES):
+        return [_finite_floats(v) for v in value]
+    return value
+
+
+class _StdlibJSON:
+    """JSON backend on the json module, reusing one encoder per indent and one decoder.
+
+    Output matches JSON.stringify in the JS runtime: compact separators, or
+    ': ' between keys and values when indenting, and null for NaN and
+    infinities. Other floats are spelled as repr() spells them (1e+16).
+    """
+    name = 'stdlib'
+
+    def __init__(self):
+        self.decoder = json.JSONDecoder()
+        self.loads = self.decoder.decode
+        self.encoders = {}
+
+    def encoder(self, indent: Optional[int]) -> 'json.JSONEncoder':
+        encoder = self.encoders.get(indent)
+        if encoder is None:
+            encoder = json.JSONEncoder(ensure_ascii=False, default=_json_default, indent=indent,
+                                       allow_nan=False,
+                                       separators=(',', ':') if indent is None else (',', ': '))
+            self.encoders[indent] = encoder
+        return encoder
+
+    def dumps(self, obj, indent: Optional[int] = None) -> str:
+        encoder = self.encoder(indent)
+        try:
+            return encoder.encode(obj)
+        except ValueError as e:
+            if 'Out of range float' not in str(e):
+                raise
+        return encoder.encode(_finite_floats(obj))
+
+
+# Floats orjson spells differently from repr(): exponents (1e16, 2e-6) and
+# the plain 0.00001 where repr() writes 1e-05. Two searches, each starting
+# with a literal, scan far faster than one alternation; a match inside a
+# string only costs a slower encode.
+_ORJSON_EXPONENT = re.compile(rb'e(?<=[0-9]e)[-0-9]')
+_ORJSON_SMALL_FLOAT = re.compile(rb'\.0000')
+
+
+class _OrjsonJSON(_StdlibJSON):
+    """JSON backend on orjson, falling back to the stdlib for what orjson cannot do.
+
+    orjson only indents by two spaces, rejects integers wider than 64 bits
+    and spells some floats its own way; those cases go through the stdlib
+    backend, so results and error messages are byte for byte the same
+    either way.
+    """
+    name = 'orjson'
+
+    def __init__(self, orjson):
+        super().__init__()
+        self.orjson_loads = orjson.loads
+        self.orjson_dumps = orjson.dumps
+        self.decode_error = orjson.JSONDecodeError
+        self.encode_error = orjson.JSONEncodeError
+        self.options = {
+            None: orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            2: orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_INDENT_2,
+        }
+
+    def loads(self, text):
+        try:
+            return self.orjson_loads(text)
+        except self.decode_error:
+            return self.decoder.decode(text)
+
+    def dumps(self, obj, indent: Optional[int] = None) -> str:
+        option = self.options.get(indent)
+        if option is not None:
+            try:
+                out = self.orjson_dumps(obj, default=_json_default, option=option)
+            except self.encode_error:
+                pass
+            else:
+                if _ORJSON_EXPONENT.search(out) is None and _ORJSON_SMALL_FLOAT.search(out) is None:
+                    return out.decode('utf-8')
+        return super().dumps(obj, indent)
+
+
+def _make_json_backend(name: Optional[str] = None) -> _StdlibJSON:
+    """Build the named backend; 'auto' (the default) picks orjson when it is installed."""
+    name = (name or 'auto').lower()
+    if name not in ('auto', 'orjson', 'stdlib'):
+        raise Exception(f"Unknown JSON backend '{name}' (expected 'auto', 'orjson' or 'stdlib')")
+    if name != 'stdlib':
+        try:
+            import orjson
+            return _OrjsonJSON(orjson)
+        except ImportError:
+            if name == 'orjson':
+                raise Exception("JSON backend 'orjson' is not installed")
+    return _StdlibJSON()
+
+
+_json_backend = None
+
+
+def _get_json_backend() -> _StdlibJSON:
+    """The active JSON backend, built from MIMO_JSON_BACKEND on first use."""
+    global _json_backend
+    if _json_backend is None:
+        _json_backend = _make_json_backend(os.environ.get('MIMO_JSON_BACKEND'))
+    return _json_backend
+
+
+DEFAULT_FILE_BUFFER_SIZE = 64 * 1024
+_FILE_READ_ERRORS = (OSError, UnicodeDecodeError, LookupError)
+
+
+def _split_lines(f, size: int = DEFAULT_FILE_BUFFER_SIZE):
+    """Yield the lines of a text file without newlines, reading it in blocks.
+
+    Splitting whole blocks is about twice as fast as iterating the file and
+    stripping each line; a line longer than a block is joined from parts.
+    """
+    parts = []
+    for block in iter(functools.partial(f.read, size), ''):
+        if '\n' not in block:
+            parts.append(block)
+            continue
+        lines = block.split('\n')
+        if parts:
+            parts.append(lines[0])
+            lines[0] = ''.join(parts)
+            parts = []
+        parts.append(lines.pop())
+        yield from lines
+    tail = ''.join(parts)
+    if tail:
+        yield tail
+
+
+def _read_file_iter(path: str, encoding: str, errors: str, reader: Callable):
+    """Yield reader(file) for a text file, wrapping failures like FSModule does."""
+    try:
+        with open(path, 'r', encoding=encoding, errors=errors) as f:
+            yield from reader(f)
+    except _FILE_READ_ERRORS as e:
+        raise Exception(f"Failed to read file {path}: {str(e)}")
+
+
+class _FileSource:
+    """Re-iterable source over a file: every iteration reopens it from the start."""
+    __slots__ = ('path', 'encoding', 'errors', 'reader')
+
+    def __init__(self, path: str, encoding: str, errors: str, reader: Callable):
+        try:
+            open(path, 'rb').close()
+            codecs.lookup(encoding)
+        except _FILE_READ_ERRORS as e:
+            raise Exception(f"Failed to read file {path}: {str(e)}")
+        self.path = path
+        self.encoding = encoding
+        self.errors = errors
+        self.reader = reader
+
+    def __iter__(self):
+        return _read_file_iter(self.path, self.encoding, self.errors, self.reader)
+
+
+_open_writers = weakref.WeakSet()
+
+
+def _close_open_writers() -> None:
+    for writer in list(_open_writers):
+        writer.close()
+
+
+atexit.register(_close_open_writers)
+
+
+class FileWriter:
+    """Buffered text writer returned by fs.open_writer.
+
+    Writes are collected in a buffer of buffer_size bytes and written to disk
+    when it fills, on flush() and on close(). Writers that are never closed
+    are flushed and closed at interpreter exit.
+    """
+
+    def __init__(self, path: str, append: bool = False, encoding: str = 'utf-8',
+                 buffer_size: int = DEFAULT_FILE_BUFFER_SIZE):
+        self.path = path
+        try:
+            self._file = open(path, 'a' if append else 'w', encoding=encoding, buffering=buffer_size)
+        except (OSError, LookupError) as e:
+            raise Exception(f"Failed to open file {path} for writing: {str(e)}")
+        self._write = self._file.write
+        _open_writers.add(self)
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, data: str) -> None:
+        try:
+            self._write(data)
+        except (OSError, ValueError, UnicodeEncodeError) as e:
+            raise Exception(f"Failed to write file {self.path}: {str(e)}")
+
+    def write_line(self, data: str) -> None:
+        self.write(data + '\n')
+
+    def write_lines(self, lines) -> None:
+        """Write each item of an iterable (or Mimo array) followed by a newline."""
+        try:
+            self._file.writelines(line + '\n' for line in lines)
+        except (OSError, ValueError, UnicodeEncodeError) as e:
+            raise Exception(f"Failed to write file {self.path}: {str(e)}")
+
+    def flush(self) -> None:
+        try:
+            self._file.flush()
+        except (OSError, ValueError) as e:
+            raise Exception(f"Failed to write file {self.path}: {str(e)}")
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        _open_writers.discard(self)
+        try:
+            self._file.close()
+        except OSError as e:
+            raise Exception(f"Failed to write file {self.path}: {str(e)}")
+
+    def __enter__(self) -> 'FileWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self):
+        state = 'closed' if self.closed else 'open'
+        return f"<FileWriter {self.path!r} ({state})>"
+
+
+def _as_bytes(needle: Union[str, bytes], encoding: str = 'utf-8') -> bytes:
+    return needle.encode(encoding) if isinstance(needle, str) else needle
+
+
+class _Reiterable:
+    """Iterable that starts a fresh iterator from factory() on every pass."""
+    __slots__ = ('factory',)
+
+    def __init__(self, factory: Callable):
+        self.factory = factory
+
+    def __iter__(self):
+        return self.factory()
+
+
+class MappedFile:
+    """Read-only memory map of a file, returned by fs.mmap.
+
+    Searches run over the mapped bytes without copying or decoding them;
+    only slice() and text() copy, and only the requested range. Offsets are
+    byte offsets. Needles may be str (encoded as UTF-8) or bytes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                # Empty files cannot be mapped; an empty bytes object behaves the same.
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        except (OSError, ValueError) as e:
+            raise Exception(f"Failed to map file {path}: {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size(self) -> int:
+        return len(self._data)
+
+    def view(self) -> memoryview:
+        """Zero-copy memoryview over the whole file."""
+        return memoryview(self._data)
+
+    def find(self, needle: Union[str, bytes], start: int = 0, end: Optional[int] = None) -> int:
+        """Byte offset of the first occurrence of needle, or -1."""
+        return self._data.find(_as_bytes(needle), start, len(self._data) if end is None else end)
+
+    def rfind(self, needle: Union[str, bytes], start: int = 0, end: Optional[int] = None) -> int:
+        return self._data.rfind(_as_bytes(needle), start, len(self._data) if end is None else end)
+
+    def find_all(self, needle: Union[str, bytes]) -> LazySequence:
+        """Lazily yield the byte offset of every non-overlapping occurrence of needle."""
+        needle = _as_bytes(needle)
+        if not needle:
+            raise Exception(f"Failed to search file {self.path}: empty search string")
+
+        def offsets():
+            find = self._data.find
+            step = len(needle)
+            index = find(needle)
+            while index != -1:
+                yield index
+                index = find(needle, index + step)
+        return LazySequence(_Reiterable(offsets))
+
+    def count(self, needle: Union[str, bytes]) -> int:
+        """Number of non-overlapping occurrences of needle."""
+        needle = _as_bytes(needle)
+        if not needle:
+            raise Exception(f"Failed to search file {self.path}: empty search string")
+        return sum(1 for _ in self.find_all(needle))
+
+    def slice(self, start: int, end: Optional[int] = None) -> bytes:
+        """Copy of bytes [start, end)."""
+        return self._data[start:end]
+
+    def text(self, start: int = 0, end: Optional[int] = None, encoding: str = 'utf-8',
+             errors: str = 'strict') -> str:
+        """Decode bytes [start, end) only."""
+        try:
+            return str(memoryview(self._data)[start:end], encoding, errors)
+        except (UnicodeDecodeError, LookupError) as e:
+            raise Exception(f"Failed to decode file {self.path}: {str(e)}")
+
+    def record(self, index: int, size: int, encoding: str = 'utf-8') -> str:
+        """Decode the index-th fixed-size record of size bytes."""
+        start = index * size
+        if index < 0 or start + size > len(self._data):
+            raise Exception(f"Failed to read record {index} of {self.path}: out of range")
+        return self.text(start, start + size, encoding)
+
+    def line_at(self, offset: int, encoding: str = 'utf-8') -> str:
+        """Decode the line containing byte offset, without its newline."""
+        start = self._data.rfind(b'\n', 0, offset) + 1
+        end = self._data.find(b'\n', offset)
+        return self.text(start, len(self._data) if end == -1 else end, encoding)
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self) -> 'MappedFile':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self):
+        return f"<MappedFile {self.path!r} ({len(self._data)} bytes)>"
+
+
+# json.decoder.WHITESPACE, without importing json at startup.
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*', re.VERBOSE | re.MULTILINE | re.DOTALL)
+
+
+def _json_lines(source: Union[str, Any]):
+    """Re-iterable lines of a path, or the given iterable of lines as-is."""
+    if isinstance(source, str):
+        return _FileSource(source, 'utf-8', 'strict', _split_lines)
+    return source
+
+
+def _parse_json_lines(lines):
+    """Decode one JSON value per non-blank line."""
+    decode = _get_json_backend().loads
+    for number, line in enumerate(lines, 1):
+        if not line or line.isspace():
+            continue
+        try:
+            yield decode(line)
+        except json.JSONDecodeError as e:
+            raise Exception(f"Failed to parse JSON on line {number}: {str(e)}")
+
+
+_JSON_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+def _iter_json_array(chunks):
+    """Yield the elements of a top-level JSON array read from text chunks.
+
+    Each element is decoded with raw_decode as soon as it is complete, so
+    memory is bounded by the largest element plus one chunk. A value that
+    runs to the end of the buffer (a number split across chunks, say) is
+    only accepted once more input arrives or the input ends.
+    """
+    decode = _get_json_backend().decoder.raw_decode
+    whitespace = _JSON_WHITESPACE.match
+    chunks = iter(chunks)
+    buf = ''
+    pos = 0
+    consumed = 0
+    eof = False
+
+    def fill(need_beyond: int) -> bool:
+        # Read until at least need_beyond characters follow pos; False at end of input.
+        nonlocal buf, pos, consumed, eof
+        if eof:
+            return False
+        parts = [buf[pos:]]
+        have = len(parts[0])
+        while have <= need_beyond:
+            chunk = next(chunks, None)
+            if chunk is None:
+                eof = True
+                break
+            parts.append(chunk)
+            have += len(chunk)
+        buf = ''.join(parts)
+        consumed += pos
+        pos = 0
+        return True
+
+    def skip() -> str:
+        # Skip whitespace and return the next character ('' at end of input).
+        nonlocal pos
+        while True:
+            pos = whitespace(buf, pos).end()
+            if pos < len(buf):
+                return buf[pos]
+            if not fill(0):
+                return ''
+
+    def fail(message: str, at: int):
+        raise Exception(f"Failed to parse JSON: {message}: char {consumed + at}")
+
+    if skip() != '[':
+        fail("Expecting a top-level array", pos)
+    pos += 1
+    if skip() == ']':
+        return
+    while True:
+        skip()
+        while True:
+            try:
+                value, end = decode(buf, pos)
+                # raw_decode('1.') returns 1: a number followed by a character
+                # that could continue it may still be cut off by the chunk.
+                if eof or (end < len(buf) and not (
+                        buf[end] in _JSON_NUMBER_CHARS and type(value) in (int, float))):
+                    break
+            except json.JSONDecodeError as e:
+                if eof:
+                    fail(e.msg, e.pos)
+            # Incomplete element: at least double the lookahead before retrying.
+            if not fill(2 * (len(buf) - pos) + 1):
+                try:
+                    value, end = decode(buf, pos)
+                    break
+                except json.JSONDecodeError as e:
+                    fail(e.msg, e.pos)
+        pos = end
+        yield value
+        separator = skip()
+        pos += 1
+        if separator == ']':
+            return
+        if separator != ',':
+            fail("Expecting ',' delimiter", pos - 1)
+
+
+DEFAULT_REGEX_CACHE_SIZE = 4096
+_REGEX_FLAGS = {'i': re.IGNORECASE, 'm': re.MULTILINE, 's': re.DOTALL}
+
+
+def _parse_regex_flags(flags: str) -> int:
+    """Translate Mimo/JS regex flag letters to `re` flags; unknown letters (e.g. 'g') are ignored."""
+    re_flags = 0
+    for ch in flags or '':
+        re_flags |= _REGEX_FLAGS.get(ch, 0)
+    return re_flags
+
+
+class _RegexCache:
+    """LRU cache of compiled regex patterns keyed by (pattern, flags)."""
+
+    def __init__(self, max_size: int = DEFAULT_REGEX_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, pattern, flags: str = '') -> re.Pattern:
+        if isinstance(pattern, re.Pattern):
+            return pattern
+        key = (pattern, flags)
+        compiled = self.entries.get(key)
+        if compiled is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return compiled
+        self.misses += 1
+        compiled = re.compile(pattern, _parse_regex_flags(flags))
+        self.entries[key] = compiled
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return compiled
+
+    def info(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self.entries), 'max_size': self.max_size}
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_regex_cache = _RegexCache(_env_int('MIMO_REGEX_CACHE_SIZE') or DEFAULT_REGEX_CACHE_SIZE)
+
+
+DEFAULT_MEMOIZE_SIZE = 1024
+
+
+class _MemoStore:
+    """Entries and hit/miss counters behind one memoized function."""
+    __slots__ = ('max_size', 'ttl', 'entries', 'hits', 'misses', 'evictions')
+
+    def __init__(self, max_size: Optional[int], ttl: Optional[float]):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self) -> Dict[str, Any]:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self.entries), 'max_size': self.max_size, 'ttl': self.ttl}
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+# Every memoized function, so cache.clear() without an argument can reach them all.
+_memoized_functions = weakref.WeakSet()
+
+
+def _memoize(fn: Callable, max_size: Optional[int], ttl: Optional[float]) -> Callable:
+    """Wrap fn with an LRU (and optionally time-limited) result cache.
+
+    Arguments are keyed by _canonical_key, so structurally equal arrays and
+    objects share an entry; calls with arguments that have no canonical key
+    are passed straight through. Results are only cached on normal return.
+    """
+    if not callable(fn):
+        raise Exception(f"cache.memoize expects a function, got {type(fn).__name__}")
+    if max_size is not None and max_size <= 0:
+        raise Exception(f"cache.memoize: max_size must be positive, got {max_size}")
+    if ttl is not None and ttl <= 0:
+        raise Exception(f"cache.memoize: ttl must be positive, got {ttl}")
+    store = _MemoStore(max_size, ttl)
+    entries = store.entries
+    lookup = entries.get
+    touch = entries.move_to_end if max_size is not None else None
+    canonical = _canonical_key
+    clock = time.monotonic
+    missing = object()
+
+    @functools.wraps(fn)
+    def memoized(*args):
+        try:
+            if len(args) == 1:
+                # Single-argument keys skip the outer tuple; a canonical key is
+                # never a type object, so they cannot equal a multi-argument key.
+                arg = args[0]
+                t = type(arg)
+                key = arg if t is str else (t, arg) if t is int or t is float else canonical(arg)
+            else:
+                key = tuple(map(canonical, args))
+        except TypeError:
+            store.misses += 1
+            return fn(*args)
+        entry = lookup(key, missing)
+        if entry is not missing:
+            if ttl is None:
+                store.hits += 1
+                if touch is not None:
+                    touch(key)
+                return entry
+            value, expires = entry
+            if clock() < expires:
+                store.hits += 1
+                if touch is not None:
+                    touch(key)
+                return value
+            entries.pop(key, None)
+        store.misses += 1
+        value = fn(*args)
+        entries[key] = value if ttl is None else (value, clock() + ttl)
+        if max_size is not None and len(entries) > max_size:
+            entries.popitem(last=False)
+            store.evictions += 1
         return value
-    if isinstance(value, (list, tuple)):
-        elements = [stringify(v) for v in value]
-        return f"[{', '.join(elements)}]"
-    if isinstance(value, dict):
-        pairs = [f"{k}: {stringify(v)}" for k, v in value.items()]
-        return f"{{{', '.join(pairs)}}}"
-    if isinstance(value, datetime.datetime):
-        return f"datetime({value.isoformat()})"
-    return str(value)
+
+    memoized.cache_info = store.info
+    memoized.cache_clear = store.clear
+    _memoized_functions.add(memoized)
+    return memoized
+
+
+DEFAULT_HTTP_TIMEOUT = 30.0
+DEFAULT_HTTP_RETRIES = 2
+_HTTP_REDIRECTS = (301, 302, 303, 307, 308)
+_HTTP_MAX_REDIRECTS = 10
+
+
+class HTTPStatusError(Exception):
+    """Raised for HTTP responses with a 4xx/5xx status."""
+
+    def __init__(self, status: int, reason: str, body: bytes = b''):
+        super().__init__(f"HTTP Error {status}: {reason}")
+        self.status = status
+        self.reason = reason
+        self.body = body
+
+
+def _content_decoder(response):
+    """A zlib decompressor for the response's Content-Encoding, or None."""
+    encoding = (response.getheader('Content-Encoding') or '').lower()
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == 'deflate':
+        return zlib.decompressobj()
+    return None
+
+
+class _HTTPPool:
+    """Per-host pool of persistent http.client connections.
+
+    Idle keep-alive connections are reused for later requests to the same
+    scheme/host/port. Requests that fail on a reused connection the server
+    has since closed are resent on a fresh one; GET requests are also retried
+    up to `retries` times on network errors. Redirects are followed and
+    gzip/deflate response bodies are decoded. URLs with other schemes, or
+    when a proxy is configured, go through urllib instead.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_HTTP_TIMEOUT, retries: int = DEFAULT_HTTP_RETRIES,
+                 max_idle_per_host: int = 8):
+        self.timeout = timeout
+        self.retries = retries
+        self.max_idle_per_host = max_idle_per_host
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._proxies = None
+
+    def _acquire(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, netloc = key
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout), False
+        return http.client.HTTPConnection(netloc, timeout=self.timeout), False
+
+    def _release(self, key, conn, response, max_idle: Optional[int] = None) -> None:
+        """Return a connection whose response has been fully read to the pool.
+
+        max_idle, when given, replaces max_idle_per_host for this connection.
+        """
+        if max_idle is None:
+            max_idle = self.max_idle_per_host
+        if not response.will_close:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < max_idle:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _use_urllib(self, scheme: str) -> bool:
+        if scheme not in ('http', 'https'):
+            return True
+        if self._proxies is None:
+            from urllib.request import getproxies
+            self._proxies = getproxies()
+        return scheme in self._proxies
+
+    def _send(self, key, method: str, target: str, body, headers):
+        """Send one request, retrying as described in the class docstring."""
+        attempt = 0
+        while True:
+            conn, reused = self._acquire(key)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                # A kept-alive connection the server closed while it sat idle.
+                stale = isinstance(e, (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                                       ConnectionResetError, BrokenPipeError))
+                if reused and stale:
+                    continue
+                if method != 'GET' or attempt >= self.retries:
+                    raise
+                attempt += 1
+                time.sleep(0.05 * (2 ** attempt))
+
+    def open(self, method: str, url: str, body: Optional[bytes] = None, headers: Optional[Dict] = None):
+        """Send a request and return (key, conn, response) with the body still unread."""
+        req_headers = {'Accept-Encoding': 'gzip, deflate', 'User-Agent': 'mimo-runtime'}
+        if headers:
+            req_headers.update(headers)
+        for _ in range(_HTTP_MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            key = (parts.scheme, parts.netloc)
+            target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+            conn, response = self._send(key, method, target, body, req_headers)
+            location = response.getheader('Location')
+            if response.status not in _HTTP_REDIRECTS or not location:
+                return key, conn, response
+            response.read()
+            self._release(key, conn, response)
+            url = urllib.parse.urljoin(url, location)
+            if response.status == 303 or (response.status in (301, 302) and method == 'POST'):
+                method, body = 'GET', None
+        raise http.client.HTTPException(f"Too many redirects for {url}")
+
+    def fetch(self, method: str, url: str, body: Optional[bytes] = None,
+              headers: Optional[Dict] = None, max_idle: Optional[int] = None) -> bytes:
+        """Perform a request and return the decoded response body.
+
+        max_idle caps the idle connections kept for the host afterwards
+        (max_idle_per_host by default).
+        """
+        if self._use_urllib(urllib.parse.urlsplit(url).scheme):
+            from urllib.request import Request, urlopen
+            req = Request(url, data=body, headers=headers or {}, method=method)
+            with urlopen(req, timeout=self.timeout) as response:
+                return response.read()
+        key, conn, response = self.open(method, url, body, headers)
+        try:
+            data = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        self._release(key, conn, response, max_idle)
+        decoder = _content_decoder(response)
+        if decoder is not None:
+            data = decoder.decompress(data) + decoder.flush()
+        if response.status >= 400:
+            raise HTTPStatusError(response.status, response.reason, data)
+        return data
+
+    def stream(self, url: str, chunk_size: int = 64 * 1024, encoding: str = 'utf-8'):
+        """Yield the GET response body as decoded text chunks of up to chunk_size bytes."""
+        key, conn, response = self.open('GET', url)
+        if response.status >= 400:
+            body = response.read()
+            self._release(key, conn, response)
+            raise HTTPStatusError(response.status, response.reason, body)
+        decoder = _content_decoder(response)
+        text = codecs.getincrementaldecoder(encoding)()
+        complete = False
+        try:
+            while True:
+                chunk = response.read(chunk_size)
+                if not chunk:
+                    break
+                if decoder is not None:
+                    chunk = decoder.decompress(chunk)
+                piece = text.decode(chunk)
+                if piece:
+                    yield piece
+            tail = text.decode(decoder.flush() if decoder is not None else b'', final=True)
+            if tail:
+                yield tail
+            complete = True
+        finally:
+            # An abandoned stream leaves unread data on the socket, so it cannot be reused.
+            if complete:
+                self._release(key, conn, response)
+            else:
+                conn.close()
+
+
+_http_pool = _HTTPPool()
+
+
+class _RateLimiter:
+    """Spaces calls to wait() at least 1/rate seconds apart, across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _http_batch(requests: List, concurrency: int, rate_limit: Optional[float]) -> List[Dict]:
+    """Run (method, url, body, headers) requests on a thread pool.
+
+    Results come back in input order as {url, ok, body, error} objects, so a
+    failing request does not abort the rest of the batch.
+    """
+    if not requests:
+        return []
+    limiter = _RateLimiter(rate_limit) if rate_limit else None
+    workers = max(1, min(concurrency, len(requests)))
+    # Keep enough idle connections around for every worker to reuse its own,
+    # for this batch only: the configured per-host limit is left as it is.
+    max_idle = max(_http_pool.max_idle_per_host, workers)
+
+    def run(request):
+        method, url, body, headers = request
+        if limiter is not None:
+            limiter.wait()
+        try:
+            data = _http_pool.fetch(method, url, body, headers, max_idle)
+            return {'url': url, 'ok': True, 'body': data.decode('utf-8'), 'error': None}
+        except (OSError, http.client.HTTPException, HTTPStatusError, ValueError) as e:
+            return {'url': url, 'ok': False, 'body': None,
+                    'error': f"HTTP {method} request failed: {str(e)}"}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, requests))
+
+
+DEFAULT_OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+class _OutputBuffer:
+    """Batches `show` output in memory and writes it to sys.stdout in large chunks.
+
+    Pending output is flushed once it reaches `size` characters, when the
+    program exits (normally, via exit_code, or through an uncaught exception)
+    and whenever flush() is called.
+    """
+
+    def __init__(self, size: int = DEFAULT_OUTPUT_BUFFER_SIZE):
+        self.size = size
+        self.buffer = io.StringIO()
+        # Bound C methods: show() calls these once per token / line.
+        self.write = self.buffer.write
+        self.pending = self.buffer.tell
+
+    def flush(self) -> None:
+        if self.buffer.tell():
+            sys.stdout.write(self.buffer.getvalue())
+            self.buffer.seek(0)
+            self.buffer.truncate()
+        sys.stdout.flush()
+
+
+# Argument types whose len() is cheap. LazySequence is left out: len() would
+# run its whole pipeline (and exhaust a one-shot source).
+_SIZED_TYPES = (str, list, tuple, dict, LazyRange, TypedArray, PersistentVector, PersistentMap)
+
+
+def _size_label(bucket: int) -> str:
+    """Label for a bit-length size bucket: '0', '1', '2-3', '4-7', ..."""
+    if bucket < 2:
+        return str(bucket)
+    low = 1 << (bucket - 1)
+    return f"{low}-{2 * low - 1}"
+
+
+class _ProfileRecord:
+    __slots__ = ('name', 'calls', 'active', 'tottime', 'cumtime', 'sizes', 'callers')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.active = 0
+        self.tottime = 0.0
+        self.cumtime = 0.0
+        self.sizes = {}
+        # bit length of the largest argument size -> calls; see _size_label.
+        # caller name -> [calls, tottime, cumtime], for pstats' callers table.
+        self.callers = {}
+
+    def as_dict(self) -> Dict:
+        return {'name': self.name, 'calls': self.calls, 'tottime': self.tottime, 'cumtime': self.cumtime,
+                'arg_sizes': {_size_label(b): n for b, n in sorted(self.sizes.items())}}
+
+
+class _Profiler:
+    """Counts and times calls to runtime builtins and stdlib module functions.
+
+    Enabled with MIMO_PROFILE. Instrumentation replaces the runtime's methods
+    with timing wrappers on the instances only, so nothing is wrapped (and
+    nothing costs anything) unless profiling is on. Self time excludes time
+    spent in other profiled calls; recursive calls add to cumulative time
+    only at the outermost level, as in cProfile.
+
+    MIMO_PROFILE=1 prints a report to stderr at exit; a path writes JSON
+    (*.json) or a pstats-compatible file (any other extension). The report
+    is sorted by MIMO_PROFILE_SORT: tottime (default), cumtime or calls.
+    """
+
+    def __init__(self, target: str, sort: str = 'tottime'):
+        self.target = target
+        self.sort = sort if sort in ('tottime', 'cumtime', 'calls') else 'tottime'
+        self.records = {}
+        self.local = threading.local()
+        self.runtime = None
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        record = self.records.setdefault(name, _ProfileRecord(name))
+        sizes = record.sizes
+        callers = record.callers
+        local = self.local
+        clock = time.perf_counter
+        sized = _SIZED_TYPES
+
+        @functools.wraps(fn)
+        def profiled(*args, **kwargs):
+            try:
+                stack = local.stack
+            except AttributeError:
+                stack = local.stack = []
+            # Argument size: bit length of the largest len() among the arguments.
+            size = 0
+            for arg in args:
+                if isinstance(arg, sized) and len(arg) > size:
+                    size = len(arg)
+            bucket = size.bit_length()
+            sizes[bucket] = sizes.get(bucket, 0) + 1
+            # Frame: [record, time spent in profiled callees].
+            frame = [record, 0.0]
+            stack.append(frame)
+            record.active += 1
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                stack.pop()
+                record.active -= 1
+                record.calls += 1
+                own = elapsed - frame[1]
+                record.tottime += own
+                outermost = not record.active
+                if outermost:
+                    record.cumtime += elapsed
+                if stack:
+                    caller = stack[-1]
+                    caller[1] += elapsed
+                    edge = callers.get(caller[0].name)
+                    if edge is None:
+                        edge = callers[caller[0].name] = [0, 0.0, 0.0]
+                    edge[0] += 1
+                    edge[1] += own
+                    if outermost:
+                        edge[2] += elapsed
+        return profiled
+
+    def install(self, runtime: 'MimoRuntime') -> None:
+        """Wrap runtime's public methods and every public function of its stdlib modules."""
+        modules = {name: getattr(runtime, name) for name in _STDLIB_MODULES}
+        for name in dir(type(runtime)):
+            if name.startswith('_'):
+                continue
+            attr = getattr(runtime, name)
+            if callable(attr):
+                setattr(runtime, name, self.wrap(f"mimo.{name}", attr))
+        # Generated code imports these from the module rather than going through
+        # `mimo`; rebinding them here (before that import runs) profiles those calls too.
+        for name in _OPERATOR_HELPERS:
+            globals()[name] = getattr(runtime, name)
+        for module_name, module in modules.items():
+            for name in dir(type(module)):
+                if name.startswith('_'):
+                    continue
+                attr = getattr(module, name)
+                if callable(attr):
+                    setattr(module, name, self.wrap(f"{module_name.rstrip('_')}.{name}", attr))
+        self.runtime = runtime
+        atexit.register(self.dump)
+
+    def sorted_records(self) -> List[_ProfileRecord]:
+        records = [r for r in self.records.values() if r.calls]
+        return sorted(records, key=lambda r: getattr(r, self.sort), reverse=True)
+
+    def report(self) -> str:
+        lines = [f"{'calls':>10} {'tottime':>10} {'percall':>10} {'cumtime':>10}  {'args (most common size)':<24}name"]
+        for r in self.sorted_records():
+            bucket = _size_label(max(r.sizes, key=r.sizes.get))
+            lines.append(f"{r.calls:>10} {r.tottime:>10.4f} {r.tottime / r.calls:>10.6f} {r.cumtime:>10.4f}  "
+                         f"{bucket:<24}{r.name}")
+        return '\n'.join(lines)
+
+    def pstats_data(self) -> Dict:
+        """The marshal-able {func: (cc, nc, tt, ct, callers)} mapping pstats.Stats loads."""
+        key = lambda name: ('mimo', 0, name)
+        return {key(r.name): (r.calls, r.calls, r.tottime, r.cumtime,
+                              {key(c): (n, n, tt, ct) for c, (n, tt, ct) in r.callers.items()})
+                for r in self.records.values() if r.calls}
+
+    def dump(self) -> None:
+        type(self.runtime).flush(self.runtime)
+        if self.target.lower() in ('1', 'true', 'yes', 'on'):
+            sys.stderr.write(f"\nMimo profile (sorted by {self.sort}):\n{self.report()}\n")
+        elif self.target.endswith('.json'):
+            with open(self.target, 'w', encoding='utf-8') as f:
+                json.dump([r.as_dict() for r in self.sorted_records()], f, indent=2)
+        else:
+            with open(self.target, 'wb') as f:
+                marshal.dump(self.pstats_data(), f)
+
+
+# Attributes of MimoRuntime that setup_stdlib() assigns.
+_STDLIB_MODULES = ('fs', 'json', 'datetime', 'math', 'string', 'array', 'path', 'env',
+                   'regex', 'http', 'object', 'assert_', 'cache', 'persistent')
 
 
 class MimoRuntime:
     """Main Mimo runtime class containing all built-ins and standard library modules."""
 
     def __init__(self):
-        self.setup_stdlib()
+        # Optional truncation for `show`, useful for log-heavy programs.
+        self.show_max_depth = _env_int('MIMO_SHOW_MAX_DEPTH')
+        self.show_max_length = _env_int('MIMO_SHOW_MAX_LENGTH')
+        self._output = None
+        self._flush_hooks_installed = False
+        if _env_flag('MIMO_BUFFER_OUTPUT'):
+            self.set_output_buffering(True, _env_int('MIMO_OUTPUT_BUFFER_SIZE'))
+        profile = os.environ.get('MIMO_PROFILE')
+        if profile and profile.lower() not in ('0', 'false', 'no', 'off'):
+            _Profiler(profile, os.environ.get('MIMO_PROFILE_SORT', 'tottime')).install(self)
 
     # --- Core IO & Utils ---
     def show(self, *args):
-        """Print values to stdout."""
-        output = ' '.join(stringify(arg) for arg in args)
-        print(output)
+        """Print values to stdout, streaming each value straight to the stream."""
+        output = self._output
+        write = sys.stdout.write if output is None else output.write
+        max_depth, max_length = self.show_max_depth, self.show_max_length
+        for i, arg in enumerate(args):
+            if i:
+                write(' ')
+            write_value(arg, write, max_depth, max_length)
+        write('\n')
+        if output is not None and output.pending() >= output.size:
+            output.flush()
+
+    def set_output_buffering(self, enabled: bool = True, size: Optional[int] = None):
+        """Turn batched `show` output on or off.
+
+        Also enabled by setting MIMO_BUFFER_OUTPUT=1 (and optionally
+        MIMO_OUTPUT_BUFFER_SIZE) in the environment.
+        """
+        if self._output is not None:
+            self._output.flush()
+            self._output = None
+        if enabled:
+            self._output = _OutputBuffer(size or DEFAULT_OUTPUT_BUFFER_SIZE)
+            self._install_flush_hooks()
+
+    def flush(self):
+        """Write out any buffered `show` output."""
+        if self._output is not None:
+            self._output.flush()
+
+    def _install_flush_hooks(self):
+        """Flush buffered output at exit and before uncaught exceptions are reported."""
+        if self._flush_hooks_installed:
+            return
+        self._flush_hooks_installed = True
+        atexit.register(self.flush)
+        previous_hook = sys.excepthook
+
+        def flush_then_report(exc_type, exc, tb):
+            self.flush()
+            previous_hook(exc_type, exc, tb)
+
+        sys.excepthook = flush_then_report
 
     # --- Core Built-ins ---
     def len(self, collection):
@@ -74,29 +2707,15 @@ class MimoRuntime:
             return len(collection.keys())
         return 0
 
-    def add(self, a, b):
-        """Mimo + operator: concatenates if either operand is a string, otherwise adds."""
-        if isinstance(a, str) or isinstance(b, str):
-            return stringify(a) + stringify(b)
-        return a + b
-
-    def get(self, collection, key):
-        """Get value from collection by key, return None if not found."""
-        if collection is None:
-            return None
-        try:
-            if isinstance(collection, (list, tuple)):
-                return collection[key] if 0 <= key < len(collection) else None
-            elif isinstance(collection, dict):
-                return collection.get(key)
-            else:
-                return getattr(collection, key, None)
-        except (KeyError, IndexError, TypeError):
-            return None
+    add = staticmethod(add)
+    get = staticmethod(get)
 
     def update(self, collection, key, value):
         """Update collection at key with value."""
-        if isinstance(collection, list) and isinstance(key, int):
+        if isinstance(collection, _PERSISTENT_TYPES):
+            raise Exception(f"Cannot update a persistent {self.type(collection)} in place; "
+                            f"use persistent.assoc, which returns an updated copy")
+        if isinstance(collection, _MUTABLE_ARRAY_TYPES) and isinstance(key, int):
             if 0 <= key < len(collection):
                 collection[key] = value
         elif isinstance(collection, dict):
@@ -115,9 +2734,9 @@ class MimoRuntime:
             return 'number'
         elif isinstance(value, str):
             return 'string'
-        elif isinstance(value, (list, tuple)):
+        elif isinstance(value, _ARRAY_TYPES):
             return 'array'
-        elif isinstance(value, dict):
+        elif isinstance(value, _OBJECT_TYPES):
             return 'object'
         elif callable(value):
             return 'function'
@@ -126,45 +2745,65 @@ class MimoRuntime:
 
     def push(self, array, value):
         """Add value to end of array."""
-        if isinstance(array, list):
+        if isinstance(array, _MUTABLE_ARRAY_TYPES):
             array.append(value)
         return array
 
     def pop(self, array):
         """Remove and return last element from array."""
-        if isinstance(array, list) and len(array) > 0:
+        if isinstance(array, _MUTABLE_ARRAY_TYPES) and len(array) > 0:
             return array.pop()
         return None
 
     def range(self, *args):
-        """Generate range of numbers."""
-        if len(args) == 1:
-            return list(range(args[0]))
-        elif len(args) == 2:
-            return list(range(args[0], args[1]))
-        elif len(args) == 3:
-            return list(range(args[0], args[1], args[2]))
-        else:
-            return []
+        """Generate range of numbers, lazily (see LazyRange)."""
+        if 1 <= len(args) <= 3:
+            return LazyRange(range(*args))
+        return []
+
+    def typed_array(self, kind: str, data=None) -> TypedArray:
+        """Compact array of numbers of one kind: int8/16/32/64, uint8/16/32/64, float32 or float64.
+
+        data is an array (or any iterable) of numbers, or a length to fill with zeros.
+        """
+        code = TYPED_ARRAY_KINDS.get(kind)
+        if code is None:
+            raise Exception(f"Unknown typed array kind '{kind}', expected one of: {', '.join(TYPED_ARRAY_KINDS)}")
+        try:
+            if data is None:
+                return TypedArray(code)
+            if isinstance(data, int) and not isinstance(data, bool):
+                return TypedArray(code, bytes(data * array.array(code).itemsize))
+            if isinstance(data, array.array) and data.typecode == code:
+                return TypedArray(code, data)
+            return TypedArray(code, data if isinstance(data, (list, range)) else list(data))
+        except (TypeError, OverflowError, ValueError) as e:
+            raise Exception(f"Failed to create {kind} typed array: {str(e)}")
+
+    def is_array(self, value) -> bool:
+        """True for lists and the runtime's other array types (used by `match` patterns)."""
+        return isinstance(value, _ARRAY_TYPES)
+
+    def is_object(self, value) -> bool:
+        """True for dicts and the runtime's other object types (used by `match` patterns)."""
+        return isinstance(value, _OBJECT_TYPES)
 
     def join(self, array, separator):
         """Join array elements with separator."""
-        if not isinstance(array, (list, tuple)):
+        if not isinstance(array, _ARRAY_TYPES):
             return ""
         return separator.join(stringify(item) for item in array)
 
     def slice(self, collection, start, end=None):
         """Slice a collection."""
-        if end is None:
-            return collection[start:]
-        return collection[start:end]
+        result = collection[start:end]
+        if isinstance(collection, TypedArray):
+            return TypedArray(collection.typecode, result)
+        return result
 
     # --- Logical Operators ---
-    def eq(self, a, b):
-        return is_equal(a, b)
-
-    def neq(self, a, b):
-        return not is_equal(a, b)
+    eq = staticmethod(eq)
+    neq = staticmethod(neq)
 
     def and_(self, a, b):
         return a and b
@@ -174,7 +2813,7 @@ class MimoRuntime:
 
     # --- Utility functions ---
     def has_property(self, obj, prop):
-        if isinstance(obj, dict):
+        if isinstance(obj, _OBJECT_TYPES):
             return prop in obj
         else:
             return hasattr(obj, prop)
@@ -184,17 +2823,17 @@ class MimoRuntime:
         return self.get(obj, prop)
 
     def keys(self, obj):
-        if isinstance(obj, dict):
+        if isinstance(obj, _OBJECT_TYPES):
             return list(obj.keys())
         return []
 
     def values(self, obj):
-        if isinstance(obj, dict):
+        if isinstance(obj, _OBJECT_TYPES):
             return list(obj.values())
         return []
 
     def entries(self, obj):
-        if isinstance(obj, dict):
+        if isinstance(obj, _OBJECT_TYPES):
             return [[k, v] for k, v in obj.items()]
         return []
 
@@ -217,8 +2856,17 @@ class MimoRuntime:
 
     def exit_code(self, code=0):
         """Exit the program with the given code."""
+        self.flush()
         sys.exit(code)
 
+    def __getattr__(self, name: str):
+        # Only reached for attributes not set on the instance: the stdlib modules
+        # are built on first use, after which they are plain instance attributes.
+        if name in _STDLIB_MODULES:
+            self.setup_stdlib()
+            return self.__dict__[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
     def setup_stdlib(self):
         """Setup standard library modules."""
 
@@ -240,9 +2888,58 @@ class MimoRuntime:
                 except Exception as e:
                     raise Exception(f"Failed to write file {path}: {str(e)}")
 
+            @staticmethod
+            def read_lines(path: str, encoding: str = 'utf-8', errors: str = 'strict',
+                           keep_ends: bool = False) -> LazySequence:
+                """Lazily read a text file line by line, without its trailing newlines unless keep_ends."""
+                reader = (lambda f: f) if keep_ends else _split_lines
+                return LazySequence(_FileSource(path, encoding, errors, reader))
+
+            @staticmethod
+            def read_chunks(path: str, size: int = DEFAULT_FILE_BUFFER_SIZE, encoding: str = 'utf-8',
+                            errors: str = 'strict') -> LazySequence:
+                """Lazily read a text file as chunks of up to size characters."""
+                if size <= 0:
+                    raise Exception(f"Failed to read file {path}: chunk size must be positive")
+                reader = lambda f: iter(functools.partial(f.read, size), '')
+                return LazySequence(_FileSource(path, encoding, errors, reader))
+
+            @staticmethod
+            def open_writer(path: str, append: bool = False, encoding: str = 'utf-8',
+                            buffer_size: int = DEFAULT_FILE_BUFFER_SIZE) -> FileWriter:
+                return FileWriter(path, append, encoding, buffer_size)
+
+            @staticmethod
+            def append_file(path: str, data: str) -> None:
+                try:
+                    with open(path, 'a', encoding='utf-8') as f:
+                        f.write(data)
+                except Exception as e:
+                    raise Exception(f"Failed to append to file {path}: {str(e)}")
+
+            @staticmethod
+            def read_bytes(path: str) -> bytes:
+                try:
+                    with open(path, 'rb') as f:
+                        return f.read()
+                except Exception as e:
+                    raise Exception(f"Failed to read file {path}: {str(e)}")
+
+            @staticmethod
+            def write_bytes(path: str, data: bytes) -> None:
+                try:
+                    with open(path, 'wb') as f:
+                        f.write(data)
+                except Exception as e:
+                    raise Exception(f"Failed to write file {path}: {str(e)}")
+
+            @staticmethod
+            def mmap(path: str) -> MappedFile:
+                return MappedFile(path)
+
             @staticmethod
             def exists(path: str) -> bool:
-                return Path(path).exists()
+                return pathlib.Path(path).exists()
 
             @staticmethod
             def list_dir(path: str) -> List[str]:
@@ -255,23 +2952,23 @@ class MimoRuntime:
             def make_dir(path: str, recursive: bool = False) -> None:
                 try:
                     if recursive:
-                        Path(path).mkdir(parents=True, exist_ok=True)
+                        pathlib.Path(path).mkdir(parents=True, exist_ok=True)
                     else:
-                        Path(path).mkdir(exist_ok=True)
+                        pathlib.Path(path).mkdir(exist_ok=True)
                 except Exception as e:
                     raise Exception(f"Failed to create directory {path}: {str(e)}")
 
             @staticmethod
             def remove_file(path: str) -> None:
                 try:
-                    Path(path).unlink()
+                    pathlib.Path(path).unlink()
                 except Exception as e:
                     raise Exception(f"Failed to remove file {path}: {str(e)}")
 
             @staticmethod
             def remove_dir(path: str) -> None:
                 try:
-                    Path(path).rmdir()
+                    pathlib.Path(path).rmdir()
                 except Exception as e:
                     raise Exception(f"Failed to remove directory {path}: {str(e)}")
 
@@ -280,17 +2977,61 @@ class MimoRuntime:
             @staticmethod
             def parse(text: str):
                 try:
-                    return json.loads(text)
+                    return _get_json_backend().loads(text)
                 except json.JSONDecodeError as e:
                     raise Exception(f"Failed to parse JSON: {str(e)}")
 
             @staticmethod
             def stringify(obj, indent: Optional[int] = None):
                 try:
-                    return json.dumps(obj, indent=indent, ensure_ascii=False)
+                    return _get_json_backend().dumps(obj, indent)
                 except Exception as e:
                     raise Exception(f"Failed to stringify JSON: {str(e)}")
 
+            @staticmethod
+            def backend() -> str:
+                """Name of the JSON backend in use: 'orjson' or 'stdlib'."""
+                return _get_json_backend().name
+
+            @staticmethod
+            def set_backend(name: str = 'auto') -> None:
+                """Switch backend: 'auto' (orjson when installed), 'orjson' or 'stdlib'."""
+                global _json_backend
+                _json_backend = _make_json_backend(name)
+
+            @staticmethod
+            def parse_lines(source) -> LazySequence:
+                """Lazily decode JSON Lines from a file path or an iterable of lines."""
+                lines = _json_lines(source)
+                return LazySequence(_Reiterable(functools.partial(_parse_json_lines, lines)))
+
+            @staticmethod
+            def write_lines(path: str, records) -> int:
+                """Write one compact JSON value per line; returns the number of records written."""
+                dumps = _get_json_backend().dumps
+                count = 0
+                try:
+                    with open(path, 'w', encoding='utf-8', buffering=DEFAULT_FILE_BUFFER_SIZE) as f:
+                        write = f.write
+                        for record in records:
+                            write(dumps(record))
+                            write('\n')
+                            count += 1
+                except Exception as e:
+                    raise Exception(f"Failed to write file {path}: {str(e)}")
+                return count
+
+            @staticmethod
+            def iter_array(source, chunk_size: int = DEFAULT_FILE_BUFFER_SIZE) -> LazySequence:
+                """Lazily decode the elements of a huge top-level JSON array.
+
+                source is a file path or an iterable of text chunks (such as http.stream).
+                """
+                if isinstance(source, str):
+                    source = _FileSource(source, 'utf-8', 'strict',
+                                         lambda f: iter(functools.partial(f.read, chunk_size), ''))
+                return LazySequence(_Reiterable(functools.partial(_iter_json_array, source)))
+
         # DateTime module
         class DateTimeModule:
             @staticmethod
@@ -315,16 +3056,24 @@ class MimoRuntime:
 
             @staticmethod
             def format(dt, fmt):
+                """Format a datetime, or a timestamp in epoch milliseconds, with the
+                tokens YYYY, MM, DD, hh, mm and ss (local time)."""
+                t = type(dt)
+                if t is int or t is float:
+                    return _datetime_format(fmt).format_fields(_epoch_fields(dt))
                 if not isinstance(dt, datetime.datetime):
                     return ""
-                result = fmt
-                result = result.replace('YYYY', str(dt.year))
-                result = result.replace('MM', f"{dt.month:02d}")
-                result = result.replace('DD', f"{dt.day:02d}")
-                result = result.replace('hh', f"{dt.hour:02d}")
-                result = result.replace('mm', f"{dt.minute:02d}")
-                result = result.replace('ss', f"{dt.second:02d}")
-                return result
+                return _datetime_format(fmt).format_datetime(dt)
+
+            @staticmethod
+            def format_many(dts: List, fmt: str) -> List[str]:
+                """format() over an array of datetimes and/or epoch-millisecond timestamps."""
+                return _format_many(dts, fmt)
+
+            @staticmethod
+            def parse(text: str, fmt: str):
+                """Parse text written in a format() format back into a datetime."""
+                return _parse_datetime(text, fmt)
 
         # Math module
         class MathModule:
@@ -442,24 +3191,67 @@ class MimoRuntime:
 
         # Array module
         class ArrayModule:
+            @staticmethod
+            def lazy(array) -> LazySequence:
+                """Wrap an array (or any iterable) so map/filter/flat_map/zip/chunk stay lazy."""
+                if isinstance(array, LazySequence):
+                    return array
+                return LazySequence(array)
+
+            @staticmethod
+            def to_array(array) -> List:
+                if isinstance(array, LazySequence):
+                    return list(array.to_list())
+                return list(array)
+
             @staticmethod
             def map(array: List, callback: Callable) -> List:
+                if isinstance(array, LazySequence):
+                    return array.map(callback)
                 return [callback(item) for item in array]
 
             @staticmethod
             def filter(array: List, callback: Callable) -> List:
+                if isinstance(array, LazySequence):
+                    return array.filter(callback)
                 return [item for item in array if callback(item)]
 
+            @staticmethod
+            def par_map(array: List, callback: Callable, workers: Optional[int] = None,
+                        chunk_size: Optional[int] = None, mode: str = 'process') -> List:
+                """map() across a pool of worker processes (or threads with mode 'thread').
+
+                Items are sent in chunks (by default about four per worker) and
+                results keep the input order. Process mode suits CPU-heavy
+                callbacks, which must be named top-level functions; thread mode
+                suits callbacks that wait on I/O.
+                """
+                chunks = _run_chunked('par_map', _map_chunk, callback, array, workers, chunk_size, mode)
+                return list(itertools.chain.from_iterable(chunks))
+
+            @staticmethod
+            def par_filter(array: List, callback: Callable, workers: Optional[int] = None,
+                           chunk_size: Optional[int] = None, mode: str = 'process') -> List:
+                """filter() across a worker pool; see par_map."""
+                items = array if isinstance(array, (list, tuple)) else list(array)
+                chunks = _run_chunked('par_filter', _filter_chunk, callback, items, workers, chunk_size, mode)
+                return list(itertools.compress(items, itertools.chain.from_iterable(chunks)))
+
+            @staticmethod
+            def par_for_each(array: List, callback: Callable, workers: Optional[int] = None,
+                             chunk_size: Optional[int] = None, mode: str = 'thread') -> None:
+                """for_each() across a worker pool, in threads by default since it runs for side effects."""
+                _run_chunked('par_for_each', _map_chunk, callback, array, workers, chunk_size, mode)
+
             @staticmethod
             def reduce(array: List, callback: Callable, initial=None):
+                items = iter(array)
                 if initial is not None:
                     result = initial
-                    start = 0
                 else:
-                    result = array[0] if array else None
-                    start = 1
-                for i in range(start, len(array)):
-                    result = callback(result, array[i])
+                    result = next(items, None)
+                for item in items:
+                    result = callback(result, item)
                 return result
 
             @staticmethod
@@ -467,7 +3259,7 @@ class MimoRuntime:
                 def _flat(arr, d):
                     result = []
                     for item in arr:
-                        if isinstance(item, list) and d > 0:
+                        if isinstance(item, _ARRAY_TYPES) and d > 0:
                             result.extend(_flat(item, d - 1))
                         else:
                             result.append(item)
@@ -476,10 +3268,12 @@ class MimoRuntime:
 
             @staticmethod
             def flat_map(array: List, callback: Callable) -> List:
+                if isinstance(array, LazySequence):
+                    return array.flat_map(callback)
                 result = []
                 for item in array:
                     mapped = callback(item)
-                    if isinstance(mapped, list):
+                    if isinstance(mapped, _ARRAY_TYPES):
                         result.extend(mapped)
                     else:
                         result.append(mapped)
@@ -487,26 +3281,95 @@ class MimoRuntime:
 
             @staticmethod
             def group_by(array: List, callback: Callable) -> Dict:
-                result = {}
+                """Group items by callback(item).
+
+                Keys that are different values are different groups: 1, "1"
+                and true, or [1, 2] and "[1, 2]". Strings, numbers and null are
+                used as keys directly; other keys (booleans, arrays, objects)
+                become their printed form.
+                """
+                groups = {}
                 for item in array:
-                    key = str(callback(item))
-                    if key not in result:
-                        result[key] = []
-                    result[key].append(item)
-                return result
+                    key = callback(item)
+                    t = type(key)
+                    tag = key if t is str or t is int else _group_tag(key)
+                    group = groups.get(tag)
+                    if group is None:
+                        groups[tag] = (key, [item])
+                    else:
+                        group[1].append(item)
+                return {_group_label(key, tag): items for tag, (key, items) in groups.items()}
+
+            @staticmethod
+            def count_by(array: List, callback: Callable) -> Dict:
+                """Number of items per callback(item) key, keyed as in group_by."""
+                groups = {}
+                for key in map(callback, array):
+                    t = type(key)
+                    tag = key if t is str or t is int else _group_tag(key)
+                    group = groups.get(tag)
+                    if group is None:
+                        groups[tag] = [key, 1]
+                    else:
+                        group[1] += 1
+                return {_group_label(key, tag): count for tag, (key, count) in groups.items()}
+
+            @staticmethod
+            def index_by(array: List, callback: Callable) -> Dict:
+                """Map callback(item) to item, keyed as in group_by; a later item with the same key wins."""
+                groups = {}
+                for item in array:
+                    key = callback(item)
+                    t = type(key)
+                    tag = key if t is str or t is int else _group_tag(key)
+                    group = groups.get(tag)
+                    if group is None:
+                        groups[tag] = [key, item]
+                    else:
+                        group[1] = item
+                return {_group_label(key, tag): item for tag, (key, item) in groups.items()}
+
+            @staticmethod
+            def partition(array: List, callback: Callable) -> List:
+                """[items where callback is truthy, the other items], in one pass."""
+                matched, rest = [], []
+                keep, drop = matched.append, rest.append
+                for item in array:
+                    if callback(item):
+                        keep(item)
+                    else:
+                        drop(item)
+                return [matched, rest]
+
+            @staticmethod
+            def aggregate_by(array: List, key_fn: Callable, spec: Dict) -> Dict:
+                """Per-group aggregates in one pass, without building the groups.
+
+                spec maps an item field to 'sum', 'min', 'max', 'count' or 'mean';
+                the result maps each key_fn(item) to an object with one value per
+                field. Null or missing field values are skipped (count counts the
+                rest); an empty sum is 0 and an empty min, max or mean is null.
+                """
+                return _aggregate_by(array, key_fn, spec)
 
             @staticmethod
             def zip(*arrays) -> List:
+                if any(isinstance(array, LazySequence) for array in arrays):
+                    return LazySequence(arrays[0]).then(functools.partial(_zip_iter, arrays[1:]))
                 return [list(group) for group in zip(*arrays)]
 
             @staticmethod
             def chunk(array: List, size: int) -> List:
+                if isinstance(array, LazySequence):
+                    return array.chunk(size)
                 return [array[i:i + size] for i in range(0, len(array), size)]
 
             @staticmethod
             def count(array: List, callback: Optional[Callable] = None) -> int:
                 if callback:
                     return sum(1 for item in array if callback(item))
+                if isinstance(array, LazySequence):
+                    return sum(1 for _ in array)
                 return len(array)
 
             @staticmethod
@@ -549,10 +3412,15 @@ class MimoRuntime:
 
             @staticmethod
             def slice(array: List, start: int, end: Optional[int] = None) -> List:
-                return array[start:end]
+                result = array[start:end]
+                if isinstance(array, TypedArray):
+                    return TypedArray(array.typecode, result)
+                return result
 
             @staticmethod
             def first(array: List):
+                if isinstance(array, LazySequence):
+                    return next(iter(array), None)
                 return array[0] if array else None
 
             @staticmethod
@@ -566,22 +3434,128 @@ class MimoRuntime:
             @staticmethod
             def sort(array: List, callback: Optional[Callable] = None) -> List:
                 if callback:
-                    import functools
+                    as_key = _comparator_as_key(callback)
+                    if as_key is not None:
+                        key, reverse = as_key
+                        items = list(array)
+                        keys = items if key is None else list(map(key, items))
+                        if _plain_numbers(keys):
+                            order = sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+                            return [items[i] for i in order]
+                        array = items
                     return sorted(array, key=functools.cmp_to_key(callback))
                 return sorted(array)
 
+            @staticmethod
+            def sort_by(array: List, key_fn, directions=None) -> List:
+                """Stable sort by one key function, or by a list of them (most significant first).
+
+                directions is 'asc'/'desc' or a list of them, one per key.
+                """
+                key_fns = [key_fn] if callable(key_fn) else list(key_fn)
+                if directions is None:
+                    directions = []
+                elif isinstance(directions, str):
+                    directions = [directions]
+                result = list(array)
+                # Sorting by the least significant key first relies on sort stability.
+                for index in range(len(key_fns) - 1, -1, -1):
+                    direction = directions[index] if index < len(directions) else 'asc'
+                    if direction not in ('asc', 'desc'):
+                        raise Exception(f"sort_by: unknown direction '{direction}', expected 'asc' or 'desc'")
+                    result.sort(key=key_fns[index], reverse=direction == 'desc')
+                return result
+
+            @staticmethod
+            def top_k(array: List, k: int, key_fn: Optional[Callable] = None) -> List:
+                """The k largest items, largest first, without sorting the whole array."""
+                return heapq.nlargest(k, array, key=key_fn)
+
+            @staticmethod
+            def nsmallest(array: List, k: int, key_fn: Optional[Callable] = None) -> List:
+                """The k smallest items, smallest first, without sorting the whole array."""
+                return heapq.nsmallest(k, array, key=key_fn)
+
+            @staticmethod
+            def sum(array: List):
+                """Sum of numbers: exact for integers, math.fsum (correctly rounded) with floats."""
+                if not isinstance(array, (list, tuple)):
+                    views = _numpy_views(array)
+                    if views is not None and views[0].dtype.kind != 'f' \
+                            and _exact_in_numpy(views, _int_bound(views[0]) * len(array)):
+                        return int(views[0].sum())
+                    if not isinstance(array, TypedArray):
+                        array = list(array)
+                return _numeric_sum(array)
+
+            @staticmethod
+            def min(array: List):
+                return min(array) if len(array) else None
+
+            @staticmethod
+            def max(array: List):
+                return max(array) if len(array) else None
+
+            @staticmethod
+            def mean(array: List):
+                count = len(array)
+                return ArrayModule.sum(array) / count if count else None
+
+            @staticmethod
+            def cumsum(array: List) -> List:
+                """Running totals, added left to right."""
+                views = _numpy_views(array)
+                if views is not None and _exact_in_numpy(views, _int_bound(views[0]) * len(array)):
+                    return views[0].cumsum().tolist()
+                return list(itertools.accumulate(array))
+
+            @staticmethod
+            def dot(a: List, b: List):
+                """Sum of pairwise products, rounded like array.sum."""
+                _check_lengths('dot', a, b)
+                views = _numpy_views(a, b)
+                if views is not None:
+                    x, y = views
+                    if _exact_in_numpy(views, _int_bound(x) * _int_bound(y) * len(a)):
+                        products = x * y
+                        if products.dtype.kind == 'f':
+                            return math.fsum(products.tolist())
+                        return int(products.sum())
+                total = sum(map(operator.mul, a, b))
+                if type(total) is float:
+                    return math.fsum(map(operator.mul, a, b))
+                return total
+
+            @staticmethod
+            def add(a: List, b) -> List:
+                """Element-wise a + b; b may be an array of the same length or a number."""
+                return _elementwise('add', operator.add, a, b)
+
+            @staticmethod
+            def mul(a: List, b) -> List:
+                """Element-wise a * b; b may be an array of the same length or a number."""
+                return _elementwise('mul', operator.mul, a, b)
+
             @staticmethod
             def reverse(array: List) -> List:
+                if isinstance(array, PersistentVector):
+                    return PersistentVector(reversed(array))
                 return list(reversed(array))
 
             @staticmethod
             def shuffle(array: List) -> List:
                 result = list(array)
                 random.shuffle(result)
-                return result
+                return PersistentVector(result) if isinstance(array, PersistentVector) else result
 
             @staticmethod
             def concat(*arrays) -> List:
+                if arrays and isinstance(arrays[0], PersistentVector):
+                    # Appending shares the first vector's nodes: O(total length of the rest).
+                    result = arrays[0]
+                    for arr in arrays[1:]:
+                        result = result.extend(arr)
+                    return result
                 result = []
                 for arr in arrays:
                     result.extend(arr)
@@ -589,29 +3563,25 @@ class MimoRuntime:
 
             @staticmethod
             def unique(array: List) -> List:
-                seen = []
-                result = []
-                for item in array:
-                    if item not in seen:
-                        seen.append(item)
-                        result.append(item)
-                return result
+                seen = _ValueSet()
+                return [item for item in array if seen.add(item)]
 
             @staticmethod
             def intersection(a: List, b: List) -> List:
-                return [v for v in a if v in b]
+                lookup = _ValueSet(b)
+                return [v for v in a if v in lookup]
 
             @staticmethod
             def union(a: List, b: List) -> List:
                 result = list(a)
-                for item in b:
-                    if item not in result:
-                        result.append(item)
+                seen = _ValueSet(a)
+                result.extend(item for item in b if seen.add(item))
                 return result
 
             @staticmethod
             def difference(a: List, b: List) -> List:
-                return [v for v in a if v not in b]
+                lookup = _ValueSet(b)
+                return [v for v in a if v not in lookup]
 
         # Path module
         class PathModule:
@@ -648,52 +3618,80 @@ class MimoRuntime:
             def all() -> Dict[str, str]:
                 return dict(os.environ)
 
+        # Cache module
+        class CacheModule:
+            @staticmethod
+            def memoize(fn: Optional[Callable] = None, max_size: Optional[int] = DEFAULT_MEMOIZE_SIZE,
+                        ttl: Optional[float] = None) -> Callable:
+                """Cache fn's results by argument value, keeping the max_size most recently
+                used (null for no limit), each for at most ttl seconds (null for no expiry).
+
+                Without fn, returns a decorator taking the function to wrap.
+                """
+                if fn is None:
+                    return lambda target: _memoize(target, max_size, ttl)
+                return _memoize(fn, max_size, ttl)
+
+            @staticmethod
+            def stats(fn: Callable) -> Dict[str, Any]:
+                """Hits, misses, evictions, size and limits of a memoized function."""
+                if fn not in _memoized_functions:
+                    raise Exception("cache.stats expects a function returned by cache.memoize")
+                return fn.cache_info()
+
+            @staticmethod
+            def clear(fn: Optional[Callable] = None) -> None:
+                """Drop the entries and stats of fn, or of every memoized function."""
+                if fn is None:
+                    for memoized in list(_memoized_functions):
+                        memoized.cache_clear()
+                    return
+                if fn not in _memoized_functions:
+                    raise Exception("cache.clear expects a function returned by cache.memoize")
+                fn.cache_clear()
+
         # Regex module
         class RegexModule:
             @staticmethod
-            def find_matches(pattern: str, text: str, flags: str = '') -> Optional[List[str]]:
-                flag_map = {'i': re.IGNORECASE, 'm': re.MULTILINE, 's': re.DOTALL}
-                re_flags = 0
-                for ch in flags.replace('g', ''):
-                    re_flags |= flag_map.get(ch, 0)
-                matches = re.findall(pattern, text, re_flags)
+            def compile(pattern: str, flags: str = '') -> re.Pattern:
+                """Compile a pattern once for reuse with the other regex functions."""
+                return _regex_cache.get(pattern, flags)
+
+            @staticmethod
+            def find_matches(pattern, text: str, flags: str = '') -> Optional[List[str]]:
+                matches = _regex_cache.get(pattern, flags).findall(text)
                 return matches if matches else None
 
             @staticmethod
-            def is_match(pattern: str, text: str, flags: str = '') -> bool:
-                flag_map = {'i': re.IGNORECASE, 'm': re.MULTILINE, 's': re.DOTALL}
-                re_flags = 0
-                for ch in flags:
-                    re_flags |= flag_map.get(ch, 0)
-                return bool(re.search(pattern, text, re_flags))
+            def is_match(pattern, text: str, flags: str = '') -> bool:
+                return _regex_cache.get(pattern, flags).search(text) is not None
 
             @staticmethod
-            def replace_all(text: str, pattern: str, replacement: str, flags: str = '') -> str:
-                flag_map = {'i': re.IGNORECASE, 'm': re.MULTILINE, 's': re.DOTALL}
-                re_flags = 0
-                for ch in flags.replace('g', ''):
-                    re_flags |= flag_map.get(ch, 0)
-                return re.sub(pattern, replacement, text, flags=re_flags)
+            def replace_all(text: str, pattern, replacement: str, flags: str = '') -> str:
+                return _regex_cache.get(pattern, flags).sub(replacement, text)
 
             @staticmethod
-            def extract(pattern: str, text: str, flags: str = '') -> Optional[List[str]]:
-                flag_map = {'i': re.IGNORECASE, 'm': re.MULTILINE, 's': re.DOTALL}
-                re_flags = 0
-                for ch in flags:
-                    re_flags |= flag_map.get(ch, 0)
-                m = re.search(pattern, text, re_flags)
+            def extract(pattern, text: str, flags: str = '') -> Optional[List[str]]:
+                m = _regex_cache.get(pattern, flags).search(text)
                 if m is None:
                     return None
                 return [m.group(0)] + list(m.groups())
 
+            @staticmethod
+            def cache_info() -> Dict[str, int]:
+                return _regex_cache.info()
+
+            @staticmethod
+            def clear_cache() -> None:
+                _regex_cache.clear()
+
         # HTTP module
         class HTTPModule:
             @staticmethod
             def get(url: str) -> str:
                 try:
-                    with urllib.request.urlopen(url) as response:
-                        return response.read().decode('utf-8')
-                except urllib.error.URLError as e:
+                    return _http_pool.fetch('GET', url).decode('utf-8')
+                except (OSError, http.client.HTTPException, HTTPStatusError) as e:
                     raise Exception(f"HTTP GET request failed: {str(e)}")
 
             @staticmethod
@@ -702,17 +3700,66 @@ class MimoRuntime:
                 if headers:
                     req_headers.update(headers)
                 data = body.encode('utf-8')
-                req = urllib.request.Request(url, data=data, headers=req_headers, method='POST')
                 try:
-                    with urllib.request.urlopen(req) as response:
-                        return response.read().decode('utf-8')
-                except urllib.error.URLError as e:
+                    return _http_pool.fetch('POST', url, data, req_headers).decode('utf-8')
+                except (OSError, http.client.HTTPException, HTTPStatusError) as e:
                     raise Exception(f"HTTP POST request failed: {str(e)}")
 
+            @staticmethod
+            def stream(url: str, chunk_size: int = 64 * 1024) -> LazySequence:
+                """Read a GET response incrementally as a lazy sequence of text chunks."""
+                def chunks():
+                    try:
+                        yield from _http_pool.stream(url, chunk_size)
+                    except (OSError, http.client.HTTPException, HTTPStatusError) as e:
+                        raise Exception(f"HTTP GET request failed: {str(e)}")
+                return LazySequence(chunks())
+
+            @staticmethod
+            def get_many(urls: List[str], concurrency: int = 8,
+                         rate_limit: Optional[float] = None) -> List[Dict]:
+                """GET many URLs in parallel; rate_limit caps requests per second."""
+                return _http_batch([('GET', url, None, None) for url in urls], concurrency, rate_limit)
+
+            @staticmethod
+            def post_many(requests: List[Dict], concurrency: int = 8,
+                          rate_limit: Optional[float] = None) -> List[Dict]:
+                """POST many {url, body, headers} requests in parallel."""
+                batch = []
+                for request in requests:
+                    req_headers = {'Content-Type': 'application/json'}
+                    if request.get('headers'):
+                        req_headers.update(request['headers'])
+                    batch.append(('POST', request['url'], (request.get('body') or '').encode('utf-8'), req_headers))
+                return _http_batch(batch, concurrency, rate_limit)
+
+            @staticmethod
+            def configure(timeout: Optional[float] = None, retries: Optional[int] = None,
+                          max_connections: Optional[int] = None) -> None:
+                """Set the request timeout (seconds), GET retry count and idle connections kept per host."""
+                if timeout is not None:
+                    _http_pool.timeout = timeout
+                if retries is not None:
+                    _http_pool.retries = retries
+                if max_connections is not None:
+                    _http_pool.max_idle_per_host = max_connections
+
+            @staticmethod
+            def close() -> None:
+                """Close all pooled keep-alive connections."""
+                _http_pool.close()
+
         # Object module
         class ObjectModule:
+            # Functions that build a new object return a PersistentMap when given
+            # one, updating it in place of copying where that shares structure.
             @staticmethod
             def merge(*objs: Dict) -> Dict:
+                if objs and isinstance(objs[0], PersistentMap):
+                    result = objs[0]
+                    for obj in objs[1:]:
+                        result = result.update(obj)
+                    return result
                 result = {}
                 for obj in objs:
                     result.update(obj)
@@ -720,16 +3767,22 @@ class MimoRuntime:
 
             @staticmethod
             def pick(obj: Dict, keys: List[str]) -> Dict:
-                return {k: obj[k] for k in keys if k in obj}
+                picked = {k: obj[k] for k in keys if k in obj}
+                return PersistentMap(picked) if isinstance(obj, PersistentMap) else picked
 
             @staticmethod
             def omit(obj: Dict, keys: List[str]) -> Dict:
+                if isinstance(obj, PersistentMap):
+                    for k in keys:
+                        obj = obj.dissoc(k)
+                    return obj
                 excluded = set(keys)
                 return {k: v for k, v in obj.items() if k not in excluded}
 
             @staticmethod
             def map_values(obj: Dict, callback: Callable) -> Dict:
-                return {k: callback(v, k, obj) for k, v in obj.items()}
+                mapped = {k: callback(v, k, obj) for k, v in obj.items()}
+                return PersistentMap(mapped) if isinstance(obj, PersistentMap) else mapped
 
             @staticmethod
             def from_entries(entries: List) -> Dict:
@@ -751,6 +3804,66 @@ class MimoRuntime:
             def entries(obj: Dict) -> List:
                 return [[k, v] for k, v in obj.items()]
 
+        # Persistent collections module
+        class PersistentModule:
+            @staticmethod
+            def vector(items=None) -> PersistentVector:
+                """Immutable array of items (an array or any iterable)."""
+                return _EMPTY_VECTOR if items is None else PersistentVector(items)
+
+            @staticmethod
+            def map(entries=None) -> PersistentMap:
+                """Immutable object from an object or an array of [key, value] pairs."""
+                return _EMPTY_MAP if entries is None else PersistentMap(entries)
+
+            @staticmethod
+            def assoc(collection, key, value):
+                """Copy of a persistent vector or map with key set to value, sharing the rest."""
+                if isinstance(collection, PersistentMap):
+                    return collection.assoc(key, value)
+                if isinstance(collection, PersistentVector):
+                    if not isinstance(key, int) or isinstance(key, bool):
+                        raise Exception(f"persistent.assoc: vector index must be a number, got {stringify(key)}")
+                    try:
+                        return collection.assoc(key, value)
+                    except IndexError:
+                        raise Exception(f"persistent.assoc: index {key} out of range for vector of length {len(collection)}")
+                raise Exception(f"persistent.assoc expects a persistent vector or map, got {type(collection).__name__}")
+
+            @staticmethod
+            def dissoc(pmap: PersistentMap, key) -> PersistentMap:
+                """Copy of a persistent map without key."""
+                if not isinstance(pmap, PersistentMap):
+                    raise Exception(f"persistent.dissoc expects a persistent map, got {type(pmap).__name__}")
+                return pmap.dissoc(key)
+
+            @staticmethod
+            def push(vector: PersistentVector, value) -> PersistentVector:
+                """Copy of a persistent vector with value appended."""
+                if not isinstance(vector, PersistentVector):
+                    raise Exception(f"persistent.push expects a persistent vector, got {type(vector).__name__}")
+                return vector.push(value)
+
+            @staticmethod
+            def pop(vector: PersistentVector) -> PersistentVector:
+                """Copy of a persistent vector without its last item (empty stays empty)."""
+                if not isinstance(vector, PersistentVector):
+                    raise Exception(f"persistent.pop expects a persistent vector, got {type(vector).__name__}")
+                return vector.pop() if len(vector) else vector
+
+            @staticmethod
+            def is_persistent(value) -> bool:
+                return isinstance(value, _PERSISTENT_TYPES)
+
+            @staticmethod
+            def to_native(value):
+                """Plain (mutable) arrays and objects, converting nested persistent values too."""
+                if isinstance(value, PersistentMap):
+                    return {k: PersistentModule.to_native(v) for k, v in value.items()}
+                if isinstance(value, PersistentVector):
+                    return [PersistentModule.to_native(v) for v in value]
+                return value
+
         # Assert module
         class AssertModule:
             @staticmethod
@@ -758,7 +3871,7 @@ class MimoRuntime:
                 if not is_equal(actual, expected):
                     msg = f": {message}" if message else ""
                     raise AssertionError(
-                        f"Assertion Failed{msg}.\n   Expected: {json.dumps(expected)}\n   Actual:   {json.dumps(actual)}"
+                        f"Assertion Failed{msg}.\n   Expected: {json.dumps(expected, default=_json_default)}\n   Actual:   {json.dumps(actual, default=_json_default)}"
                     )
                 return True
 
@@ -805,6 +3918,8 @@ class MimoRuntime:
         self.http = HTTPModule()
         self.object = ObjectModule()
         self.assert_ = AssertModule()
+        self.cache = CacheModule()
+        self.persistent = PersistentModule()
 
 
 # Create global mimo instance
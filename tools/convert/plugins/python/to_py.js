@@ -10,6 +10,12 @@ import { statementVisitors } from './visitors/statements.js';
 import { expressionVisitors } from './visitors/expressions.js';
 import { patternVisitors } from './visitors/patterns.js';
 
+/** Stdlib modules that only the Python runtime provides. */
+const PYTHON_STDLIB_MODULES = new Set([
+    "cache",
+    "persistent",
+]);
+
 export class MimoToPyConverter extends BaseConverter {
     constructor() {
         super();
@@ -36,7 +42,9 @@ export class MimoToPyConverter extends BaseConverter {
         this._collectModuleVars(ast);
 
         // Build header
-        this.output = `from mimo_runtime import mimo\n`;
+        // Operator helpers are imported directly: a global lookup per call instead
+        // of an attribute lookup and bound-method call on `mimo`.
+        this.output = `from mimo_runtime import mimo, add as __mimo_add, get as __mimo_get, eq as __mimo_eq\n`;
         for (const imp of this._pendingImports) {
             this.output += `${imp}\n`;
         }
@@ -58,9 +66,11 @@ export class MimoToPyConverter extends BaseConverter {
     _collectStdlibImports(node) {
         if (!node || typeof node !== 'object') return;
         if (node.type === 'ImportStatement' && !this.isStdlibModule(node.path)) {
-            const modName = node.path.endsWith('.mimo')
-                ? node.path.slice(0, -5)
-                : node.path;
+            // Transpiler writes every module into the output directory as
+            // `<basename>.py`, so "./lib/logic.mimo" is imported as `logic`.
+            const modName = node.path
+                .replace(/^.*\//, '')
+                .replace(/\.mimo$/, '');
             const imp = `import ${modName} as ${node.alias}`;
             if (!this._pendingImports.includes(imp)) {
                 this._pendingImports.push(imp);
@@ -126,6 +136,10 @@ export class MimoToPyConverter extends BaseConverter {
     // Overrides
     // -------------------------------------------------------------------------
 
+    isStdlibModule(modulePath) {
+        return super.isStdlibModule(modulePath) || PYTHON_STDLIB_MODULES.has(modulePath);
+    }
+
     onUndefinedVisitor(node) {
         console.warn(`[Python Converter] No visitor for AST node type: ${node.type}`);
     }
@@ -264,8 +278,15 @@ export class MimoToPyConverter extends BaseConverter {
         // Mimo hoists all FunctionDeclarations before executing other statements.
         // To match this, emit all function definitions first (without decorators),
         // then apply all decorators, then run the rest of the statements.
+        // Top-level stdlib imports are bound first so that decorators such as a
+        // wrapper around cache.memoize can use them when applied in pass 2.
+        const isStdlibImport = s => s.type === 'ImportStatement' && this.isStdlibModule(s.path);
         const functions = node.body.filter(s => s.type === 'FunctionDeclaration');
-        const others = node.body.filter(s => s.type !== 'FunctionDeclaration');
+        const others = node.body.filter(s => s.type !== 'FunctionDeclaration' && !isStdlibImport(s));
+
+        const stdlibImports = node.body.filter(isStdlibImport);
+        stdlibImports.forEach((stmt) => this.visitNode(stmt));
+        if (stdlibImports.length > 0) this.writeLine();
 
         // Pass 1: emit all function defs (decorator wrappers collected into _deferredDecorators)
         this._emittingHoistedFunctions = true;
@@ -14,9 +14,9 @@ export const expressionVisitors = {
         };
 
         // Mimo's + operator concatenates if either operand is a string.
-        // Python's + doesn't, so route through mimo.add() for type safety.
+        // Python's + doesn't, so route through the runtime's add() for type safety.
         if (node.operator === '+') {
-            this.write('mimo.add(');
+            this.write('__mimo_add(');
             this.visitNode(node.left);
             this.write(', ');
             this.visitNode(node.right);
@@ -130,22 +130,34 @@ export const expressionVisitors = {
     },
 
     visitTemplateLiteral(node) {
-        this.write('f"');
+        let fstring = '';
+        let template = '';   // same text with `{}` placeholders, for str.format
+        const exprs = [];
         node.parts.forEach((part) => {
             if (part.type === 'Literal') {
                 const escaped = String(part.value)
                     .replace(/\\/g, '\\\\')
                     .replace(/"/g, '\\"')
+                    .replace(/\n/g, '\\n')
                     .replace(/{/g, '{{')
                     .replace(/}/g, '}}');
-                this.write(escaped);
+                fstring += escaped;
+                template += escaped;
             } else {
-                this.write('{');
-                this.visitNode(part);
-                this.write('}');
+                const expr = this._exprToString(part);
+                exprs.push(expr);
+                fstring += `{${expr}}`;
+                template += '{}';
             }
         });
-        this.write('"');
+        // Before Python 3.12 an f-string expression may not contain the
+        // enclosing quote or a backslash (e.g. `__mimo_get(t, "id")`);
+        // str.format formats each value the same way.
+        if (exprs.some((e) => e.includes('"') || e.includes('\\'))) {
+            this.write(`"${template}".format(${exprs.join(', ')})`);
+        } else {
+            this.write(`f"${fstring}"`);
+        }
     },
 
     visitRangeLiteral(node) {
@@ -237,15 +249,15 @@ export const expressionVisitors = {
     },
 
     visitPropertyAccess(node) {
-        // Mimo objects are Python dicts, so use mimo.get() for property access.
-        this.write('mimo.get(');
+        // Mimo objects are Python dicts, so use the runtime's get() for property access.
+        this.write('__mimo_get(');
         this.visitNode(node.object);
         this.write(`, "${node.property}")`);
     },
 
     visitSafePropertyAccess(node) {
-        // obj?.prop  →  (mimo.get(obj, "prop") if obj is not None else None)
-        this.write('(mimo.get(');
+        // obj?.prop  →  (__mimo_get(obj, "prop") if obj is not None else None)
+        this.write('(__mimo_get(');
         this.visitNode(node.object);
         this.write(`, "${node.property}") if `);
         this.visitNode(node.object);
@@ -260,8 +272,8 @@ export const expressionVisitors = {
     },
 
     visitSafeArrayAccess(node) {
-        // arr?.[i]  →  (mimo.get(arr, i) if arr is not None else None)
-        this.write('(mimo.get(');
+        // arr?.[i]  →  (__mimo_get(arr, i) if arr is not None else None)
+        this.write('(__mimo_get(');
         this.visitNode(node.object);
         this.write(', ');
         this.visitNode(node.index);
@@ -56,7 +56,7 @@ export const patternVisitors = {
         if (!pattern) { this.write('True'); return; }
         switch (pattern.type) {
             case 'Literal':
-                this.write(`mimo.eq(${matchVar}, `);
+                this.write(`__mimo_eq(${matchVar}, `);
                 this.visitNode(pattern);
                 this.write(')');
                 break;
@@ -64,14 +64,14 @@ export const patternVisitors = {
                 this.write('True');
                 break;
             case 'ArrayPattern':
-                this.write(`isinstance(${matchVar}, list) and len(${matchVar}) == ${pattern.elements.length}`);
+                this.write(`mimo.is_array(${matchVar}) and len(${matchVar}) == ${pattern.elements.length}`);
                 pattern.elements.forEach((el, i) => {
                     this.write(' and ');
                     this._emitMatchCondition(el, `${matchVar}[${i}]`);
                 });
                 break;
             case 'ObjectPattern':
-                this.write(`isinstance(${matchVar}, dict)`);
+                this.write(`mimo.is_object(${matchVar})`);
                 break;
             default:
                 this.write('True');
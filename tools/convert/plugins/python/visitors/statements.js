@@ -203,7 +203,7 @@ export const statementVisitors = {
             this._emitObjectDestructuring(node.pattern, exprStr);
         } else if (node.pattern.type === 'ArrayPattern') {
             // Array pattern: emit individual index assignments to handle extra elements
-            // e.g. [x, y] = arr  →  __tmp = arr; x = mimo.get(__tmp, 0); y = mimo.get(__tmp, 1)
+            // e.g. [x, y] = arr  →  __tmp = arr; x = __mimo_get(__tmp, 0); y = __mimo_get(__tmp, 1)
             const elements = node.pattern.elements || [];
             if (elements.length === 0) return;
             const tmpVar = `__tmp_${this._matchCounter++}`;
@@ -212,7 +212,7 @@ export const statementVisitors = {
             this.write('\n');
             elements.forEach((el, i) => {
                 if (el && el.name) {
-                    this.writeLine(`${el.name} = mimo.get(${tmpVar}, ${i})`);
+                    this.writeLine(`${el.name} = __mimo_get(${tmpVar}, ${i})`);
                 }
             });
         } else {